@@ -1,6 +1,8 @@
 
 import os
 
+from site_profiles import load_profiles
+
 TEMPLATE_FILE = "post_template.html"
 POSTS_DIR = "posts"
 
@@ -106,6 +108,8 @@ for art in articles:
     html = html.replace("{{FAQ}}", "")
     html = html.replace("{{PREV}}", "")
     html = html.replace("{{NEXT}}", "")
+    for key, val in load_profiles()["yui"].site_values().items():
+        html = html.replace("{{" + key + "}}", val)
     
     file_path = os.path.join(POSTS_DIR, art["slug"])
     with open(file_path, "w") as f:
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+ビルド済みの出力（dist/）を走査して、ページごとの重さを集計するスクリプト。
+
+HTMLサイズ・インラインJS/CSSのサイズ・外部リクエスト数・レンダリングブロック要素・
+サイズ指定のない画像をテンプレート種別ごとに集計し、チェックイン済みの予算
+（page-budget.json）を超えていたら終了コード1で失敗する。
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlparse
+
+from build_critical_css import get_template_type
+
+DIST_DIR = "dist"
+BUDGET_FILE = "page-budget.json"
+REPORT_FILE = ".build/page-weight.json"
+FIRST_PARTY_HOSTS = {"yui-love.vercel.app"}
+# 予算を更新するときに上乗せする余裕（バイト数の指標のみ）
+BYTES_HEADROOM = 1.05
+
+METRICS = [
+    "html_bytes",
+    "inline_script_bytes",
+    "inline_css_bytes",
+    "third_party_requests",
+    "render_blocking",
+    "images_without_dimensions",
+]
+
+
+class WeightParser(HTMLParser):
+    """1ページ分の重さの指標を数える"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.in_head = False
+        self.noscript = 0
+        self.inline = None
+        self.stats = {m: 0 for m in METRICS if m != "html_bytes"}
+        self.third_party_hosts = set()
+
+    def _request(self, url):
+        host = urlparse(url).netloc
+        if host and host not in FIRST_PARTY_HOSTS:
+            self.stats["third_party_requests"] += 1
+            self.third_party_hosts.add(host)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if attrs.get("style"):
+            self.stats["inline_css_bytes"] += len(attrs["style"].encode("utf-8"))
+        if tag == "head":
+            self.in_head = True
+        elif tag == "body":
+            self.in_head = False
+        elif tag == "noscript":
+            self.noscript += 1
+        if self.noscript:
+            return
+
+        if tag == "script":
+            if attrs.get("src"):
+                self._request(attrs["src"])
+                if self.in_head and "async" not in attrs and "defer" not in attrs \
+                        and attrs.get("type") != "module":
+                    self.stats["render_blocking"] += 1
+            else:
+                self.inline = "inline_script_bytes"
+        elif tag == "style":
+            self.inline = "inline_css_bytes"
+        elif tag == "link":
+            rel = (attrs.get("rel") or "").lower().split()
+            if attrs.get("href") and {"stylesheet", "preload", "icon", "modulepreload"} & set(rel):
+                self._request(attrs["href"])
+            if "stylesheet" in rel and self.in_head and attrs.get("media", "all") in ("all", "screen", ""):
+                self.stats["render_blocking"] += 1
+        elif tag in ("img", "iframe"):
+            if attrs.get("src"):
+                self._request(attrs["src"])
+            if tag == "img" and not (attrs.get("width") and attrs.get("height")):
+                self.stats["images_without_dimensions"] += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.in_head = False
+        elif tag == "noscript" and self.noscript:
+            self.noscript -= 1
+        elif tag in ("script", "style"):
+            self.inline = None
+
+    def handle_data(self, data):
+        if self.inline and not self.noscript:
+            self.stats[self.inline] += len(data.encode("utf-8"))
+
+
+def audit_page(args):
+    root, rel = args
+    data = (Path(root) / rel).read_bytes()
+    parser = WeightParser()
+    parser.feed(data.decode("utf-8", errors="replace"))
+    parser.close()
+    stats = {"html_bytes": len(data), **parser.stats}
+    return rel, get_template_type(rel) or "other", stats, sorted(parser.third_party_hosts)
+
+
+def aggregate(results):
+    """テンプレート種別ごとに最大値・平均値・最大ページを集計する"""
+    summary = {}
+    for rel, template_type, stats, _ in results:
+        entry = summary.setdefault(template_type, {"pages": 0, "max": {}, "mean": {}, "worst": {}})
+        entry["pages"] += 1
+        for metric in METRICS:
+            value = stats[metric]
+            entry["mean"][metric] = entry["mean"].get(metric, 0) + value
+            if value > entry["max"].get(metric, -1):
+                entry["max"][metric] = value
+                entry["worst"][metric] = rel
+    for entry in summary.values():
+        for metric in METRICS:
+            entry["mean"][metric] = round(entry["mean"][metric] / entry["pages"], 1)
+    return summary
+
+
+def check_budget(summary, budget):
+    """予算を超えた指標を (テンプレート, 指標, 実測, 予算, 最大ページ) のリストで返す"""
+    failures = []
+    for template_type, limits in budget.items():
+        entry = summary.get(template_type)
+        if not entry:
+            continue
+        for metric, limit in limits.items():
+            actual = entry["max"].get(metric, 0)
+            if actual > limit:
+                failures.append((template_type, metric, actual, limit, entry["worst"][metric]))
+    return failures
+
+
+def make_budget(summary):
+    budget = {}
+    for template_type, entry in sorted(summary.items()):
+        limits = {}
+        for metric in METRICS:
+            value = entry["max"][metric]
+            limits[metric] = int(value * BYTES_HEADROOM) if metric.endswith("_bytes") else value
+        budget[template_type] = limits
+    return budget
+
+
+def audit_page_weight(root=DIST_DIR, budget_file=BUDGET_FILE, update_budget=False, workers=None):
+    root = Path(root).resolve()
+    if not root.exists():
+        print(f"Error: {root} が見つかりません。先に build_dist.py を実行してください。")
+        return 1
+
+    pages = [(str(root), p.relative_to(root).as_posix()) for p in sorted(root.rglob("*.html"))]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(audit_page, pages, chunksize=max(1, len(pages) // ((os.cpu_count() or 1) * 4))))
+
+    summary = aggregate(results)
+    hosts = sorted({h for *_, page_hosts in results for h in page_hosts})
+
+    print(f"{len(results)}ページを監査しました")
+    for template_type, entry in sorted(summary.items()):
+        print(f"[{template_type}] {entry['pages']}ページ")
+        for metric in METRICS:
+            print(f"  {metric:<26} 最大 {entry['max'][metric]:>8}  平均 {entry['mean'][metric]:>10}")
+    print(f"外部ホスト: {', '.join(hosts) or 'なし'}")
+
+    report_path = Path(REPORT_FILE)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump({"summary": summary, "third_party_hosts": hosts,
+                   "pages": {rel: stats for rel, _, stats, _ in results}}, f, indent=1, ensure_ascii=False)
+
+    if update_budget:
+        with open(budget_file, "w", encoding="utf-8") as f:
+            json.dump(make_budget(summary), f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"予算を更新しました: {budget_file}")
+        return 0
+
+    if not os.path.exists(budget_file):
+        print(f"Warning: {budget_file} がありません（--update-budget で作成できます）")
+        return 0
+    with open(budget_file, "r", encoding="utf-8") as f:
+        budget = json.load(f)
+    failures = check_budget(summary, budget)
+    if failures:
+        print("予算超過:")
+        for template_type, metric, actual, limit, worst in failures:
+            print(f"  {template_type}.{metric}: {actual} > {limit}（{worst}）")
+        return 1
+    print("予算内に収まっています")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ページごとの重さの監査と予算チェック")
+    parser.add_argument("root", nargs="?", default=DIST_DIR, help="ビルド済みの出力ディレクトリ")
+    parser.add_argument("--budget", default=BUDGET_FILE, help="予算ファイル")
+    parser.add_argument("--update-budget", action="store_true", help="現在の値で予算ファイルを書き直す")
+    parser.add_argument("--workers", type=int, help="並列プロセス数")
+    args = parser.parse_args()
+    sys.exit(audit_page_weight(args.root, args.budget, args.update_budget, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+テンプレート種別（post / index / archive / profile）ごとにファーストビューで
+使われるCSSだけを抽出してインライン化し、残りのスタイルシートは非同期で読み込むビルドステージ。
+
+抽出はテンプレートごとに代表ページ1枚のDOMに対して1回だけ行い、
+各ページへの適用は文字列置換のみなので記事数が増えてもほぼ定数コストで済む。
+"""
+import argparse
+import os
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+
+# ファーストビューとみなす要素数（body以下の文書順）
+FOLD_ELEMENTS = 150
+# 文書順に関係なく常にファーストビューとして扱うレイアウト要素
+LAYOUT_TAGS = {"html", "body", "header", "main", "aside", "nav"}
+# 初回描画に不要な状態系の擬似クラス
+INTERACTIVE_PSEUDO = {"hover", "active", "focus", "focus-within", "focus-visible", "visited"}
+
+CRITICAL_MARKER = "data-critical"
+STYLESHEET_LINK_RE = re.compile(r'([ \t]*)<link rel="stylesheet" href="([^"]+)">\n?')
+CRITICAL_BLOCK_RE = re.compile(r'<style data-critical="[^"]*">.*?</style>', re.S)
+PRELOAD_LINK_RE = re.compile(r'<link rel="preload" href="([^"]+)" as="style"')
+
+
+def get_template_type(rel_path):
+    """ルートからの相対パスでテンプレート種別を判定（対象外はNone）"""
+    rel_path = rel_path.replace(os.sep, "/")
+    if rel_path in ("index.html", "archive.html", "profile.html"):
+        return rel_path[:-len(".html")]
+    if rel_path.startswith("posts/") and rel_path.endswith(".html"):
+        return "post"
+    return None
+
+
+# --- CSS ---
+
+def parse_css(css_text):
+    """CSSをルールのリストに分解する: (selector, body, media)。media外はNone"""
+    css_text = re.sub(r"/\*.*?\*/", "", css_text, flags=re.S)
+    rules = []
+    pos = 0
+    media = None
+    depth = 0
+    while pos < len(css_text):
+        brace = css_text.find("{", pos)
+        close = css_text.find("}", pos)
+        if close != -1 and (brace == -1 or close < brace):
+            # @media ブロックの終わり
+            if depth > 0:
+                depth -= 1
+                media = None
+            pos = close + 1
+            continue
+        if brace == -1:
+            break
+        prelude = css_text[pos:brace].strip()
+        if prelude.startswith("@media"):
+            media = prelude
+            depth += 1
+            pos = brace + 1
+            continue
+        end = css_text.find("}", brace)
+        if end == -1:
+            break
+        if prelude.startswith("@"):
+            # @keyframes 等はネストを含むのでブロックごと非クリティカル扱い
+            level = 0
+            i = brace
+            while i < len(css_text):
+                if css_text[i] == "{":
+                    level += 1
+                elif css_text[i] == "}":
+                    level -= 1
+                    if level == 0:
+                        break
+                i += 1
+            pos = i + 1
+            continue
+        rules.append((prelude, css_text[brace + 1:end].strip(), media))
+        pos = end + 1
+    return rules
+
+
+def format_rules(rules):
+    """ルールのリストを圧縮したCSS文字列に戻す（@mediaの並びは維持）"""
+    out = []
+    current_media = None
+    for selector, body, media in rules:
+        if media != current_media:
+            if current_media is not None:
+                out.append("}")
+            if media is not None:
+                out.append(media + "{")
+            current_media = media
+        selector = re.sub(r"\s+", " ", selector)
+        body = re.sub(r"\s*\n\s*", "", body)
+        out.append(f"{selector}{{{body}}}")
+    if current_media is not None:
+        out.append("}")
+    return "".join(out)
+
+
+# --- DOM ---
+
+class Element:
+    __slots__ = ("tag", "id", "classes", "attrs", "parent", "index")
+
+    def __init__(self, tag, attrs, parent, index):
+        self.tag = tag
+        self.attrs = dict(attrs)
+        self.id = self.attrs.get("id")
+        self.classes = set((self.attrs.get("class") or "").split())
+        self.parent = parent
+        self.index = index
+
+
+class DomBuilder(HTMLParser):
+    """セレクタ照合に必要な最低限のDOM（親子関係と属性）を組み立てる"""
+    VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input",
+                 "link", "meta", "param", "source", "track", "wbr"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.elements = []
+        self.stack = []
+
+    def handle_starttag(self, tag, attrs):
+        parent = self.stack[-1] if self.stack else None
+        el = Element(tag, attrs, parent, len(self.elements))
+        self.elements.append(el)
+        if tag not in self.VOID_TAGS:
+            self.stack.append(el)
+
+    def handle_startendtag(self, tag, attrs):
+        parent = self.stack[-1] if self.stack else None
+        self.elements.append(Element(tag, attrs, parent, len(self.elements)))
+
+    def handle_endtag(self, tag):
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                break
+
+
+def get_fold_elements(html):
+    """ファーストビューに入る要素の集合を返す"""
+    builder = DomBuilder()
+    builder.feed(html)
+    body_start = next((el.index for el in builder.elements if el.tag == "body"), 0)
+    fold = []
+    for el in builder.elements:
+        if el.tag in LAYOUT_TAGS or body_start <= el.index < body_start + FOLD_ELEMENTS:
+            fold.append(el)
+    # 描画中の要素の祖先も当然描画される
+    seen = {id(el) for el in fold}
+    for el in list(fold):
+        parent = el.parent
+        while parent is not None and id(parent) not in seen:
+            seen.add(id(parent))
+            fold.append(parent)
+            parent = parent.parent
+    return fold
+
+
+# --- セレクタ照合 ---
+
+COMPOUND_RE = re.compile(r"([#.]?[\w-]+|\*|\[[^\]]*\]|::?[\w-]+(?:\([^)]*\))?)")
+
+
+def parse_compound(text):
+    """'a.cls#id:hover' を部品に分解。解釈できなければNone"""
+    parts = COMPOUND_RE.findall(text)
+    if "".join(parts) != text:
+        return None
+    return parts
+
+
+def compound_matches(parts, el):
+    for part in parts:
+        if part == "*":
+            continue
+        if part.startswith("::"):
+            # 擬似要素は元の要素が描画されていれば必要
+            continue
+        if part.startswith(":"):
+            name = part[1:].split("(")[0]
+            if name in INTERACTIVE_PSEUDO:
+                return False
+            if name == "root":
+                if el.tag != "html":
+                    return False
+            continue
+        if part.startswith("."):
+            if part[1:] not in el.classes:
+                return False
+        elif part.startswith("#"):
+            if el.id != part[1:]:
+                return False
+        elif part.startswith("["):
+            name = re.split(r"[~|^$*]?=", part[1:-1])[0].strip()
+            if name not in el.attrs:
+                return False
+        elif el.tag != part.lower():
+            return False
+    return True
+
+
+def selector_matches(selector, el):
+    """単一セレクタ（カンマなし）が要素にマッチするか"""
+    tokens = re.split(r"\s*([>+~])\s*|\s+", selector.strip())
+    tokens = [t for t in tokens if t]
+    compounds = []
+    combinators = []
+    for token in tokens:
+        if token in (">", "+", "~"):
+            combinators.append(token)
+        else:
+            if len(compounds) > len(combinators):
+                combinators.append(" ")
+            parts = parse_compound(token)
+            if parts is None:
+                # 解釈できないセレクタは安全側に倒してクリティカル扱い
+                return True
+            compounds.append(parts)
+    if not compounds or not compound_matches(compounds[-1], el):
+        return False
+
+    # 右から左へ祖先をたどる（兄弟結合子は右端の一致で近似）
+    node = el
+    for parts, comb in zip(reversed(compounds[:-1]), reversed(combinators)):
+        if comb in ("+", "~"):
+            continue
+        node = node.parent
+        if comb == ">":
+            if node is None or not compound_matches(parts, node):
+                return False
+        else:
+            while node is not None and not compound_matches(parts, node):
+                node = node.parent
+            if node is None:
+                return False
+    return True
+
+
+def extract_critical_css(html, css_texts):
+    """代表ページのHTMLとCSS群から、ファーストビューで使われるルールだけを返す"""
+    fold = get_fold_elements(html)
+    critical = []
+    for css_text in css_texts:
+        for selector, body, media in parse_css(css_text):
+            selectors = [s.strip() for s in selector.split(",") if s.strip()]
+            if any(selector_matches(s, el) for s in selectors for el in fold):
+                critical.append((selector, body, media))
+    return format_rules(critical)
+
+
+# --- ページへの適用 ---
+
+def get_stylesheets(html):
+    """ページが参照しているスタイルシート（処理済みならpreload）を重複なしで返す"""
+    hrefs = [href for _, href in STYLESHEET_LINK_RE.findall(html)]
+    if not hrefs:
+        hrefs = PRELOAD_LINK_RE.findall(html)
+    return list(dict.fromkeys(hrefs))
+
+
+def async_stylesheet_tags(href, indent):
+    return (
+        f'{indent}<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+        f'{indent}<noscript><link rel="stylesheet" href="{href}"></noscript>\n'
+    )
+
+
+def apply_critical_css(html, template_type, critical_css):
+    """クリティカルCSSをインライン化し、スタイルシートを非同期読み込みに置き換える"""
+    style_block = f'<style {CRITICAL_MARKER}="{template_type}">{critical_css}</style>'
+
+    # 既に処理済みのページはインラインCSSだけ差し替える
+    if CRITICAL_BLOCK_RE.search(html):
+        return CRITICAL_BLOCK_RE.sub(lambda m: style_block, html, count=1)
+
+    hrefs = get_stylesheets(html)
+    if not hrefs:
+        return html
+    inserted = False
+
+    def replace_link(match):
+        nonlocal inserted
+        if inserted:
+            return ""
+        inserted = True
+        indent = match.group(1)
+        return indent + style_block + "\n" + "".join(async_stylesheet_tags(h, indent) for h in hrefs)
+
+    return STYLESHEET_LINK_RE.sub(replace_link, html)
+
+
+def resolve_asset(root, page_path, href):
+    """ページからの相対hrefをルート配下のファイルパスに変換"""
+    href = href.split("?")[0].split("#")[0]
+    if href.startswith("/"):
+        return root / href.lstrip("/")
+    return (page_path.parent / href).resolve()
+
+
+def collect_pages(root):
+    """テンプレート種別と参照スタイルシートの組ごとにページをまとめる"""
+    groups = {}
+    for path in sorted(root.glob("*.html")) + sorted(root.glob("posts/**/*.html")):
+        template_type = get_template_type(str(path.relative_to(root)))
+        if not template_type:
+            continue
+        hrefs = tuple(get_stylesheets(path.read_text(encoding="utf-8")))
+        if hrefs:
+            groups.setdefault((template_type, hrefs), []).append(path)
+    return groups
+
+
+def pick_sample(template_type, paths):
+    """代表ページ：記事は最新（ファイル名末尾の日付が最大）のものを使う"""
+    if template_type == "post":
+        return max(paths, key=lambda p: (p.stem[-8:].isdigit(), p.stem[-8:], p.name))
+    return paths[0]
+
+
+def build_critical_css(root="."):
+    root = Path(root).resolve()
+    groups = collect_pages(root)
+    total = 0
+
+    for (template_type, hrefs), paths in groups.items():
+        sample = pick_sample(template_type, paths)
+        css_texts = []
+        for href in hrefs:
+            css_path = resolve_asset(root, sample, href)
+            if css_path.exists():
+                css_texts.append(css_path.read_text(encoding="utf-8"))
+        if not css_texts:
+            print(f"スキップ: {template_type}（スタイルシートが見つかりません: {', '.join(hrefs)}）")
+            continue
+
+        critical_css = extract_critical_css(sample.read_text(encoding="utf-8"), css_texts)
+        full_size = sum(len(c.encode("utf-8")) for c in css_texts)
+        print(f"{template_type} [{', '.join(hrefs)}]: クリティカルCSS "
+              f"{len(critical_css.encode('utf-8'))} / {full_size} bytes "
+              f"（代表ページ: {sample.name}, 対象 {len(paths)}ファイル）")
+
+        for path in paths:
+            html = path.read_text(encoding="utf-8")
+            new_html = apply_critical_css(html, template_type, critical_css)
+            if new_html != html:
+                path.write_text(new_html, encoding="utf-8")
+                total += 1
+
+    print(f"更新: {total}ファイル")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="クリティカルCSSのインライン化")
+    parser.add_argument("root", help="ビルド対象のディレクトリ（中のファイルをその場で書き換えるので、ソースツリーではなく dist/ などのコピーを指定する）")
+    args = parser.parse_args()
+    build_critical_css(args.root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+公開に必要なファイルだけを dist/ に組み立てるビルドスクリプト。
+
+ステージング領域で全ビルドステージを実行したあと、内容ハッシュのマニフェストと比較して
+変更のあったファイルだけを dist/ に書き込み、デプロイごとの差分レポートを出力する。
+
+GitHub Pages の成果物は差分を受け付けず毎回サイト全体が必要なので、Pages へのアップロード量は
+サイトの規模に比例したままになる。日々の変更量だけを送りたい配信先には --delta で
+変更ファイルだけのディレクトリを作り、差分レポート（削除リストを含む）と一緒に渡す。
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+
+from build_critical_css import build_critical_css
+from build_fingerprint import VERCEL_FILE, build_fingerprint
+from build_index_island import build_index_island
+from build_prefetch_hints import FORMATS as PREFETCH_FORMATS, PREFETCH_BUDGET_BYTES, build_prefetch_hints
+from build_service_worker import build_service_worker
+from build_shard_posts import build_shard_posts, missing_redirects, plan_moves
+from post_log import LOG_FILE, compact_if_needed
+
+DIST_DIR = "dist"
+BUILD_DIR = ".build"
+STAGE_DIR = os.path.join(BUILD_DIR, "stage")
+MANIFEST_FILE = os.path.join(BUILD_DIR, "manifest.json")
+DIFF_REPORT_FILE = os.path.join(BUILD_DIR, "deploy-diff.json")
+
+# 公開対象（これ以外のスクリプト・テンプレート・作業ファイルはdistに入れない）
+PUBLISH_FILES = [
+    "index.html",
+    "archive.html",
+    "profile.html",
+    "google403c7037defb5219.html",
+    "style.css",
+    "yui.png",
+    "yuichibi.png",
+    "sitemap.xml",
+    "vercel.json",
+    "data/questions.js",
+]
+PUBLISH_GLOBS = [
+    "posts/*.html",
+    "posts/*.css",
+    "posts/*.js",
+    "public/*",
+]
+
+# ステージング領域に対して順番に実行するビルドステージ
+STAGES = [
+    ("index-island", build_index_island),
+    ("critical-css", build_critical_css),
+    ("prefetch-hints", build_prefetch_hints),
+    ("fingerprint", build_fingerprint),
+    ("service-worker", build_service_worker),
+]
+# 今日の日付で出力が変わるステージ（now を渡すと日付を固定できる）
+DATED_STAGES = {"index-island", "prefetch-hints"}
+
+
+def collect_sources(src_root):
+    """公開対象のファイルを相対パスのリストで返す"""
+    sources = []
+    for rel in PUBLISH_FILES:
+        if (src_root / rel).is_file():
+            sources.append(rel)
+    for pattern in PUBLISH_GLOBS:
+        for path in sorted(src_root.glob(pattern)):
+            if path.is_file() and not path.name.startswith("."):
+                sources.append(path.relative_to(src_root).as_posix())
+    return sorted(set(sources))
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def build_manifest(root):
+    """ディレクトリ配下の全ファイルの内容ハッシュとサイズを返す"""
+    files = {}
+    for path in sorted(root.rglob("*")):
+        if path.is_file():
+            rel = path.relative_to(root).as_posix()
+            files[rel] = {"sha256": file_digest(path), "size": path.stat().st_size}
+    return files
+
+
+def load_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("files", {})
+
+
+def diff_manifests(old, new):
+    added = sorted(set(new) - set(old))
+    removed = sorted(set(old) - set(new))
+    changed = sorted(rel for rel in set(old) & set(new) if old[rel]["sha256"] != new[rel]["sha256"])
+    return added, changed, removed
+
+
+def stage_site(src_root, stage_root, shard_posts=False, now=None, stage_options=None):
+    """公開対象をステージング領域にコピーし、ビルドステージを実行する
+
+    now で日付を固定し、stage_options（{ステージ名: キーワード引数}）で各ステージの設定を渡す。
+    """
+    if stage_root.exists():
+        shutil.rmtree(stage_root)
+    for rel in collect_sources(src_root):
+        dest = stage_root / rel
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src_root / rel, dest)
+    # 記事の振り分けは他のステージが最終的なパスを見られるよう最初に行う
+    stages = ([("shard-posts", build_shard_posts)] if shard_posts else []) + STAGES
+    for name, stage in stages:
+        options = dict((stage_options or {}).get(name, {}))
+        if now is not None and name in DATED_STAGES:
+            options["now"] = now
+        if options:
+            stage = partial(stage, **options)
+        print(f"--- ステージ: {name}")
+        stage(stage_root)
+
+
+def sync_dist(stage_root, dist_root, old, new, delta_root=None):
+    """差分のあるファイルだけをdistへ書き込み、不要になったファイルを削除する"""
+    added, changed, removed = diff_manifests(old, new)
+    # マニフェスト上は同じでもdist側から消えているファイルは書き直す
+    changed += [rel for rel in new if rel in old and rel not in changed and not (dist_root / rel).exists()]
+    for rel in added + changed:
+        dest = dist_root / rel
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(stage_root / rel, dest)
+        if delta_root is not None:
+            delta_dest = delta_root / rel
+            delta_dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(stage_root / rel, delta_dest)
+    # マニフェストに無いファイル（手動で置かれた等）も掃除する
+    for path in sorted(dist_root.rglob("*"), reverse=True):
+        rel = path.relative_to(dist_root).as_posix()
+        if path.is_file() and rel not in new:
+            path.unlink()
+        elif path.is_dir() and not any(path.iterdir()):
+            path.rmdir()
+    return added, changed, removed
+
+
+def build_dist(src_root=".", dist_dir=DIST_DIR, delta_dir=None, full=False, shard_posts=False, stage_options=None):
+    src_root = Path(src_root).resolve()
+    dist_root = src_root / dist_dir
+    stage_root = src_root / STAGE_DIR
+    manifest_path = src_root / MANIFEST_FILE
+
+    # 記事ログに未反映の追記があれば先にスナップショットを作り直す
+    compact_if_needed(threshold=1, log_file=str(src_root / LOG_FILE))
+    if shard_posts:
+        # Vercel はルート直下の vercel.json しか読まないので、旧URLのリダイレクトがそこに無いと404になる
+        missing = missing_redirects(src_root / VERCEL_FILE, plan_moves(src_root))
+        if missing:
+            print(f"Error: {VERCEL_FILE} に記事の振り分け用のリダイレクトが {len(missing)}ルール足りません"
+                  f"（例: {missing[0]['source']}）")
+            print("python build_shard_posts.py . --redirects-only で書き込んでからビルドしてください")
+            sys.exit(1)
+    stage_site(src_root, stage_root, shard_posts, stage_options=stage_options)
+    new = build_manifest(stage_root)
+
+    # dist自体が無い・強制指定の場合は全ファイルを書き出す
+    old = {} if full or not dist_root.exists() else load_manifest(manifest_path)
+    dist_root.mkdir(parents=True, exist_ok=True)
+    delta_root = None
+    if delta_dir:
+        delta_root = Path(delta_dir).resolve()
+        if delta_root.exists():
+            shutil.rmtree(delta_root)
+        delta_root.mkdir(parents=True)
+    added, changed, removed = sync_dist(stage_root, dist_root, old, new, delta_root)
+    shutil.rmtree(stage_root)
+
+    generated_at = datetime.now().isoformat(timespec="seconds")
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"generated_at": generated_at, "files": new}, f, indent=1, ensure_ascii=False)
+
+    report = {
+        "generated_at": generated_at,
+        "total_files": len(new),
+        "total_bytes": sum(entry["size"] for entry in new.values()),
+        "changed_bytes": sum(new[rel]["size"] for rel in added + changed),
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+    }
+    with open(src_root / DIFF_REPORT_FILE, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1, ensure_ascii=False)
+
+    print(f"dist: {report['total_files']}ファイル / {report['total_bytes']:,} bytes")
+    print(f"差分: 追加 {len(added)} / 変更 {len(changed)} / 削除 {len(removed)}"
+          f"（書き込み {report['changed_bytes']:,} bytes）")
+    for label, paths in (("+", added), ("~", changed), ("-", removed)):
+        for rel in paths[:20]:
+            print(f"  {label} {rel}")
+        if len(paths) > 20:
+            print(f"  {label} ...ほか{len(paths) - 20}件")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="公開用 dist/ の組み立て")
+    parser.add_argument("--dist", default=DIST_DIR, help="出力先ディレクトリ")
+    parser.add_argument("--delta", help="変更ファイルだけを書き出す差分ディレクトリ")
+    parser.add_argument("--full", action="store_true", help="マニフェストを無視して全ファイルを書き出す")
+    parser.add_argument("--shard-posts", action="store_true",
+                        help="記事を年月ディレクトリ（posts/YYYY/MM/）に振り分けて出力する")
+    parser.add_argument("--prefetch-budget", type=int, default=PREFETCH_BUDGET_BYTES,
+                        help="記事1ページあたりに先読みするHTMLの合計バイト数")
+    parser.add_argument("--prefetch-format", choices=PREFETCH_FORMATS, default="link", help="先読みヒントの書き方")
+    args = parser.parse_args()
+    stage_options = {"prefetch-hints": {"budget": args.prefetch_budget, "fmt": args.prefetch_format}}
+    build_dist(".", args.dist, args.delta, args.full, args.shard_posts, stage_options)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+静的アセット（CSS / JS / 画像）のファイル名に内容ハッシュを付け、
+全HTMLの参照を1パスで書き換えるビルドステージ。
+
+ハッシュ付きのファイルは内容が変わると名前も変わるので、vercel.json で
+Cache-Control: immutable を付与してリピーターの再検証リクエストをなくす。
+"""
+import argparse
+import hashlib
+import json
+import re
+import shutil
+from pathlib import Path
+from urllib.parse import unquote
+
+# ハッシュを付けるアセット
+ASSET_GLOBS = [
+    "style.css",
+    "posts/*.css",
+    "posts/*.js",
+    "data/*.js",
+    "*.png",
+    "public/*.jpg",
+    "public/*.ico",
+]
+HASH_LENGTH = 10
+
+VERCEL_FILE = "vercel.json"
+# ハッシュ付きファイル名（name.0123456789.ext）にマッチするパターン
+FINGERPRINT_SOURCE = r"/(.*\.[0-9a-f]{%d}\.(?:css|js|png|jpg|ico))" % HASH_LENGTH
+HTML_CACHE_CONTROL = "public, max-age=300, must-revalidate"
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+ASSET_REF_RE = re.compile(r'\b(href|src|data-src)="([^"#?]+)"')
+
+
+def fingerprint_name(rel, data):
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    stem, dot, ext = rel.rpartition(".")
+    return f"{stem}.{digest}.{ext}"
+
+
+def fingerprint_assets(root):
+    """ハッシュ付きのコピーを作り、{元の相対パス: ハッシュ付き相対パス} を返す"""
+    mapping = {}
+    for pattern in ASSET_GLOBS:
+        for path in sorted(root.glob(pattern)):
+            rel = path.relative_to(root).as_posix()
+            # 前回のビルドで作ったハッシュ付きファイルは対象外
+            if re.search(r"\.[0-9a-f]{%d}\.[^.]+$" % HASH_LENGTH, rel):
+                continue
+            hashed = fingerprint_name(rel, path.read_bytes())
+            if not (root / hashed).exists():
+                shutil.copy2(path, root / hashed)
+            mapping[rel] = hashed
+    return mapping
+
+
+def rewrite_references(html, page_rel, mapping):
+    """ページ内のhref/srcのうちアセットを指すものをハッシュ付きの名前に置き換える"""
+    page_dir = page_rel.rpartition("/")[0]
+
+    def replace(match):
+        attr, url = match.group(1), match.group(2)
+        if "://" in url or url.startswith(("data:", "//")):
+            return match.group(0)
+        if url.startswith("/"):
+            target = url.lstrip("/")
+        else:
+            parts = [p for p in page_dir.split("/") if p]
+            for seg in url.split("/"):
+                if seg == "..":
+                    if parts:
+                        parts.pop()
+                elif seg not in ("", "."):
+                    parts.append(seg)
+            target = "/".join(parts)
+        hashed = mapping.get(unquote(target))
+        if not hashed:
+            return match.group(0)
+        # 元の書き方（相対 / ルート絶対）を保ったままファイル名だけ差し替える
+        new_url = url[: len(url) - len(url.rpartition("/")[2])] + hashed.rpartition("/")[2]
+        return f'{attr}="{new_url}"'
+
+    return ASSET_REF_RE.sub(replace, html)
+
+
+def update_vercel_headers(path):
+    """vercel.json にキャッシュヘッダーのルールを書き込む（既存の設定は保持）"""
+    config = {}
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    # Vercelは後に書いたルールで上書きするので、HTML用の短いTTLを先に置く
+    own = {"/(.*)", FINGERPRINT_SOURCE}
+    config["headers"] = [
+        {
+            "source": "/(.*)",
+            "headers": [{"key": "Cache-Control", "value": HTML_CACHE_CONTROL}],
+        },
+        {
+            "source": FINGERPRINT_SOURCE,
+            "headers": [{"key": "Cache-Control", "value": ASSET_CACHE_CONTROL}],
+        },
+    ] + [rule for rule in config.get("headers", []) if rule.get("source") not in own]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def build_fingerprint(root="."):
+    root = Path(root).resolve()
+    mapping = fingerprint_assets(root)
+    print(f"ハッシュ付きアセット: {len(mapping)}件")
+
+    count = 0
+    for path in sorted(root.rglob("*.html")):
+        rel = path.relative_to(root).as_posix()
+        html = path.read_text(encoding="utf-8")
+        new_html = rewrite_references(html, rel, mapping)
+        if new_html != html:
+            path.write_text(new_html, encoding="utf-8")
+            count += 1
+
+    update_vercel_headers(root / VERCEL_FILE)
+    print(f"参照を書き換え: {count}ファイル")
+    return mapping
+
+
+def main():
+    parser = argparse.ArgumentParser(description="静的アセットのハッシュ付きファイル名化")
+    parser.add_argument("root", help="ビルド対象のディレクトリ（中のファイルをその場で書き換えるので、ソースツリーではなく dist/ などのコピーを指定する）")
+    args = parser.parse_args()
+    build_fingerprint(args.root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+index.html に「最新のお便り」をビルド時に埋め込むステージ。
+
+カテゴリーごとの最新6件（と数日先までの予約投稿）だけを小さなJSONとして
+index.html に埋め込み、「すべて」の一覧はHTMLとして描画済みにしておく。
+トップページは data/questions.js（全件カタログ）をダウンロードせずに表示できる。
+埋め込みが有効なのは先読みした日（until）まで。再ビルドされないまま期限を過ぎると、
+index.html は従来どおり questions.js を読み込んで公開日を迎えた記事を表示する。
+"""
+import argparse
+import html
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+INDEX_FILE = "index.html"
+QUESTIONS_JS = "data/questions.js"
+LATEST_COUNT = 6
+# ビルド後に公開日を迎える予約投稿もクライアント側で出せるよう先読みする日数
+LOOKAHEAD_DAYS = 2
+JST = timezone(timedelta(hours=9))
+
+# カテゴリーマッピング (index.html / archive.html と同じ)
+CATEGORY_MAPPING = {
+    "片思い": ["片思い", "初デート", "告白"],
+    "彼氏・彼女": ["付き合って3ヶ月", "付き合って1年", "不信感", "信頼関係", "嫉妬", "浮気"],
+    "結婚": ["結婚", "結婚前", "義実家", "義理"],
+    "出会い": ["マッチングアプリ", "出会い", "合コン"],
+    "復縁・別れ": ["別れ", "別れた後", "元彼", "復縁"],
+    "夜の悩み": ["夜の", "セフレ", "性生活", "都合のいい関係"],
+}
+
+ISLAND_RE = re.compile(r'(<script type="application/json" id="latest-posts-data"[^>]*>)(.*?)(</script>)', re.S)
+LIST_RE = re.compile(r'(<div id="latest-posts-list"[^>]*>)(.*?)(\n\s*</div>)', re.S)
+
+
+def get_category(post):
+    content = post["title"] + post["description"]
+    for cat, keywords in CATEGORY_MAPPING.items():
+        if any(k in content for k in keywords):
+            return cat
+    return "その他"
+
+
+def load_questions_js(path):
+    """questions.js（const questionsData = [...];）を読み込む"""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    start = text.index("[")
+    end = text.rindex("]") + 1
+    return json.loads(text[start:end])
+
+
+def select_latest(posts, today_str, lookahead_str):
+    """カテゴリーごとに公開済みの最新N件と先読み分の予約投稿を選ぶ（重複なし）"""
+    # 日付の新しい順（同じ日付はファイル内の順序のまま）
+    ordered = sorted((p for p in posts if p["date"] <= lookahead_str), key=lambda p: p["date"], reverse=True)
+    selected = {}
+    counts = {}
+    for post in ordered:
+        cat = get_category(post)
+        is_live = post["date"] <= today_str
+        for key in ("すべて", cat):
+            if not is_live:
+                selected[post["url"]] = dict(post, cat=cat)
+            elif counts.get(key, 0) < LATEST_COUNT:
+                counts[key] = counts.get(key, 0) + 1
+                selected[post["url"]] = dict(post, cat=cat)
+    return [selected[p["url"]] for p in ordered if p["url"] in selected]
+
+
+def render_post_item(post):
+    """index.html の renderPosts() と同じマークアップを生成する"""
+    e = {k: html.escape(post[k]) for k in ("title", "description", "date", "url")}
+    return f'''
+                    <div class="post-item" style="margin-bottom: 50px; border-bottom: 1px dashed #ffecf2; padding-bottom: 20px;">
+                        <p style="color:#999; font-size:0.8rem;">{e["date"]} 更新</p>
+                        <h2 style="margin: 10px 0;"><a href="{e["url"]}" style="text-decoration:none; color:#333;">{e["title"]}</a></h2>
+                        <p style="color:#666; line-height:1.6; font-size:0.95rem;">{e["description"]}</p>
+                        <a href="{e["url"]}" style="color:#d63384; font-weight:bold; text-decoration:none;">お返事を読む ➔</a>
+                    </div>
+                '''
+
+
+def build_index_island(root=".", now=None):
+    root = Path(root).resolve()
+    index_path = root / INDEX_FILE
+    questions_path = root / QUESTIONS_JS
+    if not index_path.exists() or not questions_path.exists():
+        print(f"スキップ: {INDEX_FILE} または {QUESTIONS_JS} が見つかりません")
+        return
+
+    now = now or datetime.now(JST)
+    today_str = now.strftime("%Y.%m.%d")
+    lookahead_str = (now + timedelta(days=LOOKAHEAD_DAYS)).strftime("%Y.%m.%d")
+    posts = load_questions_js(questions_path)
+    latest = select_latest(posts, today_str, lookahead_str)
+
+    island = json.dumps({"generated": today_str, "until": lookahead_str, "posts": latest}, ensure_ascii=False, separators=(",", ":"))
+    island = island.replace("</", "<\\/")
+    live = [p for p in latest if p["date"] <= today_str][:LATEST_COUNT]
+
+    content = index_path.read_text(encoding="utf-8")
+    if not ISLAND_RE.search(content):
+        print(f"スキップ: {INDEX_FILE} に latest-posts-data がありません")
+        return
+    content = ISLAND_RE.sub(lambda m: m.group(1) + island + m.group(3), content, count=1)
+    if live:
+        content = LIST_RE.sub(lambda m: m.group(1) + "".join(render_post_item(p) for p in live) + m.group(3),
+                              content, count=1)
+    index_path.write_text(content, encoding="utf-8")
+    print(f"index.html に最新のお便り {len(latest)}件（{len(island.encode('utf-8')):,} bytes）を埋め込みました"
+          f"（全件 {len(posts)}件 / {questions_path.stat().st_size:,} bytes）")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="index.html への最新記事の埋め込み")
+    parser.add_argument("root", help="ビルド対象のディレクトリ（中のファイルをその場で書き換えるので、ソースツリーではなく dist/ などのコピーを指定する）")
+    args = parser.parse_args()
+    build_index_island(args.root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+記事ページに「次に開きそうなページ」の先読みヒントを埋め込むビルドステージ。
+
+記事カタログ（data/questions.js）から、アーカイブ・時系列で前後の記事・同じカテゴリーの
+最新記事を候補として選び、先読みするHTMLの合計がバイト予算に収まる分だけ
+<link rel="prefetch">（または Speculation Rules のJSON）として </head> の前に書き込む。
+予算と書き方は build_dist.py の --prefetch-budget / --prefetch-format でも指定できる。
+
+ヒントが変わらないページはファイルを書き換えないが、build_dist.py はステージング領域を毎回
+作り直すので、そこでは全ページが書き換わる。デプロイが差分で済むのは dist/ のマニフェストが
+内容の同じファイルを書き出さないため。
+"""
+import argparse
+import json
+import posixpath
+import re
+from datetime import datetime
+from pathlib import Path
+
+from build_index_island import JST, QUESTIONS_JS, get_category, load_questions_js
+
+ARCHIVE_FILE = "archive.html"
+# 1ページあたりに先読みするHTMLの合計サイズの上限（非圧縮。転送時は gzip で1/3程度になる）
+PREFETCH_BUDGET_BYTES = 96 * 1024
+CATEGORY_POSTS = 3
+FORMATS = ("link", "speculationrules")
+
+HINTS_RE = re.compile(r"[ \t]*<!-- prefetch-hints -->.*?<!-- /prefetch-hints -->", re.S)
+
+
+def published_posts(posts, today_str):
+    """公開済みの記事を日付の新しい順に（同じ日付はカタログの順序のまま）"""
+    return sorted((p for p in posts if p["date"] <= today_str), key=lambda p: p["date"], reverse=True)
+
+
+def plan_hints(root, posts, budget):
+    """{記事の相対パス: [先読みする相対パス（ルート基準）]} を優先度順に返す"""
+    by_category = {}
+    for post in posts:
+        by_category.setdefault(get_category(post), []).append(post["url"])
+    sizes = {}
+
+    def size(rel):
+        if rel not in sizes:
+            path = root / rel
+            sizes[rel] = path.stat().st_size if path.is_file() else None
+        return sizes[rel]
+
+    plan = {}
+    for i, post in enumerate(posts):
+        page = post["url"]
+        # 新しい順に並んでいるので、i-1 が次の記事・i+1 が前の記事
+        candidates = [ARCHIVE_FILE]
+        if i > 0:
+            candidates.append(posts[i - 1]["url"])
+        if i + 1 < len(posts):
+            candidates.append(posts[i + 1]["url"])
+        same_category = (url for url in by_category[get_category(post)] if url != page and url not in candidates)
+        candidates += [url for _, url in zip(range(CATEGORY_POSTS), same_category)]
+
+        hints = []
+        total = 0
+        for rel in candidates:
+            # 予算に収まらない候補は飛ばし、後ろの小さい候補は入れる
+            if size(rel) is None or total + size(rel) > budget:
+                continue
+            hints.append(rel)
+            total += size(rel)
+        plan[page] = hints
+    return plan
+
+
+def render_hints(page, hints, fmt, indent="  "):
+    urls = [posixpath.relpath(rel, posixpath.dirname(page) or ".") for rel in hints]
+    if fmt == "speculationrules":
+        rules = json.dumps({"prefetch": [{"source": "list", "urls": urls}]}, ensure_ascii=False)
+        body = [f'{indent}<script type="speculationrules">{rules}</script>']
+    else:
+        body = [f'{indent}<link rel="prefetch" href="{url}">' for url in urls]
+    return "\n".join([f"{indent}<!-- prefetch-hints -->"] + body + [f"{indent}<!-- /prefetch-hints -->"])
+
+
+def apply_hints(html, block):
+    """既存のヒントを差し替える（無ければ </head> の行の前に入れる）"""
+    if HINTS_RE.search(html):
+        return HINTS_RE.sub(lambda m: block, html, count=1)
+    idx = html.find("</head>")
+    if idx == -1:
+        return html
+    line_start = html.rfind("\n", 0, idx) + 1
+    return html[:line_start] + block + "\n" + html[line_start:]
+
+
+def build_prefetch_hints(root=".", budget=PREFETCH_BUDGET_BYTES, fmt="link", now=None):
+    root = Path(root).resolve()
+    questions_path = root / QUESTIONS_JS
+    if not questions_path.exists():
+        print(f"スキップ: {QUESTIONS_JS} が見つかりません")
+        return
+    today_str = (now or datetime.now(JST)).strftime("%Y.%m.%d")
+    posts = published_posts(load_questions_js(questions_path), today_str)
+    plan = plan_hints(root, posts, budget)
+
+    written = 0
+    total_hints = 0
+    for page, hints in plan.items():
+        path = root / page
+        if not path.is_file() or not hints:
+            continue
+        total_hints += len(hints)
+        html = path.read_text(encoding="utf-8")
+        block = render_hints(page, hints, fmt)
+        new_html = apply_hints(html, block)
+        if new_html != html:
+            path.write_text(new_html, encoding="utf-8")
+            written += 1
+    pages = sum(1 for hints in plan.values() if hints)
+    print(f"先読みヒント: {pages}ページ / 平均 {total_hints / max(pages, 1):.1f}件"
+          f"（予算 {budget:,} bytes、書き換え {written}ファイル）")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="記事ページへの先読みヒントの埋め込み")
+    parser.add_argument("root", help="ビルド対象のディレクトリ（中のファイルをその場で書き換えるので、ソースツリーではなく dist/ などのコピーを指定する）")
+    parser.add_argument("--budget", type=int, default=PREFETCH_BUDGET_BYTES,
+                        help="1ページあたりに先読みするHTMLの合計バイト数")
+    parser.add_argument("--format", choices=FORMATS, default="link", help="ヒントの書き方")
+    args = parser.parse_args()
+    build_prefetch_hints(args.root, args.budget, args.format)
+
+
+if __name__ == "__main__":
+    main()
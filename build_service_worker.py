@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+ビルド済みの出力からプリキャッシュ用のマニフェストを作り、Service Worker（sw.js）を書き出すステージ。
+
+インストール時にプリキャッシュするのは表示に必要な CSS / JS のシェルだけにする。
+画像と記事データ（カタログの成長とともに大きくなる）は最初に使われたときに
+上限付きのランタイムキャッシュへ入れ、以降はキャッシュ優先で配信する。
+記事ページは stale-while-revalidate。マニフェストの内容が変わると sw.js のバージョンも変わり、
+古いプリキャッシュと使われなくなったアセットは activate 時に削除される。
+"""
+import argparse
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from build_fingerprint import HASH_LENGTH, VERCEL_FILE
+
+SW_FILE = "sw.js"
+# インストール時にプリキャッシュするハッシュ付きのシェル（OGP用の public/ は表示に使わないので除外）
+PRECACHE_GLOBS = [
+    "*.css",
+    "posts/*.css",
+    "posts/*.js",
+]
+# 初回アクセス時にランタイムキャッシュへ入れるハッシュ付きアセット（画像・記事データ）
+RUNTIME_GLOBS = [
+    "*.png",
+    "data/*.js",
+]
+# ランタイムキャッシュに残す最大件数（アセット・記事ページ）
+MAX_ASSET_ENTRIES = 20
+MAX_POST_ENTRIES = 60
+SW_CACHE_CONTROL = "no-cache"
+
+REGISTER_SNIPPET = ("<script>if ('serviceWorker' in navigator) { "
+                    "navigator.serviceWorker.register('/sw.js'); }</script>")
+
+SW_TEMPLATE = """// build_service_worker.py が生成（手で編集しないこと）
+const VERSION = '__VERSION__';
+const PRECACHE = 'yui-precache-' + VERSION;
+const ASSETS = 'yui-assets';
+const PAGES = 'yui-pages';
+const POSTS = 'yui-posts';
+const PRECACHE_URLS = __PRECACHE_URLS__;
+const RUNTIME_URLS = __RUNTIME_URLS__;
+const MAX_ASSET_ENTRIES = __MAX_ASSET_ENTRIES__;
+const MAX_POST_ENTRIES = __MAX_POST_ENTRIES__;
+
+self.addEventListener('install', event => {
+  event.waitUntil(
+    caches.open(PRECACHE)
+      .then(cache => cache.addAll(PRECACHE_URLS))
+      .then(() => self.skipWaiting())
+  );
+});
+
+// バージョンが変わったら古いプリキャッシュと、今のビルドに無いアセットを削除する
+async function dropStaleAssets() {
+  const cache = await caches.open(ASSETS);
+  for (const key of await cache.keys()) {
+    if (!RUNTIME_URLS.includes(new URL(key.url).pathname)) await cache.delete(key);
+  }
+}
+
+self.addEventListener('activate', event => {
+  event.waitUntil(
+    caches.keys()
+      .then(keys => Promise.all(keys
+        .filter(key => key.startsWith('yui-precache-') && key !== PRECACHE)
+        .map(key => caches.delete(key))))
+      .then(dropStaleAssets)
+      .then(() => self.clients.claim())
+  );
+});
+
+async function cacheFirst(request, name, maxEntries) {
+  const cached = await caches.match(request);
+  if (cached) return cached;
+  const response = await fetch(request);
+  if (response.ok) {
+    const cache = await caches.open(name);
+    await cache.put(request, response.clone());
+    if (maxEntries) await trimCache(name, maxEntries);
+  }
+  return response;
+}
+
+async function trimCache(name, maxEntries) {
+  const cache = await caches.open(name);
+  const keys = await cache.keys();
+  // 古く追加されたものから削除
+  for (const key of keys.slice(0, Math.max(0, keys.length - maxEntries))) {
+    await cache.delete(key);
+  }
+}
+
+async function staleWhileRevalidate(event) {
+  const cache = await caches.open(POSTS);
+  const cached = await cache.match(event.request);
+  const network = fetch(event.request).then(async response => {
+    if (response.ok) {
+      await cache.delete(event.request);
+      await cache.put(event.request, response.clone());
+      await trimCache(POSTS, MAX_POST_ENTRIES);
+    }
+    return response;
+  });
+  if (cached) {
+    event.waitUntil(network.catch(() => {}));
+    return cached;
+  }
+  return network;
+}
+
+async function networkFirst(request) {
+  const cache = await caches.open(PAGES);
+  try {
+    const response = await fetch(request);
+    if (response.ok) cache.put(request, response.clone());
+    return response;
+  } catch (err) {
+    const cached = await cache.match(request);
+    if (cached) return cached;
+    throw err;
+  }
+}
+
+self.addEventListener('fetch', event => {
+  const request = event.request;
+  if (request.method !== 'GET') return;
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) return;
+
+  if (PRECACHE_URLS.includes(url.pathname)) {
+    event.respondWith(cacheFirst(request, PRECACHE));
+  } else if (RUNTIME_URLS.includes(url.pathname)) {
+    event.respondWith(cacheFirst(request, ASSETS, MAX_ASSET_ENTRIES));
+  } else if (request.mode === 'navigate' && url.pathname.startsWith('/posts/')) {
+    event.respondWith(staleWhileRevalidate(event));
+  } else if (request.mode === 'navigate') {
+    event.respondWith(networkFirst(request));
+  }
+});
+"""
+
+
+def collect_hashed(root, globs):
+    """パターンに合うハッシュ付きアセットをルート絶対パスで返す"""
+    hashed = re.compile(r"\.[0-9a-f]{%d}\.[^./]+$" % HASH_LENGTH)
+    urls = set()
+    for pattern in globs:
+        for path in root.glob(pattern):
+            rel = path.relative_to(root).as_posix()
+            if hashed.search(rel):
+                urls.add("/" + rel)
+    return sorted(urls)
+
+
+def render_service_worker(precache_urls, runtime_urls):
+    # ハッシュ付きのURL一覧からバージョンを決めるので、内容が同じなら sw.js も変わらない
+    version = hashlib.sha256("\n".join(precache_urls + runtime_urls).encode("utf-8")).hexdigest()[:HASH_LENGTH]
+    sw = SW_TEMPLATE.replace("__VERSION__", version)
+    sw = sw.replace("__PRECACHE_URLS__", json.dumps(precache_urls, indent=2))
+    sw = sw.replace("__RUNTIME_URLS__", json.dumps(runtime_urls, indent=2))
+    sw = sw.replace("__MAX_ASSET_ENTRIES__", str(MAX_ASSET_ENTRIES))
+    sw = sw.replace("__MAX_POST_ENTRIES__", str(MAX_POST_ENTRIES))
+    return version, sw
+
+
+def add_sw_header(path):
+    """sw.js を毎回再検証させるヘッダールールを vercel.json に足す"""
+    config = {}
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    headers = [rule for rule in config.get("headers", []) if rule.get("source") != "/" + SW_FILE]
+    headers.append({
+        "source": "/" + SW_FILE,
+        "headers": [{"key": "Cache-Control", "value": SW_CACHE_CONTROL}],
+    })
+    config["headers"] = headers
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def build_service_worker(root="."):
+    root = Path(root).resolve()
+    precache_urls = collect_hashed(root, PRECACHE_GLOBS)
+    runtime_urls = collect_hashed(root, RUNTIME_GLOBS)
+    version, sw = render_service_worker(precache_urls, runtime_urls)
+    (root / SW_FILE).write_text(sw, encoding="utf-8")
+
+    count = 0
+    for path in sorted(root.rglob("*.html")):
+        html = path.read_text(encoding="utf-8")
+        if "serviceWorker" in html or "</body>" not in html:
+            continue
+        idx = html.rindex("</body>")
+        path.write_text(html[:idx] + "  " + REGISTER_SNIPPET + "\n" + html[idx:], encoding="utf-8")
+        count += 1
+
+    add_sw_header(root / VERCEL_FILE)
+    size = sum((root / u.lstrip("/")).stat().st_size for u in precache_urls)
+    print(f"sw.js（version {version}）: プリキャッシュ {len(precache_urls)}件 / {size:,} bytes、"
+          f"登録スクリプトを追加 {count}ファイル")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Service Worker とプリキャッシュマニフェストの生成")
+    parser.add_argument("root", help="ビルド対象のディレクトリ（中のファイルをその場で書き換えるので、ソースツリーではなく dist/ などのコピーを指定する）")
+    args = parser.parse_args()
+    build_service_worker(args.root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+記事ページを年月ごとのディレクトリ（posts/2026/05/slug.html）に振り分けるビルドステージ（任意）。
+
+移動と同時に、ページ内のリンク・canonical・JSON-LD の @id・記事カタログの url・
+サイトマップを1パスで新しい場所に書き換え、旧URLから1回で新URLへ飛ぶ
+リダイレクトルールを vercel.json に書き込む。共有の post-style.css / note-embed.js は posts/ 直下に残す。
+
+Vercel が読むのはリポジトリ直下の vercel.json なので、ビルド出力に書いたルールは効かない。
+--redirects-only でルート直下に書き込んでおくこと（build_dist.py --shard-posts は無ければ失敗する）。
+"""
+import argparse
+import json
+import posixpath
+import re
+from pathlib import Path
+
+from build_fingerprint import VERCEL_FILE
+from build_index_island import QUESTIONS_JS, load_questions_js
+
+SITE_URL = "https://yui-love.vercel.app"
+POSTS_DIR = "posts"
+SITEMAP_FILE = "sitemap.xml"
+
+# ファイル名末尾の日付（slug-20260520）
+DATE_SUFFIX_RE = re.compile(r"-(\d{4})(\d{2})\d{2}$")
+REF_RE = re.compile(r'\b(href|src|data-src)="([^"]*)"')
+ABS_POST_RE = re.compile(re.escape(SITE_URL) + r"/(posts/[^\"'\s<>&?#/]+\.html)")
+CATALOGUE_URL_RE = re.compile(r'("url":\s*")(posts/[^"/]+\.html)(")')
+
+# 日付付きのファイル名はこの2ルールで新しい場所へ飛ばす（記事数が増えてもルールは増えない）
+DATED_REDIRECT_SOURCES = [
+    "/posts/([^/]+)-(\\d{4})(\\d{2})(\\d{2})",
+    "/posts/([^/]+)-(\\d{4})(\\d{2})(\\d{2})\\.html",
+]
+DATED_REDIRECT_DESTINATION = "/posts/$2/$3/$1-$2$3$4"
+
+
+def shard_rel(rel, catalogue_dates):
+    """posts/slug.html の振り分け先。日付が分からない記事はNone（移動しない）"""
+    stem = rel[len(POSTS_DIR) + 1:-len(".html")]
+    match = DATE_SUFFIX_RE.search(stem)
+    if match:
+        year, month = match.group(1), match.group(2)
+    elif rel in catalogue_dates:
+        year, month = catalogue_dates[rel].split(".")[:2]
+    else:
+        return None
+    return f"{POSTS_DIR}/{year}/{month}/{stem}.html"
+
+
+def plan_moves(root):
+    """{旧パス: 新パス} を返す（ルートからの相対パス）"""
+    catalogue_dates = {}
+    if (root / QUESTIONS_JS).exists():
+        catalogue_dates = {p["url"]: p["date"] for p in load_questions_js(root / QUESTIONS_JS)}
+    mapping = {}
+    for path in sorted((root / POSTS_DIR).glob("*.html")):
+        rel = path.relative_to(root).as_posix()
+        new_rel = shard_rel(rel, catalogue_dates)
+        if new_rel:
+            mapping[rel] = new_rel
+    return mapping
+
+
+def rewrite_relative(html, old_rel, new_rel, mapping):
+    """相対リンクを旧ページ位置で解決し、移動後のページ位置からの相対パスに書き直す"""
+    old_dir = posixpath.dirname(old_rel)
+    new_dir = posixpath.dirname(new_rel)
+
+    def replace(match):
+        attr, url = match.group(1), match.group(2)
+        if not url or "://" in url or "$" in url or url.startswith(("#", "//", "data:", "mailto:", "javascript:")):
+            return match.group(0)
+        path, suffix = re.match(r"([^?#]*)(.*)", url).groups()
+        if path.startswith("/"):
+            target = path.lstrip("/")
+            new_target = mapping.get(target)
+            return f'{attr}="/{new_target}{suffix}"' if new_target else match.group(0)
+        target = posixpath.normpath(posixpath.join(old_dir, path))
+        new_target = mapping.get(target, target)
+        if new_target == target and new_dir == old_dir:
+            return match.group(0)
+        return f'{attr}="{posixpath.relpath(new_target, new_dir or ".")}{suffix}"'
+
+    return REF_RE.sub(replace, html)
+
+
+def rewrite_absolute(text, mapping):
+    """サイトの絶対URL（og:url・JSON-LD の @id・シェアリンク・サイトマップ）を書き換える"""
+    return ABS_POST_RE.sub(lambda m: f"{SITE_URL}/{mapping.get(m.group(1), m.group(1))}", text)
+
+
+def load_vercel_config(path):
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def redirect_rules(config, mapping):
+    """旧URLから新URLへのリダイレクトルール"""
+    # cleanUrls のときは拡張子なしの最終URLへ直接飛ばしてリダイレクトを連鎖させない
+    ext = "" if config.get("cleanUrls") else ".html"
+    rules = [{"source": source, "destination": DATED_REDIRECT_DESTINATION + ext, "permanent": True}
+             for source in DATED_REDIRECT_SOURCES]
+    for old_rel, new_rel in sorted(mapping.items()):
+        if DATE_SUFFIX_RE.search(old_rel[:-len(".html")]):
+            continue
+        for source in ("/" + old_rel[:-len(".html")], "/" + old_rel):
+            rules.append({"source": source, "destination": "/" + new_rel[:-len(".html")] + ext, "permanent": True})
+    return rules
+
+
+def missing_redirects(path, mapping):
+    """vercel.json に無いリダイレクトルールを返す"""
+    config = load_vercel_config(path)
+    return [rule for rule in redirect_rules(config, mapping) if rule not in config.get("redirects", [])]
+
+
+def update_vercel_redirects(path, mapping):
+    """旧URLからのリダイレクトを vercel.json に書き込む（posts/ 以外のルールは保持）"""
+    config = load_vercel_config(path)
+    rules = redirect_rules(config, mapping)
+    others = [rule for rule in config.get("redirects", []) if not rule.get("source", "").startswith("/posts/")]
+    config["redirects"] = others + rules
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return len(rules)
+
+
+def build_shard_posts(root="."):
+    root = Path(root).resolve()
+    mapping = plan_moves(root)
+    if not mapping:
+        print("スキップ: 振り分ける記事がありません")
+        return mapping
+
+    for path in sorted(root.rglob("*.html")):
+        old_rel = path.relative_to(root).as_posix()
+        new_rel = mapping.get(old_rel, old_rel)
+        html = path.read_text(encoding="utf-8")
+        new_html = rewrite_absolute(rewrite_relative(html, old_rel, new_rel, mapping), mapping)
+        if new_rel != old_rel:
+            dest = root / new_rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_text(new_html, encoding="utf-8")
+            path.unlink()
+        elif new_html != html:
+            path.write_text(new_html, encoding="utf-8")
+
+    # サイトマップはルートと public/ の両方にある
+    for sitemap in sorted(root.rglob(SITEMAP_FILE)):
+        sitemap.write_text(rewrite_absolute(sitemap.read_text(encoding="utf-8"), mapping), encoding="utf-8")
+    questions = root / QUESTIONS_JS
+    if questions.exists():
+        text = questions.read_text(encoding="utf-8")
+        text = CATALOGUE_URL_RE.sub(lambda m: m.group(1) + mapping.get(m.group(2), m.group(2)) + m.group(3), text)
+        questions.write_text(text, encoding="utf-8")
+
+    rules = update_vercel_redirects(root / VERCEL_FILE, mapping)
+    months = len({posixpath.dirname(rel) for rel in mapping.values()})
+    print(f"記事を振り分け: {len(mapping)}件 → {months}ディレクトリ、リダイレクト {rules}ルール")
+    return mapping
+
+
+def main():
+    parser = argparse.ArgumentParser(description="記事ページの年月ディレクトリへの振り分け")
+    parser.add_argument("root", help="ビルド対象のディレクトリ（中のファイルをその場で書き換えるので、ソースツリーではなく dist/ などのコピーを指定する）")
+    parser.add_argument("--redirects-only", action="store_true",
+                        help="記事は動かさず、リダイレクトルールだけを vercel.json に書き込む")
+    args = parser.parse_args()
+    if args.redirects_only:
+        root = Path(args.root).resolve()
+        rules = update_vercel_redirects(root / VERCEL_FILE, plan_moves(root))
+        print(f"{VERCEL_FILE} にリダイレクト {rules}ルールを書き込みました")
+    else:
+        build_shard_posts(args.root)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3104 +1,519 @@
 const questionsData = [
-    {
-        "title": "【セフレ・都合のいい関係】夜の悩みから卒業。本命彼女になるための逆転プラン",
-        "description": "都合のいい関係から抜け出せない悩みは深いですよね。ゆい姉さんが本命彼女になるための逆転プランを解説します。",
-        "date": "2026.02.16",
-        "url": "posts/friends-with-benefits-escape-20260216.html"
-    },
-    {
-        "title": "【年上の彼】義実家への挨拶で失敗しない！大人の対応と好印象を与える秘訣",
-        "description": "年上の彼との義実家・親戚付き合いの対策についての悩みは深いですよね。ゆい姉さんが大人の対応と好印象の秘訣を解説します。",
-        "date": "2026.05.25",
-        "url": "posts/in-laws-strategy-older-man-20260525.html"
-    },
-    {
-        "title": "仕事中に寂しくなったら…遠距離恋愛を「力」に変える3つのマインドセット",
-        "description": "仕事中の遠距離恋愛の成功の秘訣についての悩みは深いですよね。ゆい姉さんが寂しさを力に変える方法を解説します。",
-        "date": "2026.05.25",
-        "url": "posts/ldr-success-tip-work-20260525.html"
-    },
-    {
-        "title": "【年下の彼】思わぬ一言で溝が…？年下男性を傷つけるNGな言動と修復術",
-        "description": "年下の彼とのコミュニケーションの失敗についての悩みは深いですよね。ゆい姉さんがNGな言動と関係修復のコツを解説します。",
-        "date": "2026.05.25",
-        "url": "posts/comm-mistake-younger-man-20260525.html"
-    },
-    {
-        "title": "社内恋愛から結婚へ！周囲を味方につける「完璧な報告」のタイミング",
-        "description": "結婚前の社内恋愛の戦略についての悩みは深いですよね。ゆい姉さんが周囲を味方につける報告のタイミングを解説します。",
-        "date": "2026.05.25",
-        "url": "posts/office-romance-strategy-marriage-20260525.html"
-    },
-    {
-        "title": "【年上の彼】別れ際の「重い女」は卒業。彼の心に深く残る美しいサヨナラ",
-        "description": "年上の彼との別れの失敗についての悩みは深いですよね。ゆい姉さんが再会を予感させるような美しい別れ方を解説します。",
-        "date": "2026.05.25",
-        "url": "posts/breakup-mistake-older-man-20260525.html"
-    },
-    {
-        "title": "結婚前の【相談】別れの切り出し方について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の別れの切り出し方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.24",
-        "url": "posts/breakup-strategy-before-marria-20260524.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "付き合って3ヶ月の社内恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.24",
-        "url": "posts/office-romance-panic-after-3-m-20260524.html"
-    },
-    {
-        "title": "年上の彼との【相談】マッチングアプリの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのマッチングアプリの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.24",
-        "url": "posts/dating-app-strategy-with-older-20260524.html"
-    },
-    {
-        "title": "夜の【相談】ファッション・服装のアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜のファッション・服装のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.24",
-        "url": "posts/fashion-advice-late-at-night-20260524.html"
-    },
-    {
-        "title": "別れた後の【相談】浮気の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の浮気の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.24",
-        "url": "posts/cheating-success-tip-after-bre-20260524.html"
-    },
-    {
-        "title": "結婚前の【相談】コミュニケーションの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のコミュニケーションの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.23",
-        "url": "posts/communication-secret-before-ma-20260523.html"
-    },
-    {
-        "title": "年上の彼との【相談】別れの切り出し方について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との別れの切り出し方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.23",
-        "url": "posts/breakup-strategy-with-older-ma-20260523.html"
-    },
-    {
-        "title": "年上の彼との【相談】マッチングアプリの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのマッチングアプリの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.23",
-        "url": "posts/dating-app-panic-with-older-ma-20260523.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "年上の彼との年の差の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.23",
-        "url": "posts/age-gap-psychology-with-older--20260523.html"
-    },
-    {
-        "title": "別れた後の【相談】義実家・親戚付き合いの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の義実家・親戚付き合いの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.23",
-        "url": "posts/in-laws-strategy-after-breakup-20260523.html"
-    },
-    {
-        "title": "別れた後の【相談】片思いの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の片思いの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.22",
-        "url": "posts/unrequited-love-secret-after-b-20260522.html"
-    },
-    {
-        "title": "年上の彼との【相談】セフレ・都合のいい関係のアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのセフレ・都合のいい関係のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.22",
-        "url": "posts/friends-with-benefits-advice-w-20260522.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "年下の彼との社内恋愛の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.22",
-        "url": "posts/office-romance-psychology-with-20260522.html"
-    },
-    {
-        "title": "付き合って1年の【相談】不信感・信頼関係の悩みの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の不信感・信頼関係の悩みの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.22",
-        "url": "posts/trust-issues-success-tip-after-20260522.html"
-    },
-    {
-        "title": "友達との【相談】お金の悩みの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "友達とのお金の悩みの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.22",
-        "url": "posts/money-mistake-with-friend-20260522.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】浮気対策について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の浮気対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.21",
-        "url": "posts/cheating-strategy-after-3-mont-20260521.html"
-    },
-    {
-        "title": "結婚前の【相談】ファッション・服装の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のファッション・服装の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.21",
-        "url": "posts/fashion-regret-before-marriage-20260521.html"
-    },
-    {
-        "title": "結婚前の【相談】LINEのメッセージのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のLINEのメッセージのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.21",
-        "url": "posts/line-message-advice-before-mar-20260521.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "同僚との初デートの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.21",
-        "url": "posts/first-date-psychology-with-cow-20260521.html"
-    },
-    {
-        "title": "別れた後の【相談】ファッション・服装の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後のファッション・服装の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.21",
-        "url": "posts/fashion-anxiety-after-breakup-20260521.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】嫉妬の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の嫉妬の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.20",
-        "url": "posts/jealousy-regret-after-3-months-20260520.html"
-    },
-    {
-        "title": "結婚前の【相談】義実家・親戚付き合いの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の義実家・親戚付き合いの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.20",
-        "url": "posts/in-laws-strategy-before-marria-20260520.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "友達との年の差の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.20",
-        "url": "posts/age-gap-panic-with-friend-20260520.html"
-    },
-    {
-        "title": "年下の彼との【相談】自己研鑽・自分磨きのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との自己研鑽・自分磨きのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.20",
-        "url": "posts/self-improvement-trouble-with--20260520.html"
-    },
-    {
-        "title": "仕事中の【相談】自己研鑽・自分磨きの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の自己研鑽・自分磨きの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.20",
-        "url": "posts/self-improvement-mistake-durin-20260520.html"
-    },
-    {
-        "title": "同僚との【相談】夜の生活・性生活の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との夜の生活・性生活の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.19",
-        "url": "posts/sex-life-mistake-with-coworker-20260519.html"
-    },
-    {
-        "title": "夜の【相談】結婚のアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜の結婚のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.19",
-        "url": "posts/marriage-advice-late-at-night-20260519.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "年上の彼との年の差の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.19",
-        "url": "posts/age-gap-anxiety-with-older-man-20260519.html"
-    },
-    {
-        "title": "年下の彼との【相談】片思いの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との片思いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.19",
-        "url": "posts/unrequited-love-panic-with-you-20260519.html"
-    },
-    {
-        "title": "年上の彼との【相談】不信感・信頼関係の悩みの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との不信感・信頼関係の悩みの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.19",
-        "url": "posts/trust-issues-success-tip-with--20260519.html"
-    },
-    {
-        "title": "年上の彼との【相談】浮気対策について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との浮気対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.18",
-        "url": "posts/cheating-strategy-with-older-m-20260518.html"
-    },
-    {
-        "title": "友達との【相談】義実家・親戚付き合いのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "友達との義実家・親戚付き合いのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.18",
-        "url": "posts/in-laws-trouble-with-friend-20260518.html"
-    },
-    {
-        "title": "結婚前の【相談】自己研鑽・自分磨きの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の自己研鑽・自分磨きの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.18",
-        "url": "posts/self-improvement-regret-before-20260518.html"
-    },
-    {
-        "title": "同僚との【相談】元彼の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との元彼の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.18",
-        "url": "posts/ex-boyfriend-mistake-with-cowo-20260518.html"
-    },
-    {
-        "title": "夜の【相談】義実家・親戚付き合いの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜の義実家・親戚付き合いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.18",
-        "url": "posts/in-laws-panic-late-at-night-20260518.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】ファッション・服装の対策について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月のファッション・服装の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.17",
-        "url": "posts/fashion-strategy-after-3-month-20260517.html"
-    },
-    {
-        "title": "夜の【相談】嫉妬の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の嫉妬の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.17",
-        "url": "posts/jealousy-mistake-late-at-night-20260517.html"
-    },
-    {
-        "title": "夜の【相談】浮気の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の浮気の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.17",
-        "url": "posts/cheating-success-tip-late-at-n-20260517.html"
-    },
-    {
-        "title": "夜の【相談】片思いのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜の片思いのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.17",
-        "url": "posts/unrequited-love-advice-late-at-20260517.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "別れた後の年の差の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.17",
-        "url": "posts/age-gap-panic-after-breakup-20260517.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "年上の彼との社内恋愛のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.16",
-        "url": "posts/office-romance-advice-with-old-20260516.html"
-    },
-    {
-        "title": "友達との【相談】コミュニケーションの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "友達とのコミュニケーションの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.16",
-        "url": "posts/communication-psychology-with--20260516.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】別れの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の別れの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.16",
-        "url": "posts/breakup-secret-after-3-months-20260516.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】マッチングアプリの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月のマッチングアプリの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.16",
-        "url": "posts/dating-app-panic-after-3-month-20260516.html"
-    },
-    {
-        "title": "仕事中の【相談】元彼の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の元彼の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.16",
-        "url": "posts/ex-boyfriend-success-tip-durin-20260516.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "年下の彼との年の差の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.15",
-        "url": "posts/age-gap-anxiety-with-younger-m-20260515.html"
-    },
-    {
-        "title": "年上の彼との【相談】マッチングアプリの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのマッチングアプリの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.15",
-        "url": "posts/dating-app-psychology-with-old-20260515.html"
-    },
-    {
-        "title": "付き合って1年の【相談】片思いの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の片思いの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.15",
-        "url": "posts/unrequited-love-success-tip-af-20260515.html"
-    },
-    {
-        "title": "同僚との【相談】片思いのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との片思いのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.15",
-        "url": "posts/unrequited-love-trouble-with-c-20260515.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "年下の彼との社内恋愛の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.15",
-        "url": "posts/office-romance-mistake-with-yo-20260515.html"
-    },
-    {
-        "title": "結婚前の【相談】結婚の秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の結婚の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.14",
-        "url": "posts/marriage-secret-before-marriag-20260514.html"
-    },
-    {
-        "title": "同僚との【相談】マッチングアプリの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚とのマッチングアプリの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.14",
-        "url": "posts/dating-app-mistake-with-cowork-20260514.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】遠距離恋愛の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の遠距離恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.14",
-        "url": "posts/long-distance-panic-after-3-mo-20260514.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】自己研鑽・自分磨きのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の自己研鑽・自分磨きのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.14",
-        "url": "posts/self-improvement-advice-after--20260514.html"
-    },
-    {
-        "title": "別れた後の【相談】LINEのメッセージの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後のLINEのメッセージの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.14",
-        "url": "posts/line-message-regret-after-brea-20260514.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "同僚との初デートのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.13",
-        "url": "posts/first-date-advice-with-coworke-20260513.html"
-    },
-    {
-        "title": "同僚との【相談】マッチングアプリの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚とのマッチングアプリの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.13",
-        "url": "posts/dating-app-anxiety-with-cowork-20260513.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】お金の悩みの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月のお金の悩みの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.13",
-        "url": "posts/money-anxiety-after-3-months-20260513.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "付き合って3ヶ月の初デートの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.13",
-        "url": "posts/first-date-mistake-after-3-mon-20260513.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "別れた後の初デートの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.13",
-        "url": "posts/first-date-strategy-after-brea-20260513.html"
-    },
-    {
-        "title": "付き合って1年の【相談】義実家・親戚付き合いの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の義実家・親戚付き合いの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.12",
-        "url": "posts/in-laws-strategy-after-1-year-20260512.html"
-    },
-    {
-        "title": "付き合って1年の【相談】マッチングアプリのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のマッチングアプリのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.12",
-        "url": "posts/dating-app-trouble-after-1-yea-20260512.html"
-    },
-    {
-        "title": "年上の彼との【相談】義実家・親戚付き合いの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との義実家・親戚付き合いの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.12",
-        "url": "posts/in-laws-secret-with-older-man-20260512.html"
-    },
-    {
-        "title": "別れた後の【相談】義実家・親戚付き合いの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の義実家・親戚付き合いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.12",
-        "url": "posts/in-laws-mistake-after-breakup-20260512.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】嫉妬対策について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の嫉妬対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.12",
-        "url": "posts/jealousy-strategy-after-3-mont-20260512.html"
-    },
-    {
-        "title": "友達との【相談】元彼の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との元彼の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.11",
-        "url": "posts/ex-boyfriend-success-tip-with--20260511.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "友達との社内恋愛の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.11",
-        "url": "posts/office-romance-anxiety-with-fr-20260511.html"
-    },
-    {
-        "title": "夜の【相談】不信感・信頼関係の悩みの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の不信感・信頼関係の悩みの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.11",
-        "url": "posts/trust-issues-psychology-late-a-20260511.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "別れた後の年の差の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.11",
-        "url": "posts/age-gap-anxiety-after-breakup-20260511.html"
-    },
-    {
-        "title": "年上の彼との【相談】不信感・信頼関係の悩みの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との不信感・信頼関係の悩みの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.11",
-        "url": "posts/trust-issues-strategy-with-old-20260511.html"
-    },
-    {
-        "title": "友達との【相談】浮気の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との浮気の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.10",
-        "url": "posts/cheating-psychology-with-frien-20260510.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "夜の初デートのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.10",
-        "url": "posts/first-date-trouble-late-at-nig-20260510.html"
-    },
-    {
-        "title": "年上の彼との【相談】夜の生活・性生活の対策について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との夜の生活・性生活の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.10",
-        "url": "posts/sex-life-strategy-with-older-m-20260510.html"
-    },
-    {
-        "title": "仕事中の【相談】自己研鑽・自分磨きのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の自己研鑽・自分磨きのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.10",
-        "url": "posts/self-improvement-advice-during-20260510.html"
-    },
-    {
-        "title": "結婚前の【相談】嫉妬の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の嫉妬の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.10",
-        "url": "posts/jealousy-anxiety-before-marria-20260510.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】嫉妬のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の嫉妬のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.09",
-        "url": "posts/jealousy-trouble-after-3-month-20260509.html"
-    },
-    {
-        "title": "付き合って1年の【相談】嫉妬の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の嫉妬の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.09",
-        "url": "posts/jealousy-anxiety-after-1-year-20260509.html"
-    },
-    {
-        "title": "同僚との【相談】片思いの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との片思いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.09",
-        "url": "posts/unrequited-love-panic-with-cow-20260509.html"
-    },
-    {
-        "title": "年下の彼との【相談】結婚の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との結婚の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.09",
-        "url": "posts/marriage-psychology-with-young-20260509.html"
-    },
-    {
-        "title": "夜の【相談】マッチングアプリの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "夜のマッチングアプリの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.09",
-        "url": "posts/dating-app-anxiety-late-at-nig-20260509.html"
-    },
-    {
-        "title": "仕事中の【相談】嫉妬対策について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の嫉妬対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.08",
-        "url": "posts/jealousy-strategy-during-work-20260508.html"
-    },
-    {
-        "title": "同僚との【相談】夜の生活・性生活の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との夜の生活・性生活の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.08",
-        "url": "posts/sex-life-psychology-with-cowor-20260508.html"
-    },
-    {
-        "title": "付き合って1年の【相談】自己研鑽・自分磨きの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の自己研鑽・自分磨きの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.08",
-        "url": "posts/self-improvement-success-tip-a-20260508.html"
-    },
-    {
-        "title": "夜の【相談】不信感・信頼関係の悩みの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜の不信感・信頼関係の悩みの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.08",
-        "url": "posts/trust-issues-panic-late-at-nig-20260508.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "仕事中の社内恋愛の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.08",
-        "url": "posts/office-romance-secret-during-w-20260508.html"
-    },
-    {
-        "title": "年下の彼との【相談】不信感・信頼関係の悩みのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との不信感・信頼関係の悩みのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.07",
-        "url": "posts/trust-issues-trouble-with-youn-20260507.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】自己研鑽・自分磨きの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の自己研鑽・自分磨きの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.07",
-        "url": "posts/self-improvement-success-tip-a-20260507.html"
-    },
-    {
-        "title": "年上の彼との【相談】嫉妬の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との嫉妬の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.07",
-        "url": "posts/jealousy-anxiety-with-older-ma-20260507.html"
-    },
-    {
-        "title": "別れた後の【相談】片思いの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の片思いの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.07",
-        "url": "posts/unrequited-love-regret-after-b-20260507.html"
-    },
-    {
-        "title": "別れた後の【相談】夜の生活・性生活の対策について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の夜の生活・性生活の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.07",
-        "url": "posts/sex-life-strategy-after-breaku-20260507.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "結婚前の年の差の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.06",
-        "url": "posts/age-gap-secret-before-marriage-20260506.html"
-    },
-    {
-        "title": "年上の彼との【相談】元彼の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との元彼の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.06",
-        "url": "posts/ex-boyfriend-anxiety-with-olde-20260506.html"
-    },
-    {
-        "title": "同僚との【相談】結婚の対策について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との結婚の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.06",
-        "url": "posts/marriage-strategy-with-coworke-20260506.html"
-    },
-    {
-        "title": "友達との【相談】遠距離恋愛の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "友達との遠距離恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.06",
-        "url": "posts/long-distance-panic-with-frien-20260506.html"
-    },
-    {
-        "title": "年上の彼との【相談】お金の悩みのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのお金の悩みのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.06",
-        "url": "posts/money-advice-with-older-man-20260506.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】別れの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の別れの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.05",
-        "url": "posts/breakup-panic-after-3-months-20260505.html"
-    },
-    {
-        "title": "結婚前の【相談】セフレ・都合のいい関係の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のセフレ・都合のいい関係の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.05",
-        "url": "posts/friends-with-benefits-anxiety--20260505.html"
-    },
-    {
-        "title": "同僚との【相談】マッチングアプリの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚とのマッチングアプリの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.05",
-        "url": "posts/dating-app-secret-with-coworke-20260505.html"
-    },
-    {
-        "title": "年下の彼との【相談】LINEのメッセージのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼とのLINEのメッセージのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.05",
-        "url": "posts/line-message-advice-with-young-20260505.html"
-    },
-    {
-        "title": "結婚前の【相談】ファッション・服装の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のファッション・服装の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.05",
-        "url": "posts/fashion-success-tip-before-mar-20260505.html"
-    },
-    {
-        "title": "年下の彼との【相談】お金の悩みの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼とのお金の悩みの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.04",
-        "url": "posts/money-success-tip-with-younger-20260504.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "仕事中の年の差の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.04",
-        "url": "posts/age-gap-anxiety-during-work-20260504.html"
-    },
-    {
-        "title": "年下の彼との【相談】マッチングアプリの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼とのマッチングアプリの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.04",
-        "url": "posts/dating-app-regret-with-younger-20260504.html"
-    },
-    {
-        "title": "夜の【相談】自己研鑽・自分磨きの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の自己研鑽・自分磨きの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.04",
-        "url": "posts/self-improvement-strategy-late-20260504.html"
-    },
-    {
-        "title": "結婚前の【相談】片思いの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の片思いの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.04",
-        "url": "posts/unrequited-love-psychology-bef-20260504.html"
-    },
-    {
-        "title": "年上の彼との【相談】片思いの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との片思いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.03",
-        "url": "posts/unrequited-love-panic-with-old-20260503.html"
-    },
-    {
-        "title": "友達との【相談】ファッション・服装の秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "友達とのファッション・服装の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.03",
-        "url": "posts/fashion-secret-with-friend-20260503.html"
-    },
-    {
-        "title": "夜の【相談】夜の生活・性生活のアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜の夜の生活・性生活のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.03",
-        "url": "posts/sex-life-advice-late-at-night-20260503.html"
-    },
-    {
-        "title": "同僚との【相談】セフレ・都合のいい関係の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚とのセフレ・都合のいい関係の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.03",
-        "url": "posts/friends-with-benefits-anxiety--20260503.html"
-    },
-    {
-        "title": "付き合って1年の【相談】嫉妬のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の嫉妬のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.03",
-        "url": "posts/jealousy-trouble-after-1-year-20260503.html"
-    },
-    {
-        "title": "同僚との【相談】遠距離恋愛の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との遠距離恋愛の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.02",
-        "url": "posts/long-distance-anxiety-with-cow-20260502.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "同僚との初デートの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.02",
-        "url": "posts/first-date-strategy-with-cowor-20260502.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "夜の初デートの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.02",
-        "url": "posts/first-date-panic-late-at-night-20260502.html"
-    },
-    {
-        "title": "友達との【相談】浮気の相談について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との浮気の相談についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.02",
-        "url": "posts/cheating-advice-with-friend-20260502.html"
-    },
-    {
-        "title": "付き合って1年の【相談】元彼の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の元彼の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.02",
-        "url": "posts/ex-boyfriend-mistake-after-1-y-20260502.html"
-    },
-    {
-        "title": "夜の【相談】嫉妬へのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜の嫉妬へのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.01",
-        "url": "posts/jealousy-advice-late-at-night-20260501.html"
-    },
-    {
-        "title": "年上の彼との【相談】不信感・信頼関係の悩みの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との不信感・信頼関係の悩みの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.01",
-        "url": "posts/trust-issues-mistake-with-olde-20260501.html"
-    },
-    {
-        "title": "年上の彼との【相談】義実家・親戚付き合いの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との義実家・親戚付き合いの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.01",
-        "url": "posts/in-laws-psychology-with-older--20260501.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "付き合って1年の社内恋愛のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.01",
-        "url": "posts/office-romance-advice-after-1--20260501.html"
-    },
-    {
-        "title": "仕事中の【相談】夜の生活・性生活のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の夜の生活・性生活のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.05.01",
-        "url": "posts/sex-life-trouble-during-work-20260501.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "付き合って3ヶ月の初デートの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.30",
-        "url": "posts/first-date-psychology-after-3--20260430.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】LINEのメッセージのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月のLINEのメッセージのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.30",
-        "url": "posts/line-message-advice-after-3-mo-20260430.html"
-    },
-    {
-        "title": "別れた後の【相談】元彼の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の元彼の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.30",
-        "url": "posts/ex-boyfriend-anxiety-after-bre-20260430.html"
-    },
-    {
-        "title": "年上の彼との【相談】セフレ・都合のいい関係の対策について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのセフレ・都合のいい関係の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.30",
-        "url": "posts/friends-with-benefits-strategy-20260430.html"
-    },
-    {
-        "title": "年下の彼との【相談】片思いの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との片思いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.30",
-        "url": "posts/unrequited-love-mistake-with-y-20260430.html"
-    },
-    {
-        "title": "友達との【相談】お金の悩みの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "友達とのお金の悩みの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.29",
-        "url": "posts/money-psychology-with-friend-20260429.html"
-    },
-    {
-        "title": "年下の彼との【相談】元彼の対策について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との元彼の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.29",
-        "url": "posts/ex-boyfriend-strategy-with-you-20260429.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】セフレ・都合のいい関係の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月のセフレ・都合のいい関係の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.29",
-        "url": "posts/friends-with-benefits-panic-af-20260429.html"
-    },
-    {
-        "title": "友達との【相談】嫉妬の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との嫉妬の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.29",
-        "url": "posts/jealousy-psychology-with-frien-20260429.html"
-    },
-    {
-        "title": "夜の【相談】嫉妬の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の嫉妬の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.29",
-        "url": "posts/jealousy-psychology-late-at-ni-20260429.html"
-    },
-    {
-        "title": "仕事中の【相談】不信感・信頼関係の悩みの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の不信感・信頼関係の悩みの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.28",
-        "url": "posts/trust-issues-mistake-during-wo-20260428.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】セフレ・都合のいい関係の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月のセフレ・都合のいい関係の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.28",
-        "url": "posts/friends-with-benefits-regret-a-20260428.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "夜の社内恋愛の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.28",
-        "url": "posts/office-romance-anxiety-late-at-20260428.html"
-    },
-    {
-        "title": "年上の彼との【相談】遠距離恋愛の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との遠距離恋愛の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.28",
-        "url": "posts/long-distance-anxiety-with-old-20260428.html"
-    },
-    {
-        "title": "夜の【相談】LINEのメッセージの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "夜のLINEのメッセージの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.28",
-        "url": "posts/line-message-psychology-late-a-20260428.html"
-    },
-    {
-        "title": "年上の彼との【相談】浮気への不安について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との浮気への不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.27",
-        "url": "posts/cheating-anxiety-with-older-ma-20260427.html"
-    },
-    {
-        "title": "結婚前の【相談】嫉妬対策について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の嫉妬対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.27",
-        "url": "posts/jealousy-strategy-before-marri-20260427.html"
-    },
-    {
-        "title": "年上の彼との【相談】コミュニケーションの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのコミュニケーションの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.27",
-        "url": "posts/communication-secret-with-olde-20260427.html"
-    },
-    {
-        "title": "仕事中の【相談】浮気の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の浮気の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.27",
-        "url": "posts/cheating-success-tip-during-wo-20260427.html"
-    },
-    {
-        "title": "年下の彼との【相談】元彼のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との元彼のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.27",
-        "url": "posts/ex-boyfriend-trouble-with-youn-20260427.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "付き合って3ヶ月の社内恋愛の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.26",
-        "url": "posts/office-romance-regret-after-3--20260426.html"
-    },
-    {
-        "title": "同僚との【相談】片思いのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との片思いのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.26",
-        "url": "posts/unrequited-love-advice-with-co-20260426.html"
-    },
-    {
-        "title": "付き合って1年の【相談】遠距離恋愛の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の遠距離恋愛の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.26",
-        "url": "posts/long-distance-regret-after-1-y-20260426.html"
-    },
-    {
-        "title": "付き合って1年の【相談】結婚の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の結婚の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.26",
-        "url": "posts/marriage-success-tip-after-1-y-20260426.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "結婚前の社内恋愛の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.26",
-        "url": "posts/office-romance-strategy-before-20260426.html"
-    },
-    {
-        "title": "夜の【相談】遠距離恋愛の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の遠距離恋愛の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.25",
-        "url": "posts/long-distance-mistake-late-at--20260425.html"
-    },
-    {
-        "title": "別れた後の【相談】セフレ・都合のいい関係の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後のセフレ・都合のいい関係の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.25",
-        "url": "posts/friends-with-benefits-regret-a-20260425.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】結婚のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の結婚のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.25",
-        "url": "posts/marriage-trouble-after-3-month-20260425.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "仕事中の社内恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.25",
-        "url": "posts/office-romance-panic-during-wo-20260425.html"
-    },
-    {
-        "title": "年下の彼との【相談】ファッション・服装の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼とのファッション・服装の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.25",
-        "url": "posts/fashion-mistake-with-younger-m-20260425.html"
-    },
-    {
-        "title": "年上の彼との【相談】別れのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との別れのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.24",
-        "url": "posts/breakup-trouble-with-older-man-20260424.html"
-    },
-    {
-        "title": "同僚との【相談】ファッション・服装の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚とのファッション・服装の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.24",
-        "url": "posts/fashion-psychology-with-cowork-20260424.html"
-    },
-    {
-        "title": "別れた後の【相談】嫉妬のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の嫉妬のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.24",
-        "url": "posts/jealousy-trouble-after-breakup-20260424.html"
-    },
-    {
-        "title": "年上の彼との【相談】ファッション・服装の対策について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのファッション・服装の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.24",
-        "url": "posts/fashion-strategy-with-older-ma-20260424.html"
-    },
-    {
-        "title": "同僚との【相談】お金の悩みのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "同僚とのお金の悩みのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.24",
-        "url": "posts/money-advice-with-coworker-20260424.html"
-    },
-    {
-        "title": "年上の彼との【相談】コミュニケーションのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのコミュニケーションのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.23",
-        "url": "posts/communication-trouble-with-old-20260423.html"
-    },
-    {
-        "title": "友達との【相談】自己研鑽・自分磨きの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との自己研鑽・自分磨きの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.23",
-        "url": "posts/self-improvement-strategy-with-20260423.html"
-    },
-    {
-        "title": "付き合って1年の【相談】お金の悩みの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のお金の悩みの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.23",
-        "url": "posts/money-anxiety-after-1-year-20260423.html"
-    },
-    {
-        "title": "夜の【相談】元彼の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の元彼の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.23",
-        "url": "posts/ex-boyfriend-mistake-late-at-n-20260423.html"
-    },
-    {
-        "title": "年下の彼との【相談】コミュニケーションのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼とのコミュニケーションのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.23",
-        "url": "posts/communication-advice-with-youn-20260423.html"
-    },
-    {
-        "title": "付き合って1年の【相談】結婚の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の結婚の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.22",
-        "url": "posts/marriage-regret-after-1-year-20260422.html"
-    },
-    {
-        "title": "付き合って1年の【相談】片思いの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の片思いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.22",
-        "url": "posts/unrequited-love-mistake-after--20260422.html"
-    },
-    {
-        "title": "夜の【相談】ファッション・服装の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "夜のファッション・服装の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.22",
-        "url": "posts/fashion-regret-late-at-night-20260422.html"
-    },
-    {
-        "title": "付き合って1年の【相談】自己研鑽・自分磨きのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の自己研鑽・自分磨きのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.22",
-        "url": "posts/self-improvement-trouble-after-20260422.html"
-    },
-    {
-        "title": "年下の彼との【相談】片思いの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との片思いの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.22",
-        "url": "posts/unrequited-love-anxiety-with-y-20260422.html"
-    },
-    {
-        "title": "年下の彼との【相談】義実家・親戚付き合いの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との義実家・親戚付き合いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.21",
-        "url": "posts/in-laws-panic-with-younger-man-20260421.html"
-    },
-    {
-        "title": "結婚前の【相談】LINEのメッセージの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のLINEのメッセージの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.21",
-        "url": "posts/line-message-mistake-before-ma-20260421.html"
-    },
-    {
-        "title": "別れた後の【相談】LINEのメッセージの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後のLINEのメッセージの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.21",
-        "url": "posts/line-message-mistake-after-bre-20260421.html"
-    },
-    {
-        "title": "夜の【相談】嫉妬の秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の嫉妬の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.21",
-        "url": "posts/jealousy-secret-late-at-night-20260421.html"
-    },
-    {
-        "title": "年下の彼との【相談】片思いの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との片思いの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.21",
-        "url": "posts/unrequited-love-psychology-wit-20260421.html"
-    },
-    {
-        "title": "年下の彼との【相談】コミュニケーションの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼とのコミュニケーションの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.20",
-        "url": "posts/communication-mistake-with-you-20260420.html"
-    },
-    {
-        "title": "年上の彼との【相談】遠距離恋愛の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との遠距離恋愛の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.20",
-        "url": "posts/long-distance-success-tip-with-20260420.html"
-    },
-    {
-        "title": "年上の彼との【相談】ファッション・服装のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのファッション・服装のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.20",
-        "url": "posts/fashion-trouble-with-older-man-20260420.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】結婚の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の結婚の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.20",
-        "url": "posts/marriage-mistake-after-3-month-20260420.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】夜の生活・性生活の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の夜の生活・性生活の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.20",
-        "url": "posts/sex-life-anxiety-after-3-month-20260420.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "別れた後の社内恋愛の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.19",
-        "url": "posts/office-romance-strategy-after--20260419.html"
-    },
-    {
-        "title": "結婚前の【相談】お金の悩みのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のお金の悩みのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.19",
-        "url": "posts/money-trouble-before-marriage-20260419.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "仕事中の初デートの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.19",
-        "url": "posts/first-date-regret-during-work-20260419.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "同僚との社内恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.19",
-        "url": "posts/office-romance-panic-with-cowo-20260419.html"
-    },
-    {
-        "title": "結婚前の【相談】片思いのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の片思いのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.19",
-        "url": "posts/unrequited-love-advice-before--20260419.html"
-    },
-    {
-        "title": "同僚との【相談】不信感・信頼関係の悩みの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との不信感・信頼関係の悩みの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.18",
-        "url": "posts/trust-issues-strategy-with-cow-20260418.html"
-    },
-    {
-        "title": "友達との【相談】別れの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との別れの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.18",
-        "url": "posts/breakup-psychology-with-friend-20260418.html"
-    },
-    {
-        "title": "結婚前の【相談】遠距離恋愛の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の遠距離恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.18",
-        "url": "posts/long-distance-panic-before-mar-20260418.html"
-    },
-    {
-        "title": "結婚前の【相談】セフレ・都合のいい関係の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のセフレ・都合のいい関係の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.18",
-        "url": "posts/friends-with-benefits-panic-be-20260418.html"
-    },
-    {
-        "title": "仕事中の【相談】義実家・親戚付き合いの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の義実家・親戚付き合いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.18",
-        "url": "posts/in-laws-mistake-during-work-20260418.html"
-    },
-    {
-        "title": "年上の彼との【相談】LINEのメッセージのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのLINEのメッセージのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.17",
-        "url": "posts/line-message-trouble-with-olde-20260417.html"
-    },
-    {
-        "title": "結婚前の【相談】マッチングアプリの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のマッチングアプリの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.17",
-        "url": "posts/dating-app-regret-before-marri-20260417.html"
-    },
-    {
-        "title": "付き合って1年の【相談】マッチングアプリの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のマッチングアプリの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.17",
-        "url": "posts/dating-app-anxiety-after-1-yea-20260417.html"
-    },
-    {
-        "title": "付き合って1年の【相談】嫉妬の秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の嫉妬の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.17",
-        "url": "posts/jealousy-secret-after-1-year-20260417.html"
-    },
-    {
-        "title": "付き合って1年の【相談】cheatingの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のcheatingの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.17",
-        "url": "posts/cheating-secret-after-1-year-20260417.html"
-    },
-    {
-        "title": "付き合って1年の【相談】不信感・信頼関係の悩みの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の不信感・信頼関係の悩みの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.16",
-        "url": "posts/trust-issues-secret-after-1-ye-20260416.html"
-    },
-    {
-        "title": "同僚との【相談】浮気のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との浮気のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.16",
-        "url": "posts/cheating-trouble-with-coworker-20260416.html"
-    },
-    {
-        "title": "付き合って1年の【相談】マッチングアプリのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のマッチングアプリのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.16",
-        "url": "posts/dating-app-advice-after-1-year-20260416.html"
-    },
-    {
-        "title": "仕事中の【相談】義実家・親戚付き合いの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の義実家・親戚付き合いの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.16",
-        "url": "posts/in-laws-regret-during-work-20260416.html"
-    },
-    {
-        "title": "仕事中の【相談】コミュニケーションの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中のコミュニケーションの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.16",
-        "url": "posts/communication-panic-during-wor-20260416.html"
-    },
-    {
-        "title": "結婚前の【相談】不信感・信頼関係の悩みの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の不信感・信頼関係の悩みの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.15",
-        "url": "posts/trust-issues-strategy-before-m-20260415.html"
-    },
-    {
-        "title": "友達との【相談】義実家・親戚付き合いの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との義実家・親戚付き合いの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.15",
-        "url": "posts/in-laws-psychology-with-friend-20260415.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "結婚前の初デートの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.15",
-        "url": "posts/first-date-anxiety-before-marr-20260415.html"
-    },
-    {
-        "title": "仕事中の【相談】ファッション・服装の秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中のファッション・服装の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.15",
-        "url": "posts/fashion-secret-during-work-20260415.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】片思いの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の片思いの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.15",
-        "url": "posts/unrequited-love-success-tip-af-20260415.html"
-    },
-    {
-        "title": "年下の彼との【相談】不信感・信頼関係の悩みの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との不信感・信頼関係の悩みの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.14",
-        "url": "posts/trust-issues-regret-with-young-20260414.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "付き合って1年の社内恋愛の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.14",
-        "url": "posts/office-romance-secret-after-1--20260414.html"
-    },
-    {
-        "title": "結婚前の【相談】遠距離恋愛のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の遠距離恋愛のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.14",
-        "url": "posts/long-distance-trouble-before-m-20260414.html"
-    },
-    {
-        "title": "友達との【相談】別れの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との別れの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.14",
-        "url": "posts/breakup-secret-with-friend-20260414.html"
-    },
-    {
-        "title": "仕事中の【相談】元彼の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の元彼の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.14",
-        "url": "posts/ex-boyfriend-psychology-during-20260414.html"
-    },
-    {
-        "title": "友達との【相談】自己研鑽・自分磨きの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との自己研鑽・自分磨きの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.13",
-        "url": "posts/self-improvement-anxiety-with--20260413.html"
-    },
-    {
-        "title": "年下の彼との【相談】コミュニケーションの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼とのコミュニケーションの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.13",
-        "url": "posts/communication-success-tip-with-20260413.html"
-    },
-    {
-        "title": "同僚との【相談】不信感・信頼関係の悩みの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との不信感・信頼関係の悩みの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.13",
-        "url": "posts/trust-issues-success-tip-with--20260413.html"
-    },
-    {
-        "title": "結婚前の【相談】遠距離恋愛の対策について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の遠距離恋愛の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.13",
-        "url": "posts/long-distance-strategy-before--20260413.html"
-    },
-    {
-        "title": "結婚前の【相談】元彼の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の元彼の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.13",
-        "url": "posts/ex-boyfriend-anxiety-before-ma-20260413.html"
-    },
-    {
-        "title": "仕事中の【相談】遠距離恋愛の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の遠距離恋愛の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.12",
-        "url": "posts/long-distance-mistake-during-w-20260412.html"
-    },
-    {
-        "title": "夜の【相談】結婚の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の結婚の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.12",
-        "url": "posts/marriage-success-tip-late-at-n-20260412.html"
-    },
-    {
-        "title": "付き合って1年の【相談】不信感・信頼関係の悩みの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の不信感・信頼関係の悩みの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.12",
-        "url": "posts/trust-issues-psychology-after--20260412.html"
-    },
-    {
-        "title": "別れた後の【相談】遠距離恋愛の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の遠距離恋愛の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.12",
-        "url": "posts/long-distance-regret-after-bre-20260412.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】cheatingの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月のcheatingの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.12",
-        "url": "posts/cheating-mistake-after-3-month-20260412.html"
-    },
-    {
-        "title": "別れた後の【相談】片思いの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の片思いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.11",
-        "url": "posts/unrequited-love-panic-after-br-20260411.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "年上の彼との初デートのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.11",
-        "url": "posts/first-date-trouble-with-older--20260411.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "別れた後の年の差のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.11",
-        "url": "posts/age-gap-trouble-after-breakup-20260411.html"
-    },
-    {
-        "title": "別れた後の【相談】自己研鑽・自分磨きのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の自己研鑽・自分磨きのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.11",
-        "url": "posts/self-improvement-trouble-after-20260411.html"
-    },
-    {
-        "title": "同僚との【相談】セフレ・都合のいい関係の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚とのセフレ・都合のいい関係の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.11",
-        "url": "posts/friends-with-benefits-psycholo-20260411.html"
-    },
-    {
-        "title": "同僚との【相談】LINEのメッセージの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚とのLINEのメッセージの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.10",
-        "url": "posts/line-message-anxiety-with-cowo-20260410.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "同僚との社内恋愛の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.10",
-        "url": "posts/office-romance-psychology-with-20260410.html"
-    },
-    {
-        "title": "夜の【相談】お金の悩みの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "夜のお金の悩みの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.10",
-        "url": "posts/money-secret-late-at-night-20260410.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】元彼のアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の元彼のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.10",
-        "url": "posts/ex-boyfriend-advice-after-3-mo-20260410.html"
-    },
-    {
-        "title": "夜の【相談】お金の悩みの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "夜のお金の悩みの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.10",
-        "url": "posts/money-anxiety-late-at-night-20260410.html"
-    },
-    {
-        "title": "年下の彼との【相談】結婚の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との結婚の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.09",
-        "url": "posts/marriage-mistake-with-younger--20260409.html"
-    },
-    {
-        "title": "別れた後の【相談】夜の生活・性生活のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の夜の生活・性生活のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.09",
-        "url": "posts/sex-life-trouble-after-breakup-20260409.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "付き合って1年の年の差の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.09",
-        "url": "posts/age-gap-psychology-after-1-yea-20260409.html"
-    },
-    {
-        "title": "結婚前の【相談】遠距離恋愛の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の遠距離恋愛の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.09",
-        "url": "posts/long-distance-anxiety-before-m-20260409.html"
-    },
-    {
-        "title": "年上の彼との【相談】セフレ・都合のいい関係の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのセフレ・都合のいい関係の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.09",
-        "url": "posts/friends-with-benefits-anxiety--20260409.html"
-    },
-    {
-        "title": "夜の【相談】別れの切り出し方について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の別れの切り出し方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.08",
-        "url": "posts/breakup-strategy-late-at-night-20260408.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "付き合って3ヶ月の初デートの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.08",
-        "url": "posts/first-date-regret-after-3-mont-20260408.html"
-    },
-    {
-        "title": "同僚との【相談】夜の生活・性生活のアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との夜の生活・性生活のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.08",
-        "url": "posts/sex-life-advice-with-coworker-20260408.html"
-    },
-    {
-        "title": "年上の彼との【相談】ファッション・服装の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのファッション・服装の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.08",
-        "url": "posts/fashion-mistake-with-older-man-20260408.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "年下の彼との社内恋愛のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.08",
-        "url": "posts/office-romance-trouble-with-yo-20260408.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "年下の彼との年の差の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.07",
-        "url": "posts/age-gap-psychology-with-younge-20260407.html"
-    },
-    {
-        "title": "友達との【相談】結婚の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との結婚の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.07",
-        "url": "posts/marriage-success-tip-with-frie-20260407.html"
-    },
-    {
-        "title": "友達との【相談】自己研鑽・自分磨きの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との自己研鑽・自分磨きの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.07",
-        "url": "posts/self-improvement-psychology-wi-20260407.html"
-    },
-    {
-        "title": "同僚との【相談】不信感・信頼関係の悩みのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との不信感・信頼関係の悩みのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.07",
-        "url": "posts/trust-issues-advice-with-cowor-20260407.html"
-    },
-    {
-        "title": "別れた後の【相談】自己研鑽・自分磨きの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の自己研鑽・自分磨きの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.07",
-        "url": "posts/self-improvement-regret-after--20260407.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "結婚前の初デートの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.06",
-        "url": "posts/first-date-strategy-before-mar-20260406.html"
-    },
-    {
-        "title": "同僚との【相談】浮気の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との浮気の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.06",
-        "url": "posts/cheating-success-tip-with-cowo-20260406.html"
-    },
-    {
-        "title": "夜の【相談】自己研鑽・自分磨きのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜の自己研鑽・自分磨きのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.06",
-        "url": "posts/self-improvement-advice-late-a-20260406.html"
-    },
-    {
-        "title": "結婚前の【相談】ファッション・服装の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のファッション・服装の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.06",
-        "url": "posts/fashion-mistake-before-marriag-20260406.html"
-    },
-    {
-        "title": "結婚前の【相談】ファッション・服装の対策について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のファッション・服装の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.06",
-        "url": "posts/fashion-strategy-before-marria-20260406.html"
-    },
-    {
-        "title": "仕事中の【相談】お金の悩みの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中のお金の悩みの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.05",
-        "url": "posts/money-psychology-during-work-20260405.html"
-    },
-    {
-        "title": "友達との【相談】別れの切り出し方について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との別れの切り出し方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.05",
-        "url": "posts/breakup-strategy-with-friend-20260405.html"
-    },
-    {
-        "title": "年下の彼との【相談】結婚のアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との結婚のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.05",
-        "url": "posts/marriage-advice-with-younger-m-20260405.html"
-    },
-    {
-        "title": "同僚との【相談】ファッション・服装の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚とのファッション・服装の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.05",
-        "url": "posts/fashion-anxiety-with-coworker-20260405.html"
-    },
-    {
-        "title": "夜の【相談】元彼の対策について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の元彼の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.05",
-        "url": "posts/ex-boyfriend-strategy-late-at--20260405.html"
-    },
-    {
-        "title": "結婚前の【相談】お金の悩みの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のお金の悩みの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.04",
-        "url": "posts/money-mistake-before-marriage-20260404.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "結婚前の年の差の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.04",
-        "url": "posts/age-gap-mistake-before-marriag-20260404.html"
-    },
-    {
-        "title": "年下の彼との【相談】元彼の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との元彼の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.04",
-        "url": "posts/ex-boyfriend-regret-with-young-20260404.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "別れた後の初デートの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.04",
-        "url": "posts/first-date-success-tip-after-b-20260404.html"
-    },
-    {
-        "title": "年上の彼との【相談】コミュニケーションのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのコミュニケーションのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.04",
-        "url": "posts/communication-advice-with-olde-20260404.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】コミュニケーションのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月のコミュニケーションのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.03",
-        "url": "posts/communication-advice-after-3-m-20260403.html"
-    },
-    {
-        "title": "結婚前の【相談】セフレ・都合のいい関係のアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のセフレ・都合のいい関係のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.03",
-        "url": "posts/friends-with-benefits-advice-b-20260403.html"
-    },
-    {
-        "title": "年下の彼との【相談】義実家・親戚付き合いの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との義実家・親戚付き合いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.03",
-        "url": "posts/in-laws-mistake-with-younger-m-20260403.html"
-    },
-    {
-        "title": "結婚前の【相談】セフレ・都合のいい関係の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のセフレ・都合のいい関係の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.03",
-        "url": "posts/friends-with-benefits-psycholo-20260403.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "夜の社内恋愛の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.03",
-        "url": "posts/office-romance-success-tip-lat-20260403.html"
-    },
-    {
-        "title": "同僚との【相談】お金の悩みのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "同僚とのお金の悩みのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.02",
-        "url": "posts/money-trouble-with-coworker-20260402.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】別れのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の別れのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.02",
-        "url": "posts/breakup-trouble-after-3-months-20260402.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "年下の彼との社内恋愛の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.02",
-        "url": "posts/office-romance-strategy-with-y-20260402.html"
-    },
-    {
-        "title": "仕事中の【相談】不信感・信頼関係の悩みの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の不信感・信頼関係の悩みの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.02",
-        "url": "posts/trust-issues-psychology-during-20260402.html"
-    },
-    {
-        "title": "年下の彼との【相談】義実家・親戚付き合いの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との義実家・親戚付き合いの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.02",
-        "url": "posts/in-laws-regret-with-younger-ma-20260402.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "結婚前の社内恋愛の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.01",
-        "url": "posts/office-romance-success-tip-bef-20260401.html"
-    },
-    {
-        "title": "友達との【相談】遠距離恋愛の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との遠距離恋愛の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.01",
-        "url": "posts/long-distance-regret-with-frie-20260401.html"
-    },
-    {
-        "title": "年上の彼との【相談】セフレ・都合のいい関係の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのセフレ・都合のいい関係の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.01",
-        "url": "posts/friends-with-benefits-regret-w-20260401.html"
-    },
-    {
-        "title": "夜の【相談】お金の悩みの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "夜のお金の悩みの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.01",
-        "url": "posts/money-success-tip-late-at-nigh-20260401.html"
-    },
-    {
-        "title": "夜の【相談】自己研鑽・自分磨きの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の自己研鑽・自分磨きの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.04.01",
-        "url": "posts/self-improvement-psychology-la-20260401.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "結婚前の年の差の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.31",
-        "url": "posts/age-gap-psychology-before-marr-20260331.html"
-    },
-    {
-        "title": "夜の【相談】不信感・信頼関係の悩みの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の不信感・信頼関係の悩みの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.31",
-        "url": "posts/trust-issues-secret-late-at-ni-20260331.html"
-    },
-    {
-        "title": "年下の彼との【相談】片思いの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との片思いの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.31",
-        "url": "posts/unrequited-love-success-tip-wi-20260331.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】自己研鑽・自分磨きのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の自己研鑽・自分磨きのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.31",
-        "url": "posts/self-improvement-trouble-after-20260331.html"
-    },
-    {
-        "title": "同僚との【相談】結婚の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との結婚の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.31",
-        "url": "posts/marriage-regret-with-coworker-20260331.html"
-    },
-    {
-        "title": "別れた後の【相談】お金の悩みのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後のお金の悩みのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.30",
-        "url": "posts/money-trouble-after-breakup-20260330.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "付き合って3ヶ月の年の差の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.30",
-        "url": "posts/age-gap-mistake-after-3-months-20260330.html"
-    },
-    {
-        "title": "付き合って1年の【相談】遠距離恋愛の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の遠距離恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.30",
-        "url": "posts/long-distance-panic-after-1-ye-20260330.html"
-    },
-    {
-        "title": "結婚前の【相談】コミュニケーション戦略について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のコミュニケーション戦略についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.30",
-        "url": "posts/communication-strategy-before--20260330.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "同僚との年の差の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.30",
-        "url": "posts/age-gap-panic-with-coworker-20260330.html"
-    },
-    {
-        "title": "付き合って1年の【相談】自己研鑽・自分磨きの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の自己研鑽・自分磨きの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.29",
-        "url": "posts/self-improvement-panic-after-1-20260329.html"
-    },
-    {
-        "title": "結婚前の【相談】結婚の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の結婚の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.29",
-        "url": "posts/marriage-success-tip-before-ma-20260329.html"
-    },
-    {
-        "title": "年下の彼との【相談】夜の生活・性生活のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との夜の生活・性生活のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.29",
-        "url": "posts/sex-life-trouble-with-younger--20260329.html"
-    },
-    {
-        "title": "仕事中の【相談】お金の悩みの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中のお金の悩みの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.29",
-        "url": "posts/money-panic-during-work-20260329.html"
-    },
-    {
-        "title": "付き合って1年の【相談】マッチングアプリの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のマッチングアプリの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.29",
-        "url": "posts/dating-app-success-tip-after-1-20260329.html"
-    },
-    {
-        "title": "同僚との【相談】嫉妬の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との嫉妬の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.28",
-        "url": "posts/jealousy-anxiety-with-coworker-20260328.html"
-    },
-    {
-        "title": "夜の【相談】ファッション・服装の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜のファッション・服装の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.28",
-        "url": "posts/fashion-panic-late-at-night-20260328.html"
-    },
-    {
-        "title": "付き合って1年の【相談】LINEのメッセージの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のLINEのメッセージの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.28",
-        "url": "posts/line-message-strategy-after-1--20260328.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】夜の生活・性生活の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の夜の生活・性生活の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.28",
-        "url": "posts/sex-life-success-tip-after-3-m-20260328.html"
-    },
-    {
-        "title": "付き合って1年の【相談】元彼の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の元彼の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.28",
-        "url": "posts/ex-boyfriend-psychology-after--20260328.html"
-    },
-    {
-        "title": "年下の彼との【相談】嫉妬対策について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との嫉妬対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.27",
-        "url": "posts/jealousy-strategy-with-younger-20260327.html"
-    },
-    {
-        "title": "友達との【相談】義実家・親戚付き合いの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との義実家・親戚付き合いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.27",
-        "url": "posts/in-laws-mistake-with-friend-20260327.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】遠距離恋愛の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の遠距離恋愛の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.27",
-        "url": "posts/long-distance-success-tip-afte-20260327.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】不信感・信頼関係の悩みの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の不信感・信頼関係の悩みの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.27",
-        "url": "posts/trust-issues-mistake-after-3-m-20260327.html"
-    },
-    {
-        "title": "別れた後の【相談】浮気の相談について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の浮気の相談についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.27",
-        "url": "posts/cheating-advice-after-breakup-20260327.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "別れた後の社内恋愛の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.26",
-        "url": "posts/office-romance-psychology-afte-20260326.html"
-    },
-    {
-        "title": "付き合って1年の【相談】マッチングアプリの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のマッチングアプリの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.26",
-        "url": "posts/dating-app-panic-after-1-year-20260326.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】ファッション・服装の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月のファッション・服装の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.26",
-        "url": "posts/fashion-mistake-after-3-months-20260326.html"
-    },
-    {
-        "title": "付き合って1年の【相談】別れの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の別れの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.26",
-        "url": "posts/breakup-panic-after-1-year-20260326.html"
-    },
-    {
-        "title": "結婚前の【相談】嫉妬へのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の嫉妬へのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.26",
-        "url": "posts/jealousy-advice-before-marriag-20260326.html"
-    },
-    {
-        "title": "年下の彼との【相談】嫉妬の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との嫉妬の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.25",
-        "url": "posts/jealousy-psychology-with-young-20260325.html"
-    },
-    {
-        "title": "付き合って1年の【相談】嫉妬克服のコツについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の嫉妬克服のコツについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.25",
-        "url": "posts/jealousy-success-tip-after-1-y-20260325.html"
-    },
-    {
-        "title": "別れた後の【相談】LINEのメッセージの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後のLINEのメッセージの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.25",
-        "url": "posts/line-message-strategy-after-br-20260325.html"
-    },
-    {
-        "title": "仕事中の【相談】自己研鑽・自分磨きの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の自己研鑽・自分磨きの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.25",
-        "url": "posts/self-improvement-strategy-duri-20260325.html"
-    },
-    {
-        "title": "別れた後の【相談】結婚の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の結婚の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.25",
-        "url": "posts/marriage-regret-after-breakup-20260325.html"
-    },
-    {
-        "title": "付き合って1年の【相談】元彼のアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の元彼のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.24",
-        "url": "posts/ex-boyfriend-advice-after-1-ye-20260324.html"
-    },
-    {
-        "title": "年下の彼との【相談】夜の生活・性生活の対策について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との夜の生活・性生活の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.24",
-        "url": "posts/sex-life-strategy-with-younger-20260324.html"
-    },
-    {
-        "title": "夜の【相談】浮気の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の浮気の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.24",
-        "url": "posts/cheating-psychology-late-at-ni-20260324.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "別れた後の年の差の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.24",
-        "url": "posts/age-gap-regret-after-breakup-20260324.html"
-    },
-    {
-        "title": "夜の【相談】LINEのメッセージのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜のLINEのメッセージのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.24",
-        "url": "posts/line-message-trouble-late-at-n-20260324.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "結婚前の社内恋愛の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.23",
-        "url": "posts/office-romance-anxiety-before--20260323.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】夜の生活・性生活の秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の夜の生活・性生活の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.23",
-        "url": "posts/sex-life-secret-after-3-months-20260323.html"
-    },
-    {
-        "title": "友達との【相談】お金の悩みのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "友達とのお金の悩みのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.23",
-        "url": "posts/money-advice-with-friend-20260323.html"
-    },
-    {
-        "title": "年下の彼との【相談】義実家・親戚付き合いの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との義実家・親戚付き合いの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.23",
-        "url": "posts/in-laws-psychology-with-younge-20260323.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】夜の生活・性生活の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の夜の生活・性生活の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.23",
-        "url": "posts/sex-life-mistake-after-3-month-20260323.html"
-    },
-    {
-        "title": "友達との【相談】LINEのメッセージの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "友達とのLINEのメッセージの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.22",
-        "url": "posts/line-message-regret-with-frien-20260322.html"
-    },
-    {
-        "title": "付き合って1年の【相談】浮気対策について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の浮気対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.22",
-        "url": "posts/cheating-strategy-after-1-year-20260322.html"
-    },
-    {
-        "title": "別れた後の【相談】浮気への不安について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の浮気への不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.22",
-        "url": "posts/cheating-anxiety-after-breakup-20260322.html"
-    },
-    {
-        "title": "付き合って1年の【相談】自己研鑽・自分磨きの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の自己研鑽・自分磨きの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.22",
-        "url": "posts/self-improvement-mistake-after-20260322.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】元彼の対策について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の元彼の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.22",
-        "url": "posts/ex-boyfriend-strategy-after-3--20260322.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "夜の社内恋愛の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.21",
-        "url": "posts/office-romance-secret-late-at--20260321.html"
-    },
-    {
-        "title": "仕事中の【相談】不信感・信頼関係の悩みの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の不信感・信頼関係の悩みの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.21",
-        "url": "posts/trust-issues-anxiety-during-wo-20260321.html"
-    },
-    {
-        "title": "年上の彼との【相談】義実家・親戚付き合いの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との義実家・親戚付き合いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.21",
-        "url": "posts/in-laws-mistake-with-older-man-20260321.html"
-    },
-    {
-        "title": "付き合って1年の【相談】マッチングアプリの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のマッチングアプリの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.21",
-        "url": "posts/dating-app-regret-after-1-year-20260321.html"
-    },
-    {
-        "title": "年下の彼との【相談】片思いの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との片思いの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.21",
-        "url": "posts/unrequited-love-strategy-with--20260321.html"
-    },
-    {
-        "title": "付き合って1年の【相談】別れのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の別れのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.20",
-        "url": "posts/breakup-advice-after-1-year-20260320.html"
-    },
-    {
-        "title": "年下の彼との【相談】夜の生活・性生活の秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との夜の生活・性生活の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.20",
-        "url": "posts/sex-life-secret-with-younger-m-20260320.html"
-    },
-    {
-        "title": "付き合って1年の【相談】セフレ・都合のいい関係の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のセフレ・都合のいい関係の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.20",
-        "url": "posts/friends-with-benefits-psycholo-20260320.html"
-    },
-    {
-        "title": "年下の彼との【相談】元彼の秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との元彼の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.20",
-        "url": "posts/ex-boyfriend-secret-with-young-20260320.html"
-    },
-    {
-        "title": "夜の【相談】浮気のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜の浮気のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.20",
-        "url": "posts/cheating-trouble-late-at-night-20260320.html"
-    },
-    {
-        "title": "別れた後の【相談】マッチングアプリの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後のマッチングアプリの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.19",
-        "url": "posts/dating-app-strategy-after-brea-20260319.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "付き合って3ヶ月の社内恋愛の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.19",
-        "url": "posts/office-romance-mistake-after-3-20260319.html"
-    },
-    {
-        "title": "夜の【相談】別れの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の別れの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.19",
-        "url": "posts/breakup-mistake-late-at-night-20260319.html"
-    },
-    {
-        "title": "仕事中の【相談】LINEのメッセージの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中のLINEのメッセージの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.19",
-        "url": "posts/line-message-mistake-during-wo-20260319.html"
-    },
-    {
-        "title": "別れた後の【相談】義実家・親戚付き合いの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の義実家・親戚付き合いの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.19",
-        "url": "posts/in-laws-regret-after-breakup-20260319.html"
-    },
-    {
-        "title": "年上の彼との【相談】夜の生活・性生活の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との夜の生活・性生活の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.18",
-        "url": "posts/sex-life-panic-with-older-man-20260318.html"
-    },
-    {
-        "title": "年下の彼との【相談】マッチングアプリのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼とのマッチングアプリのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.18",
-        "url": "posts/dating-app-advice-with-younger-20260318.html"
-    },
-    {
-        "title": "結婚前の【相談】夜の生活・性生活の秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の夜の生活・性生活の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.18",
-        "url": "posts/sex-life-secret-before-marriag-20260318.html"
-    },
-    {
-        "title": "年下の彼との【相談】義実家・親戚付き合いの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との義実家・親戚付き合いの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.18",
-        "url": "posts/in-laws-strategy-with-younger--20260318.html"
-    },
-    {
-        "title": "年上の彼との【相談】ファッション・服装の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのファッション・服装の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.18",
-        "url": "posts/fashion-panic-with-older-man-20260318.html"
-    },
-    {
-        "title": "友達との【相談】嫉妬のトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "友達との嫉妬のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.17",
-        "url": "posts/jealousy-trouble-with-friend-20260317.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】ファッション・服装の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月のファッション・服装の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.17",
-        "url": "posts/fashion-psychology-after-3-mon-20260317.html"
-    },
-    {
-        "title": "別れた後の【相談】別れの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の別れの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.17",
-        "url": "posts/breakup-success-tip-after-brea-20260317.html"
-    },
-    {
-        "title": "年上の彼との【相談】浮気の相談について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との浮気の相談についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.17",
-        "url": "posts/cheating-advice-with-older-man-20260317.html"
-    },
-    {
-        "title": "仕事中の【相談】夜の生活・性生活の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の夜の生活・性生活の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.17",
-        "url": "posts/sex-life-panic-during-work-20260317.html"
-    },
-    {
-        "title": "仕事中の【相談】マッチングアプリの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中のマッチングアプリの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.16",
-        "url": "posts/dating-app-secret-during-work-20260316.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "友達との年の差の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.16",
-        "url": "posts/age-gap-secret-with-friend-20260316.html"
-    },
-    {
-        "title": "年下の彼との【相談】LINEのメッセージの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼とのLINEのメッセージの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.16",
-        "url": "posts/line-message-strategy-with-you-20260316.html"
-    },
-    {
-        "title": "友達との【相談】義実家・親戚付き合いの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "友達との義実家・親戚付き合いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.16",
-        "url": "posts/in-laws-panic-with-friend-20260316.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "年下の彼との初デートの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.16",
-        "url": "posts/first-date-psychology-with-you-20260316.html"
-    },
-    {
-        "title": "仕事中の【相談】コミュニケーション戦略について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中のコミュニケーション戦略についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.15",
-        "url": "posts/communication-strategy-during--20260315.html"
-    },
-    {
-        "title": "年上の彼との【相談】ファッション・服装の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのファッション・服装の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.15",
-        "url": "posts/fashion-regret-with-older-man-20260315.html"
-    },
-    {
-        "title": "友達との【相談】ファッション・服装の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "友達とのファッション・服装の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.15",
-        "url": "posts/fashion-panic-with-friend-20260315.html"
-    },
-    {
-        "title": "友達との【相談】嫉妬の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との嫉妬の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.15",
-        "url": "posts/jealousy-anxiety-with-friend-20260315.html"
-    },
-    {
-        "title": "付き合って1年の【相談】自己研鑽・自分磨きの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の自己研鑽・自分磨きの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.15",
-        "url": "posts/self-improvement-secret-after--20260315.html"
-    },
-    {
-        "title": "年上の彼との【相談】セフレ・都合のいい関係の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのセフレ・都合のいい関係の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.14",
-        "url": "posts/friends-with-benefits-panic-wi-20260314.html"
-    },
-    {
-        "title": "結婚前の【相談】お金の悩みの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のお金の悩みの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.14",
-        "url": "posts/money-anxiety-before-marriage-20260314.html"
-    },
-    {
-        "title": "同僚との【相談】遠距離恋愛の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "同僚との遠距離恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.14",
-        "url": "posts/long-distance-panic-with-cowor-20260314.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】元彼の秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の元彼の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.14",
-        "url": "posts/ex-boyfriend-secret-after-3-mo-20260314.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "同僚との初デートの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.14",
-        "url": "posts/first-date-anxiety-with-cowork-20260314.html"
-    },
-    {
-        "title": "年下の彼との【相談】cheatingの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼とのcheatingの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.13",
-        "url": "posts/cheating-mistake-with-younger--20260313.html"
-    },
-    {
-        "title": "仕事中の【相談】自己研鑽・自分磨きの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の自己研鑽・自分磨きの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.13",
-        "url": "posts/self-improvement-success-tip-d-20260313.html"
-    },
-    {
-        "title": "年下の彼との【相談】別れの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との別れの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.13",
-        "url": "posts/breakup-panic-with-younger-man-20260313.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "夜の年の差の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.13",
-        "url": "posts/age-gap-secret-late-at-night-20260313.html"
-    },
-    {
-        "title": "年上の彼との【相談】セフレ・都合のいい関係の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのセフレ・都合のいい関係の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.13",
-        "url": "posts/friends-with-benefits-psycholo-20260313.html"
-    },
-    {
-        "title": "仕事中の【相談】コミュニケーションの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中のコミュニケーションの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.12",
-        "url": "posts/communication-regret-during-wo-20260312.html"
-    },
-    {
-        "title": "夜の【相談】お金の悩みの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜のお金の悩みの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.12",
-        "url": "posts/money-panic-late-at-night-20260312.html"
-    },
-    {
-        "title": "別れた後の【相談】結婚の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の結婚の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.12",
-        "url": "posts/marriage-psychology-after-brea-20260312.html"
-    },
-    {
-        "title": "別れた後の【相談】義実家・親戚付き合いの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の義実家・親戚付き合いの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.12",
-        "url": "posts/in-laws-psychology-after-break-20260312.html"
-    },
-    {
-        "title": "結婚前の【相談】セフレ・都合のいい関係の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のセフレ・都合のいい関係の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.12",
-        "url": "posts/friends-with-benefits-mistake--20260312.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】コミュニケーションの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月のコミュニケーションの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.11",
-        "url": "posts/communication-psychology-after-20260311.html"
-    },
-    {
-        "title": "年上の彼との【相談】お金の悩みの後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのお金の悩みの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.11",
-        "url": "posts/money-regret-with-older-man-20260311.html"
-    },
-    {
-        "title": "年下の彼との【相談】マッチングアプリの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼とのマッチングアプリの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.11",
-        "url": "posts/dating-app-panic-with-younger--20260311.html"
-    },
-    {
-        "title": "付き合って1年の【相談】マッチングアプリの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のマッチングアプリの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.11",
-        "url": "posts/dating-app-strategy-after-1-ye-20260311.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】コミュニケーションのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月のコミュニケーションのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.11",
-        "url": "posts/communication-trouble-after-3--20260311.html"
-    },
-    {
-        "title": "友達との【相談】別れの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "友達との別れの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.10",
-        "url": "posts/breakup-panic-with-friend-20260310.html"
-    },
-    {
-        "title": "年下の彼との【相談】義実家・親戚付き合いのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との義実家・親戚付き合いのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.10",
-        "url": "posts/in-laws-advice-with-younger-ma-20260310.html"
-    },
-    {
-        "title": "結婚前の【相談】自己研鑽・自分磨きの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の自己研鑽・自分磨きの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.10",
-        "url": "posts/self-improvement-anxiety-befor-20260310.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "年上の彼との初デートのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.10",
-        "url": "posts/first-date-advice-with-older-m-20260310.html"
-    },
-    {
-        "title": "友達との【相談】自己研鑽・自分磨きの失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "友達との自己研鑽・自分磨きの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.10",
-        "url": "posts/self-improvement-mistake-with--20260310.html"
-    },
-    {
-        "title": "同僚との【相談】お金の悩みの秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "同僚とのお金の悩みの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.09",
-        "url": "posts/money-secret-with-coworker-20260309.html"
-    },
-    {
-        "title": "付き合って1年の【相談】セフレ・都合のいい関係の後悔について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のセフレ・都合のいい関係の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.09",
-        "url": "posts/friends-with-benefits-regret-a-20260309.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "仕事中の初デートのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.09",
-        "url": "posts/first-date-advice-during-work-20260309.html"
-    },
-    {
-        "title": "付き合って1年の【相談】別れの不安について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年の別れの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.09",
-        "url": "posts/breakup-anxiety-after-1-year-20260309.html"
-    },
-    {
-        "title": "夜の【相談】元彼の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "夜の元彼の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.09",
-        "url": "posts/ex-boyfriend-psychology-late-a-20260309.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】自己研鑽・自分磨きの心理について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の自己研鑽・自分磨きの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.08",
-        "url": "posts/self-improvement-psychology-af-20260308.html"
-    },
-    {
-        "title": "夜の【相談】不信感・信頼関係の悩みのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "夜の不信感・信頼関係の悩みのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.08",
-        "url": "posts/trust-issues-advice-late-at-ni-20260308.html"
-    },
-    {
-        "title": "仕事中の【相談】浮気対策について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の浮気対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.08",
-        "url": "posts/cheating-strategy-during-work-20260308.html"
-    },
-    {
-        "title": "年下の彼との【相談】別れの解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との別れの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.08",
-        "url": "posts/breakup-success-tip-with-young-20260308.html"
-    },
-    {
-        "title": "仕事中の【相談】自己研鑽・自分磨きの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の自己研鑽・自分磨きの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.08",
-        "url": "posts/self-improvement-panic-during--20260308.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "付き合って1年の社内恋愛の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.07",
-        "url": "posts/office-romance-mistake-after-1-20260307.html"
-    },
-    {
-        "title": "結婚前の【相談】片思いのトラブルについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の片思いのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.07",
-        "url": "posts/unrequited-love-trouble-before-20260307.html"
-    },
-    {
-        "title": "年上の彼との【相談】元彼の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼との元彼の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.07",
-        "url": "posts/ex-boyfriend-psychology-with-o-20260307.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "付き合って1年の初デートの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.07",
-        "url": "posts/first-date-secret-after-1-year-20260307.html"
-    },
-    {
-        "title": "年下の彼との【相談】自己研鑽・自分磨きの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "年下の彼との自己研鑽・自分磨きの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.07",
-        "url": "posts/self-improvement-panic-with-yo-20260307.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "別れた後の初デートの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.06",
-        "url": "posts/first-date-panic-after-breakup-20260306.html"
-    },
-    {
-        "title": "別れた後の【相談】嫉妬の秘密について悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の嫉妬の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.06",
-        "url": "posts/jealousy-secret-after-breakup-20260306.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "夜の年の差の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.06",
-        "url": "posts/age-gap-panic-late-at-night-20260306.html"
-    },
-    {
-        "title": "付き合って3ヶ月の【相談】元彼の失敗について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って3ヶ月の元彼の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.06",
-        "url": "posts/ex-boyfriend-mistake-after-3-m-20260306.html"
-    },
-    {
-        "title": "仕事中の【相談】元彼の不安について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中の元彼の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.06",
-        "url": "posts/ex-boyfriend-anxiety-during-wo-20260306.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "同僚との年の差のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.05",
-        "url": "posts/age-gap-advice-with-coworker-20260305.html"
-    },
-    {
-        "title": "結婚前の【相談】結婚のアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前の結婚のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.05",
-        "url": "posts/marriage-advice-before-marriag-20260305.html"
-    },
-    {
-        "title": "別れた後の【相談】別れのアドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "別れた後の別れのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.05",
-        "url": "posts/breakup-advice-after-breakup-20260305.html"
-    },
-    {
-        "title": "付き合って1年の【相談】お金の悩みの対策について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合って1年のお金の悩みの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.05",
-        "url": "posts/money-strategy-after-1-year-20260305.html"
-    },
-    {
-        "title": "年上の彼との【相談】ファッション・服装の解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "年上の彼とのファッション・服装の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.05",
-        "url": "posts/fashion-success-tip-with-older-20260305.html"
-    },
-    {
-        "title": "【相談】付き合う上での境界線の引き方について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合う上での境界線の引き方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.04",
-        "url": "posts/boundaries-in-dating-20260304.html"
-    },
-    {
-        "title": "【相談】パートナー間の同意と尊重についてについて悩んでいます…ゆい姉さんの回答",
-        "description": "パートナー間の同意と尊重についてについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.04",
-        "url": "posts/consent-in-relationships-20260304.html"
-    },
-    {
-        "title": "【相談】安全なセクスティングのルールについて悩んでいます…ゆい姉さんの回答",
-        "description": "安全なセクスティングのルールについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.04",
-        "url": "posts/safe-sexting-practices-20260304.html"
-    },
-    {
-        "title": "【相談】なりすまし（キャットフィッシング） 兆候について悩んでいます…ゆい姉さんの回答",
-        "description": "なりすまし（キャットフィッシング） 兆候についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.04",
-        "url": "posts/catfishing-signs-20260304.html"
-    },
-    {
-        "title": "【相談】国際ロマンス詐欺の見分け方について悩んでいます…ゆい姉さんの回答",
-        "description": "国際ロマンス詐欺の見分け方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.04",
-        "url": "posts/how-to-spot-a-romance-scammer-20260304.html"
-    },
-    {
-        "title": "【相談】シニア世代のマッチングアプリ事情について悩んでいます…ゆい姉さんの回答",
-        "description": "シニア世代のマッチングアプリ事情についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.03",
-        "url": "posts/online-dating-for-seniors-20260303.html"
-    },
-    {
-        "title": "【相談】中高年の恋愛・デートのコツについて悩んでいます…ゆい姉さんの回答",
-        "description": "中高年の恋愛・デートのコツについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.03",
-        "url": "posts/senior-dating-tips-20260303.html"
-    },
-    {
-        "title": "【相談】50代からの恋愛について悩んでいます…ゆい姉さんの回答",
-        "description": "50代からの恋愛についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.03",
-        "url": "posts/dating-after-50-20260303.html"
-    },
-    {
-        "title": "【相談】40代からの恋愛について悩んでいます…ゆい姉さんの回答",
-        "description": "40代からの恋愛についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.03",
-        "url": "posts/dating-after-40-20260303.html"
-    },
-    {
-        "title": "【相談】シングルファザー・マザーの恋愛アドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "シングルファザー・マザーの恋愛アドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.03",
-        "url": "posts/single-parent-dating-advice-20260303.html"
-    },
-    {
-        "title": "【相談】継親（ステップファミリー）の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "継親（ステップファミリー）の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.02",
-        "url": "posts/step-parenting-challenges-20260302.html"
-    },
-    {
-        "title": "【相談】養子縁組を考える際のポイントについて悩んでいます…ゆい姉さんの回答",
-        "description": "養子縁組を考える際のポイントについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.02",
-        "url": "posts/adoption-considerations-20260302.html"
-    },
-    {
-        "title": "【相談】不妊治療の悩みとパートナーとの絆について悩んでいます…ゆい姉さんの回答",
-        "description": "不妊治療の悩みとパートナーとの絆についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.02",
-        "url": "posts/infertility-struggles-content-20260302.html"
-    },
-    {
-        "title": "【相談】子供を持たない選択をしたカップルの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "子供を持たない選択をしたカップルの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.02",
-        "url": "posts/childfree-by-choice-relationsh-20260302.html"
-    },
-    {
-        "title": "【相談】カップルの共同口座は作るべき？について悩んでいます…ゆい姉さんの回答",
-        "description": "カップルの共同口座は作るべき？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.02",
-        "url": "posts/should-we-have-a-joint-bank-ac-20260302.html"
-    },
-    {
-        "title": "【相談】結婚後の姓の変更：メリットとデメリットについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚後の姓の変更：メリットとデメリットについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.01",
-        "url": "posts/changing-last-name-pros-and-co-20260301.html"
-    },
-    {
-        "title": "結婚前の【相談】マリッジブルー（結婚前の不安）について悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前のマリッジブルー（結婚前の不安）についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.01",
-        "url": "posts/cold-feet-before-marriage-20260301.html"
-    },
-    {
-        "title": "【相談】結婚準備のストレスについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚準備のストレスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.01",
-        "url": "posts/wedding-planning-stress-20260301.html"
-    },
-    {
-        "title": "【相談】結婚前カウンセリングのメリットについて悩んでいます…ゆい姉さんの回答",
-        "description": "結婚前カウンセリングのメリットについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.01",
-        "url": "posts/premarital-counseling-benefits-20260301.html"
-    },
-    {
-        "title": "【相談】性的ファンタジーの共有についてについて悩んでいます…ゆい姉さんの回答",
-        "description": "性的ファンタジーの共有についてについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.03.01",
-        "url": "posts/talking-about-fantasies-20260301.html"
-    },
-    {
-        "title": "【相談】性的嗜好の話し合い方について悩んでいます…ゆい姉さんの回答",
-        "description": "性的嗜好の話し合い方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.28",
-        "url": "posts/kink-negotiation-for-beginners-20260228.html"
-    },
-    {
-        "title": "【相談】性欲が強いパートナーへの悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "性欲が強いパートナーへの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.28",
-        "url": "posts/high-libido-partner-advice-20260228.html"
-    },
-    {
-        "title": "【相談】セックスレス・性欲減退の悩みについて悩んでいます…ゆい姉さんの回答",
-        "description": "セックスレス・性欲減退の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.28",
-        "url": "posts/low-libido-partner-advice-20260228.html"
-    },
-    {
-        "title": "【相談】性の不一致について悩んでいます…ゆい姉さんの回答",
-        "description": "性の不一致についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.28",
-        "url": "posts/sexual-incompatibility-20260228.html"
-    },
-    {
-        "title": "【相談】重くならずに要望を伝える方法について悩んでいます…ゆい姉さんの回答",
-        "description": "重くならずに要望を伝える方法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.28",
-        "url": "posts/how-to-express-needs-without-n-20260228.html"
-    },
-    {
-        "title": "【相談】無視するパートナー（サイレント・トリートメント）への対処法について悩んでいます…ゆい姉さんの回答",
-        "description": "無視するパートナー（サイレント・トリートメント）への対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.27",
-        "url": "posts/silent-treatment-how-to-break--20260227.html"
-    },
-    {
-        "title": "【相談】関係を深めるための喧嘩のルールについて悩んでいます…ゆい姉さんの回答",
-        "description": "関係を深めるための喧嘩のルールについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.27",
-        "url": "posts/fighting-fair-in-relationships-20260227.html"
-    },
-    {
-        "title": "【相談】効果的な謝罪の方法について悩んでいます…ゆい姉さんの回答",
-        "description": "効果的な謝罪の方法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.27",
-        "url": "posts/how-to-apologize-effectively-20260227.html"
-    },
-    {
-        "title": "【相談】愛を伝える5つの方法（ラブランゲージ）について悩んでいます…ゆい姉さんの回答",
-        "description": "愛を伝える5つの方法（ラブランゲージ）についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.27",
-        "url": "posts/love-languages-explanation-20260227.html"
-    },
-    {
-        "title": "【相談】回避型愛着スタイルの人との付き合い方について悩んでいます…ゆい姉さんの回答",
-        "description": "回避型愛着スタイルの人との付き合い方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.27",
-        "url": "posts/avoidant-attachment-style-dati-20260227.html"
-    },
-    {
-        "title": "【相談】不安型愛着スタイルの恋愛アドバイスについて悩んでいます…ゆい姉さんの回答",
-        "description": "不安型愛着スタイルの恋愛アドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.26",
-        "url": "posts/anxious-attachment-style-advic-20260226.html"
-    },
-    {
-        "title": "【相談】見捨てられ不安の克服について悩んでいます…ゆい姉さんの回答",
-        "description": "見捨てられ不安の克服についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.26",
-        "url": "posts/fear-of-abandonment-20260226.html"
-    },
-    {
-        "title": "【相談】責任を負いたがらない男性の心理について悩んでいます…ゆい姉さんの回答",
-        "description": "責任を負いたがらない男性の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.26",
-        "url": "posts/commitment-issues-in-men-20260226.html"
-    },
-    {
-        "title": "【相談】親密になることへの恐怖心について悩んでいます…ゆい姉さんの回答",
-        "description": "親密になることへの恐怖心についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.26",
-        "url": "posts/fear-of-intimacy-20260226.html"
-    },
-    {
-        "title": "【相談】有害な恋愛後の自己肯定感の回復について悩んでいます…ゆい姉さんの回答",
-        "description": "有害な恋愛後の自己肯定感の回復についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.26",
-        "url": "posts/self-love-after-a-toxic-relati-20260226.html"
-    },
-    {
-        "title": "【相談】リバウンド・リレーションシップ（失恋直後の恋愛）はうまくいく？について悩んでいます…ゆい姉さんの回答",
-        "description": "リバウンド・リレーションシップ（失恋直後の恋愛）はうまくいく？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.25",
-        "url": "posts/rebound-relationships-do-they--20260225.html"
-    },
-    {
-        "title": "【相談】元彼を完全に断ち切る方法について悩んでいます…ゆい姉さんの回答",
-        "description": "元彼を完全に断ち切る方法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.25",
-        "url": "posts/how-to-block-an-ex-completely-20260225.html"
-    },
-    {
-        "title": "【相談】元彼からのストーカー被害への対策について悩んでいます…ゆい姉さんの回答",
-        "description": "元彼からのストーカー被害への対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.25",
-        "url": "posts/my-ex-is-stalking-me-20260225.html"
-    },
-    {
-        "title": "【相談】浮気を許す方法について悩んでいます…ゆい姉さんの回答",
-        "description": "浮気を許す方法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.25",
-        "url": "posts/how-to-forgive-a-cheater-20260225.html"
-    },
-    {
-        "title": "【相談】マイクロチーティング（浮気未満の浮気）の事例について悩んでいます…ゆい姉さんの回答",
-        "description": "マイクロチーティング（浮気未満の浮気）の事例についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.25",
-        "url": "posts/micro-cheating-examples-20260225.html"
-    },
-    {
-        "title": "【相談】セクスティング（性的なメッセージ）は浮気？について悩んでいます…ゆい姉さんの回答",
-        "description": "セクスティング（性的なメッセージ）は浮気？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.24",
-        "url": "posts/sexting-is-it-cheating-20260224.html"
-    },
-    {
-        "title": "【相談】心の浮気と体の浮気の違いについて悩んでいます…ゆい姉さんの回答",
-        "description": "心の浮気と体の浮気の違いについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.24",
-        "url": "posts/emotional-affair-vs-physical-a-20260224.html"
-    },
-    {
-        "title": "【相談】なぜ女性は浮気をするの？について悩んでいます…ゆい姉さんの回答",
-        "description": "なぜ女性は浮気をするの？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.24",
-        "url": "posts/why-do-women-cheat-20260224.html"
-    },
-    {
-        "title": "【相談】なぜ男性は浮気をするの？について悩んでいます…ゆい姉さんの回答",
-        "description": "なぜ男性は浮気をするの？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.24",
-        "url": "posts/why-do-men-cheat-20260224.html"
-    },
-    {
-        "title": "【相談】浮気が発覚した後の信頼回復について悩んでいます…ゆい姉さんの回答",
-        "description": "浮気が発覚した後の信頼回復についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.24",
-        "url": "posts/affair-recovery-can-trust-be-r-20260224.html"
-    },
-    {
-        "title": "【相談】既婚者への片思い（不倫の悩み）について悩んでいます…ゆい姉さんの回答",
-        "description": "既婚者への片思い（不倫の悩み）についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.23",
-        "url": "posts/unrequited-love-for-a-married--20260223.html"
-    },
-    {
-        "title": "【相談】職場恋愛で別れた後の気まずさ解消法について悩んでいます…ゆい姉さんの回答",
-        "description": "職場恋愛で別れた後の気まずさ解消法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.23",
-        "url": "posts/breakup-at-work-how-to-handle--20260223.html"
-    },
-    {
-        "title": "社内恋愛の注意点！仕事と恋を両立させるためのルール",
-        "description": "社内恋愛を隠し通すコツについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.23",
-        "url": "posts/office-romance-secrecy-tips-20260223.html"
-    },
-    {
-        "title": "【相談】上司との恋愛：メリットとデメリットについて悩んでいます…ゆい姉さんの回答",
-        "description": "上司との恋愛：メリットとデメリットについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.23",
-        "url": "posts/dating-the-boss-pros-and-cons-20260223.html"
-    },
-    {
-        "title": "【相談】職場恋愛：同僚との交際について悩んでいます…ゆい姉さんの回答",
-        "description": "職場恋愛：同僚との交際についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.23",
-        "url": "posts/workplace-romance-dating-a-cow-20260223.html"
-    },
-    {
-        "title": "【相談】親友を好きになってしまった時の対処法について悩んでいます…ゆい姉さんの回答",
-        "description": "親友を好きになってしまった時の対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.22",
-        "url": "posts/falling-in-love-with-best-frie-20260222.html"
-    },
-    {
-        "title": "【相談】友達の元彼への片思いについて悩んでいます…ゆい姉さんの回答",
-        "description": "友達の元彼への片思いについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.22",
-        "url": "posts/crush-on-a-friends-ex-20260222.html"
-    },
-    {
-        "title": "【相談】先生・教授への片思いについて悩んでいます…ゆい姉さんの回答",
-        "description": "先生・教授への片思いについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.22",
-        "url": "posts/crush-on-a-teacherprofessor-20260222.html"
-    },
-    {
-        "title": "【相談】叶わぬ片思いからの立ち直り方について悩んでいます…ゆい姉さんの回答",
-        "description": "叶わぬ片思いからの立ち直り方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.22",
-        "url": "posts/one-sided-love-how-to-move-on-20260222.html"
-    },
-    {
-        "title": "【相談】セフレに本気になってしまった時について悩んでいます…ゆい姉さんの回答",
-        "description": "セフレに本気になってしまった時についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.22",
-        "url": "posts/friends-with-benefits-catching-20260222.html"
-    },
-    {
-        "title": "【相談】オープン・リレーションシップのルールについて悩んでいます…ゆい姉さんの回答",
-        "description": "オープン・リレーションシップのルールについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.21",
-        "url": "posts/open-relationship-rules-20260221.html"
-    },
-    {
-        "title": "【相談】ポリアモリー（複数愛）についてについて悩んでいます…ゆい姉さんの回答",
-        "description": "ポリアモリー（複数愛）についてについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.21",
-        "url": "posts/polyamory-is-it-right-for-me-20260221.html"
-    },
-    {
-        "title": "【相談】パートナーへのカミングアウトについて悩んでいます…ゆい姉さんの回答",
-        "description": "パートナーへのカミングアウトについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.21",
-        "url": "posts/lgbtq-coming-out-to-partner-20260221.html"
-    },
-    {
-        "title": "【相談】配偶者と死別した人との恋愛について悩んでいます…ゆい姉さんの回答",
-        "description": "配偶者と死別した人との恋愛についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.21",
-        "url": "posts/dating-a-widowwidower-20260221.html"
-    },
-    {
-        "title": "【相談】子持ちバツイチ男性との恋愛について悩んでいます…ゆい姉さんの回答",
-        "description": "子持ちバツイチ男性との恋愛についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.21",
-        "url": "posts/dating-a-divorced-man-with-kid-20260221.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "年下彼氏との年の差恋愛についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.20",
-        "url": "posts/age-gap-relationship-younger-m-20260220.html"
-    },
-    {
-        "title": "年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法",
-        "description": "15歳年上の彼との年の差恋愛についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.20",
-        "url": "posts/age-gap-relationship-15-years--20260220.html"
-    },
-    {
-        "title": "【相談】遠距離恋愛の解消：どちらが引っ越すべき？について悩んでいます…ゆい姉さんの回答",
-        "description": "遠距離恋愛の解消：どちらが引っ越すべき？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.20",
-        "url": "posts/closing-the-distance-who-moves-20260220.html"
-    },
-    {
-        "title": "【相談】遠距離恋愛での浮気の兆候について悩んでいます…ゆい姉さんの回答",
-        "description": "遠距離恋愛での浮気の兆候についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.20",
-        "url": "posts/cheating-in-ldr-signs-to-watch-20260220.html"
-    },
-    {
-        "title": "【相談】遠距離恋愛での信頼関係の築き方について悩んでいます…ゆい姉さんの回答",
-        "description": "遠距離恋愛での信頼関係の築き方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.20",
-        "url": "posts/trust-issues-in-long-distance-20260220.html"
-    },
-    {
-        "title": "【相談】遠距離恋愛の会う頻度の正解について悩んでいます…ゆい姉さんの回答",
-        "description": "遠距離恋愛の会う頻度の正解についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.19",
-        "url": "posts/how-often-to-visit-in-ldr-20260219.html"
-    },
-    {
-        "title": "【相談】遠距離恋愛を長続きさせるコツについて悩んでいます…ゆい姉さんの回答",
-        "description": "遠距離恋愛を長続きさせるコツについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.19",
-        "url": "posts/long-distance-relationship-hac-20260219.html"
-    },
-    {
-        "title": "【相談】国際恋愛での文化の違いについて悩んでいます…ゆい姉さんの回答",
-        "description": "国際恋愛での文化の違いについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.19",
-        "url": "posts/cultural-differences-in-relati-20260219.html"
-    },
-    {
-        "title": "【相談】親に交際を反対された時の対処法について悩んでいます…ゆい姉さんの回答",
-        "description": "親に交際を反対された時の対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.19",
-        "url": "posts/my-parents-dont-approve-of-my--20260219.html"
-    },
-    {
-        "title": "【相談】義母との確執・トラブル解決法について悩んでいます…ゆい姉さんの回答",
-        "description": "義母との確執・トラブル解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.19",
-        "url": "posts/in-law-problems-mother-in-law--20260219.html"
-    },
-    {
-        "title": "【相談】失業したパートナーの支え方について悩んでいます…ゆい姉さんの回答",
-        "description": "失業したパートナーの支え方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.18",
-        "url": "posts/supporting-a-partner-through-j-20260218.html"
-    },
-    {
-        "title": "【相談】パートナーがうつになった時の支え方について悩んでいます…ゆい姉さんの回答",
-        "description": "パートナーがうつになった時の支え方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.18",
-        "url": "posts/how-to-handle-partners-depress-20260218.html"
-    },
-    {
-        "title": "【相談】怒りっぽいパートナーへの対処法について悩んでいます…ゆい姉さんの回答",
-        "description": "怒りっぽいパートナーへの対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.18",
-        "url": "posts/dealing-with-partners-anger-is-20260218.html"
-    },
-    {
-        "title": "【相談】束縛・支配的なパートナーへの対処法について悩んでいます…ゆい姉さんの回答",
-        "description": "束縛・支配的なパートナーへの対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.18",
-        "url": "posts/my-partner-is-controlling-20260218.html"
-    },
-    {
-        "title": "【相談】ガスライティング（心理的支配）のサインについて悩んでいます…ゆい姉さんの回答",
-        "description": "ガスライティング（心理的支配）のサインについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.18",
-        "url": "posts/gaslighting-in-relationships-w-20260218.html"
-    },
-    {
-        "title": "【相談】感情的な操作（マニピュレーション）のサインについて悩んでいます…ゆい姉さんの回答",
-        "description": "感情的な操作（マニピュレーション）のサインについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.17",
-        "url": "posts/signs-of-emotional-manipulatio-20260217.html"
-    },
-    {
-        "title": "【相談】元彼との復縁：すべきかどうか？について悩んでいます…ゆい姉さんの回答",
-        "description": "元彼との復縁：すべきかどうか？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.17",
-        "url": "posts/getting-back-with-an-ex-good-o-20260217.html"
-    },
-    {
-        "title": "【相談】相手を傷つけずに別れる方法について悩んでいます…ゆい姉さんの回答",
-        "description": "相手を傷つけずに別れる方法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.17",
-        "url": "posts/how-to-break-up-gently-20260217.html"
-    },
-    {
-        "title": "【相談】パートナーのスマホを見るのはアリかナシかについて悩んでいます…ゆい姉さんの回答",
-        "description": "パートナーのスマホを見るのはアリかナシかについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.17",
-        "url": "posts/is-it-okay-to-look-through-my--20260217.html"
-    },
-    {
-        "title": "【相談】太ったパートナーに冷めてしまった時について悩んでいます…ゆい姉さんの回答",
-        "description": "太ったパートナーに冷めてしまった時についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.17",
-        "url": "posts/my-partner-gained-weight-and-i-20260217.html"
-    },
-    {
-        "title": "【相談】マンネリカップルの刺激の作り方について悩んでいます…ゆい姉さんの回答",
-        "description": "マンネリカップルの刺激の作り方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.16",
-        "url": "posts/how-to-spice-up-a-long-term-re-20260216.html"
-    },
-    {
-        "title": "【相談】だらしないパートナーへの対処法について悩んでいます…ゆい姉さんの回答",
-        "description": "だらしないパートナーへの対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.16",
-        "url": "posts/dealing-with-a-messy-partner-20260216.html"
-    },
-    {
-        "title": "【相談】カップルのお金に関する価値観の不一致について悩んでいます…ゆい姉さんの回答",
-        "description": "カップルのお金に関する価値観の不一致についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.16",
-        "url": "posts/financial-disagreements-in-rel-20260216.html"
-    },
-    {
-        "title": "【相談】同棲中の家事分担のコツについて悩んでいます…ゆい姉さんの回答",
-        "description": "同棲中の家事分担のコツについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.16",
-        "url": "posts/living-together-how-to-split-c-20260216.html"
-    },
-    {
-        "title": "【相談】マザコン彼氏への対処法について悩んでいます…ゆい姉さんの回答",
-        "description": "マザコン彼氏への対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.16",
-        "url": "posts/my-boyfriend-is-too-close-to-h-20260216.html"
-    },
-    {
-        "title": "【相談】彼氏に記念日を忘れられた時の対処法について悩んでいます…ゆい姉さんの回答",
-        "description": "彼氏に記念日を忘れられた時の対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.15",
-        "url": "posts/boyfriend-forgot-our-anniversa-20260215.html"
-    },
-    {
-        "title": "【相談】仕事中毒な彼氏との付き合い方について悩んでいます…ゆい姉さんの回答",
-        "description": "仕事中毒な彼氏との付き合い方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.15",
-        "url": "posts/how-to-deal-with-a-workaholic--20260215.html"
-    },
-    {
-        "title": "【相談】彼氏がインスタモデルの写真にいいねする心理について悩んでいます…ゆい姉さんの回答",
-        "description": "彼氏がインスタモデルの写真にいいねする心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.15",
-        "url": "posts/boyfriend-likes-instagram-mode-20260215.html"
-    },
-    {
-        "title": "【相談】彼氏の女友達への嫉妬の対処法について悩んでいます…ゆい姉さんの回答",
-        "description": "彼氏の女友達への嫉妬の対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.15",
-        "url": "posts/jealous-of-boyfriends-female-f-20260215.html"
-    },
-    {
-        "title": "【相談】SNSに彼女を載せない男性心理について悩んでいます…ゆい姉さんの回答",
-        "description": "SNSに彼女を載せない男性心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.15",
-        "url": "posts/my-boyfriend-never-posts-about-20260215.html"
-    },
-    {
-        "title": "【相談】付き合うタイミング（関係性をはっきりさせる時）について悩んでいます…ゆい姉さんの回答",
-        "description": "付き合うタイミング（関係性をはっきりさせる時）についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.14",
-        "url": "posts/when-to-define-the-relationshi-20260214.html"
-    },
-    {
-        "title": "【相談】マッチングアプリからLINEへ移行するタイミングと方法について悩んでいます…ゆい姉さんの回答",
-        "description": "マッチングアプリからLINEへ移行するタイミングと方法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.14",
-        "url": "posts/how-to-transition-from-app-to--20260214.html"
-    },
-    {
-        "title": "【相談】マッチングアプリの要注意プロフィールの特徴について悩んでいます…ゆい姉さんの回答",
-        "description": "マッチングアプリの要注意プロフィールの特徴についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.14",
-        "url": "posts/red-flags-in-dating-app-profil-20260214.html"
-    },
-    {
-        "title": "【相談】マッチングアプリで会う時の安全対策について悩んでいます…ゆい姉さんの回答",
-        "description": "マッチングアプリで会う時の安全対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.14",
-        "url": "posts/safety-tips-for-meeting-online-20260214.html"
-    },
-    {
-        "title": "初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い",
-        "description": "初デートで盛り上がる会話のきっかけについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。",
-        "date": "2026.02.14",
-        "url": "posts/first-date-conversation-starte-20260214.html"
-    },
-    {
-        "title": "マッチングアプリで会話が続かない…話題切れを防ぎ、デートに繋げるトーク術",
-        "description": "「趣味は？」「休みの日は？」これ以上何を聞けばいいの？マッチングアプリでの沈黙が怖いあなたへ。会話を無限に広げ、相手を楽しませる質問テクニックを伝授します。",
-        "date": "2026.02.13",
-        "url": "posts/conversation-tips-online.html"
-    },
-    {
-        "title": "マッチング後の失速…彼が興味を失いつつあるサインと挽回策",
-        "description": "最初は盛り上がっていたのに、最近彼の反応が薄い…。それは「脈なし」への変化のサインかも。男性が見せる興味喪失のサインを見極め、関係を修復する方法を教えます。",
-        "date": "2026.02.13",
-        "url": "posts/signs-he-is-losing-interest.html"
-    },
-    {
-        "title": "マッチングアプリで「追いメッセージ」はNG？連投しても許されるケースと嫌われる境界線",
-        "description": "返信来てないのに送っちゃった…。ダブルテキスト（連投）は脈なしへの片道切符？不安なあなたへ、許される連投とアウトな連投の違いを解説します。",
-        "date": "2026.02.13",
-        "url": "posts/app-double-texting.html"
-    },
-    {
-        "title": "マッチングアプリで既読無視された！追撃していい？フェードアウトを挽回するメッセージ術",
-        "description": "いい感じだったのに急に返信が来なくなった…。相手の心理と、ここから復活するための「ザオラルメール」のコツ、そして諦めるべき引き際を解説します。",
-        "date": "2026.02.13",
-        "url": "posts/reply-to-ghosting-match.html"
-    },
-    {
-        "title": "マッチングアプリ初デートの服装選び｜彼に「いいね」と思わせるコーデ術とNG例",
-        "description": "マッチングアプリで出会った彼との初デート。何を着ていけばいい？張り切りすぎず、でも好印象な「正解コーデ」と、避けるべきNGファッションをゆい姉さんが解説します。",
-        "date": "2026.02.13",
-        "url": "posts/matching-app-first-date-outfit.html"
-    },
-    {
-        "title": "別れた彼氏が忘れられない…3ヶ月経っても辛いあなたへ贈る「執着」の手放し方",
-        "description": "失恋から3ヶ月、まだ元彼が忘れられない…。復縁を願うべき？吹っ切るべき？止まった時間を動かし、新しい幸せを掴むための心の整理術をアドバイスします。",
-        "date": "2026.02.13",
-        "url": "posts/forget-ex-boyfriend.html"
-    },
-    {
-        "title": "10歳年下の彼氏との結婚…「姉さん女房」の不安を解消し、愛され続ける秘訣",
-        "description": "10歳下の彼からのプロポーズ。嬉しいけれど、年齢差や将来の悩みが尽きない…そんな不安を抱える年上彼女へ、自信を持って結婚へ進むためのマインドセットをお届けします。",
-        "date": "2026.02.13",
-        "url": "posts/age-gap-marriage.html"
-    },
-    {
-        "title": "彼氏のポケットからテーマパークのレシートが…浮気を問い詰めるべき？賢い対処法",
-        "description": "同棲中の彼氏の服から見知らぬレシートが…浮気？それとも誤解？動揺する気持ちを抑え、決定的な証拠が出るまでの振る舞い方と、彼への切り出し方をアドバイスします。",
-        "date": "2026.02.13",
-        "url": "posts/cheating-suspicion.html"
-    },
-    {
-        "title": "遠距離恋愛で連絡が減った彼氏…自然消滅を避けるための対処法と男性心理",
-        "description": "遠距離恋愛中の彼からの連絡が減った…このまま自然消滅？不安なあなたへ、男性が連絡を減らす心理と、愛を再燃させるためのコミュニケーション術を伝授します。",
-        "date": "2026.02.13",
-        "url": "posts/long-distance-silence.html"
-    },
-    {
-        "title": "職場の上司に片思い…彼女持ちの彼を振り向かせるには？NG行動とアプローチ法",
-        "description": "彼女がいる職場の上司や先輩を好きになってしまった…諦めるべき？それとも待つべき？辛い恋の行方と、関係を壊さずに距離を縮める方法をゆい姉さんが解説します。",
-        "date": "2026.02.13",
-        "url": "posts/workplace-crush.html"
-    },
-    {
-        "title": "結婚の話を避ける彼氏の本音とは？プレッシャーをかけずに切り出す方法",
-        "description": "3年以上付き合っている彼氏が結婚の話を避ける…その心理と、関係を壊さずに将来の話をするための具体的なステップをゆい姉さんが解説します。",
-        "date": "2026.02.13",
-        "url": "posts/marriage-anxiety.html"
-    }
-];
\ No newline at end of file
+{"title":"【年上の彼】義実家への挨拶で失敗しない！大人の対応と好印象を与える秘訣","description":"年上の彼との義実家・親戚付き合いの対策についての悩みは深いですよね。ゆい姉さんが大人の対応と好印象の秘訣を解説します。","date":"2026.05.25","url":"posts/in-laws-strategy-older-man-20260525.html"},
+{"title":"仕事中に寂しくなったら…遠距離恋愛を「力」に変える3つのマインドセット","description":"仕事中の遠距離恋愛の成功の秘訣についての悩みは深いですよね。ゆい姉さんが寂しさを力に変える方法を解説します。","date":"2026.05.25","url":"posts/ldr-success-tip-work-20260525.html"},
+{"title":"【年下の彼】思わぬ一言で溝が…？年下男性を傷つけるNGな言動と修復術","description":"年下の彼とのコミュニケーションの失敗についての悩みは深いですよね。ゆい姉さんがNGな言動と関係修復のコツを解説します。","date":"2026.05.25","url":"posts/comm-mistake-younger-man-20260525.html"},
+{"title":"社内恋愛から結婚へ！周囲を味方につける「完璧な報告」のタイミング","description":"結婚前の社内恋愛の戦略についての悩みは深いですよね。ゆい姉さんが周囲を味方につける報告のタイミングを解説します。","date":"2026.05.25","url":"posts/office-romance-strategy-marriage-20260525.html"},
+{"title":"【年上の彼】別れ際の「重い女」は卒業。彼の心に深く残る美しいサヨナラ","description":"年上の彼との別れの失敗についての悩みは深いですよね。ゆい姉さんが再会を予感させるような美しい別れ方を解説します。","date":"2026.05.25","url":"posts/breakup-mistake-older-man-20260525.html"},
+{"title":"結婚前の【相談】別れの切り出し方について悩んでいます…ゆい姉さんの回答","description":"結婚前の別れの切り出し方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.24","url":"posts/breakup-strategy-before-marria-20260524.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"付き合って3ヶ月の社内恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.24","url":"posts/office-romance-panic-after-3-m-20260524.html"},
+{"title":"年上の彼との【相談】マッチングアプリの対策について悩んでいます…ゆい姉さんの回答","description":"年上の彼とのマッチングアプリの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.24","url":"posts/dating-app-strategy-with-older-20260524.html"},
+{"title":"夜の【相談】ファッション・服装のアドバイスについて悩んでいます…ゆい姉さんの回答","description":"夜のファッション・服装のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.24","url":"posts/fashion-advice-late-at-night-20260524.html"},
+{"title":"別れた後の【相談】浮気の解決法について悩んでいます…ゆい姉さんの回答","description":"別れた後の浮気の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.24","url":"posts/cheating-success-tip-after-bre-20260524.html"},
+{"title":"結婚前の【相談】コミュニケーションの秘密について悩んでいます…ゆい姉さんの回答","description":"結婚前のコミュニケーションの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.23","url":"posts/communication-secret-before-ma-20260523.html"},
+{"title":"年上の彼との【相談】別れの切り出し方について悩んでいます…ゆい姉さんの回答","description":"年上の彼との別れの切り出し方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.23","url":"posts/breakup-strategy-with-older-ma-20260523.html"},
+{"title":"年上の彼との【相談】マッチングアプリの悩みについて悩んでいます…ゆい姉さんの回答","description":"年上の彼とのマッチングアプリの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.23","url":"posts/dating-app-panic-with-older-ma-20260523.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"年上の彼との年の差の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.23","url":"posts/age-gap-psychology-with-older--20260523.html"},
+{"title":"別れた後の【相談】義実家・親戚付き合いの対策について悩んでいます…ゆい姉さんの回答","description":"別れた後の義実家・親戚付き合いの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.23","url":"posts/in-laws-strategy-after-breakup-20260523.html"},
+{"title":"別れた後の【相談】片思いの秘密について悩んでいます…ゆい姉さんの回答","description":"別れた後の片思いの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.22","url":"posts/unrequited-love-secret-after-b-20260522.html"},
+{"title":"年上の彼との【相談】セフレ・都合のいい関係のアドバイスについて悩んでいます…ゆい姉さんの回答","description":"年上の彼とのセフレ・都合のいい関係のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.22","url":"posts/friends-with-benefits-advice-w-20260522.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"年下の彼との社内恋愛の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.22","url":"posts/office-romance-psychology-with-20260522.html"},
+{"title":"付き合って1年の【相談】不信感・信頼関係の悩みの解決法について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の不信感・信頼関係の悩みの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.22","url":"posts/trust-issues-success-tip-after-20260522.html"},
+{"title":"友達との【相談】お金の悩みの失敗について悩んでいます…ゆい姉さんの回答","description":"友達とのお金の悩みの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.22","url":"posts/money-mistake-with-friend-20260522.html"},
+{"title":"付き合って3ヶ月の【相談】浮気対策について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の浮気対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.21","url":"posts/cheating-strategy-after-3-mont-20260521.html"},
+{"title":"結婚前の【相談】ファッション・服装の後悔について悩んでいます…ゆい姉さんの回答","description":"結婚前のファッション・服装の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.21","url":"posts/fashion-regret-before-marriage-20260521.html"},
+{"title":"結婚前の【相談】LINEのメッセージのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"結婚前のLINEのメッセージのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.21","url":"posts/line-message-advice-before-mar-20260521.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"同僚との初デートの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.21","url":"posts/first-date-psychology-with-cow-20260521.html"},
+{"title":"別れた後の【相談】ファッション・服装の不安について悩んでいます…ゆい姉さんの回答","description":"別れた後のファッション・服装の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.21","url":"posts/fashion-anxiety-after-breakup-20260521.html"},
+{"title":"付き合って3ヶ月の【相談】嫉妬の後悔について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の嫉妬の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.20","url":"posts/jealousy-regret-after-3-months-20260520.html"},
+{"title":"結婚前の【相談】義実家・親戚付き合いの対策について悩んでいます…ゆい姉さんの回答","description":"結婚前の義実家・親戚付き合いの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.20","url":"posts/in-laws-strategy-before-marria-20260520.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"友達との年の差の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.20","url":"posts/age-gap-panic-with-friend-20260520.html"},
+{"title":"年下の彼との【相談】自己研鑽・自分磨きのトラブルについて悩んでいます…ゆい姉さんの回答","description":"年下の彼との自己研鑽・自分磨きのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.20","url":"posts/self-improvement-trouble-with--20260520.html"},
+{"title":"仕事中の【相談】自己研鑽・自分磨きの失敗について悩んでいます…ゆい姉さんの回答","description":"仕事中の自己研鑽・自分磨きの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.20","url":"posts/self-improvement-mistake-durin-20260520.html"},
+{"title":"同僚との【相談】夜の生活・性生活の失敗について悩んでいます…ゆい姉さんの回答","description":"同僚との夜の生活・性生活の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.19","url":"posts/sex-life-mistake-with-coworker-20260519.html"},
+{"title":"夜の【相談】結婚のアドバイスについて悩んでいます…ゆい姉さんの回答","description":"夜の結婚のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.19","url":"posts/marriage-advice-late-at-night-20260519.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"年上の彼との年の差の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.19","url":"posts/age-gap-anxiety-with-older-man-20260519.html"},
+{"title":"年下の彼との【相談】片思いの悩みについて悩んでいます…ゆい姉さんの回答","description":"年下の彼との片思いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.19","url":"posts/unrequited-love-panic-with-you-20260519.html"},
+{"title":"年上の彼との【相談】不信感・信頼関係の悩みの解決法について悩んでいます…ゆい姉さんの回答","description":"年上の彼との不信感・信頼関係の悩みの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.19","url":"posts/trust-issues-success-tip-with--20260519.html"},
+{"title":"年上の彼との【相談】浮気対策について悩んでいます…ゆい姉さんの回答","description":"年上の彼との浮気対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.18","url":"posts/cheating-strategy-with-older-m-20260518.html"},
+{"title":"友達との【相談】義実家・親戚付き合いのトラブルについて悩んでいます…ゆい姉さんの回答","description":"友達との義実家・親戚付き合いのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.18","url":"posts/in-laws-trouble-with-friend-20260518.html"},
+{"title":"結婚前の【相談】自己研鑽・自分磨きの後悔について悩んでいます…ゆい姉さんの回答","description":"結婚前の自己研鑽・自分磨きの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.18","url":"posts/self-improvement-regret-before-20260518.html"},
+{"title":"同僚との【相談】元彼の失敗について悩んでいます…ゆい姉さんの回答","description":"同僚との元彼の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.18","url":"posts/ex-boyfriend-mistake-with-cowo-20260518.html"},
+{"title":"夜の【相談】義実家・親戚付き合いの悩みについて悩んでいます…ゆい姉さんの回答","description":"夜の義実家・親戚付き合いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.18","url":"posts/in-laws-panic-late-at-night-20260518.html"},
+{"title":"付き合って3ヶ月の【相談】ファッション・服装の対策について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月のファッション・服装の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.17","url":"posts/fashion-strategy-after-3-month-20260517.html"},
+{"title":"夜の【相談】嫉妬の失敗について悩んでいます…ゆい姉さんの回答","description":"夜の嫉妬の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.17","url":"posts/jealousy-mistake-late-at-night-20260517.html"},
+{"title":"夜の【相談】浮気の解決法について悩んでいます…ゆい姉さんの回答","description":"夜の浮気の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.17","url":"posts/cheating-success-tip-late-at-n-20260517.html"},
+{"title":"夜の【相談】片思いのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"夜の片思いのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.17","url":"posts/unrequited-love-advice-late-at-20260517.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"別れた後の年の差の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.17","url":"posts/age-gap-panic-after-breakup-20260517.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"年上の彼との社内恋愛のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.16","url":"posts/office-romance-advice-with-old-20260516.html"},
+{"title":"友達との【相談】コミュニケーションの心理について悩んでいます…ゆい姉さんの回答","description":"友達とのコミュニケーションの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.16","url":"posts/communication-psychology-with--20260516.html"},
+{"title":"付き合って3ヶ月の【相談】別れの秘密について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の別れの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.16","url":"posts/breakup-secret-after-3-months-20260516.html"},
+{"title":"付き合って3ヶ月の【相談】マッチングアプリの悩みについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月のマッチングアプリの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.16","url":"posts/dating-app-panic-after-3-month-20260516.html"},
+{"title":"仕事中の【相談】元彼の解決法について悩んでいます…ゆい姉さんの回答","description":"仕事中の元彼の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.16","url":"posts/ex-boyfriend-success-tip-durin-20260516.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"年下の彼との年の差の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.15","url":"posts/age-gap-anxiety-with-younger-m-20260515.html"},
+{"title":"年上の彼との【相談】マッチングアプリの心理について悩んでいます…ゆい姉さんの回答","description":"年上の彼とのマッチングアプリの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.15","url":"posts/dating-app-psychology-with-old-20260515.html"},
+{"title":"付き合って1年の【相談】片思いの解決法について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の片思いの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.15","url":"posts/unrequited-love-success-tip-af-20260515.html"},
+{"title":"同僚との【相談】片思いのトラブルについて悩んでいます…ゆい姉さんの回答","description":"同僚との片思いのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.15","url":"posts/unrequited-love-trouble-with-c-20260515.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"年下の彼との社内恋愛の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.15","url":"posts/office-romance-mistake-with-yo-20260515.html"},
+{"title":"結婚前の【相談】結婚の秘密について悩んでいます…ゆい姉さんの回答","description":"結婚前の結婚の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.14","url":"posts/marriage-secret-before-marriag-20260514.html"},
+{"title":"同僚との【相談】マッチングアプリの失敗について悩んでいます…ゆい姉さんの回答","description":"同僚とのマッチングアプリの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.14","url":"posts/dating-app-mistake-with-cowork-20260514.html"},
+{"title":"付き合って3ヶ月の【相談】遠距離恋愛の悩みについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の遠距離恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.14","url":"posts/long-distance-panic-after-3-mo-20260514.html"},
+{"title":"付き合って3ヶ月の【相談】自己研鑽・自分磨きのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の自己研鑽・自分磨きのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.14","url":"posts/self-improvement-advice-after--20260514.html"},
+{"title":"別れた後の【相談】LINEのメッセージの後悔について悩んでいます…ゆい姉さんの回答","description":"別れた後のLINEのメッセージの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.14","url":"posts/line-message-regret-after-brea-20260514.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"同僚との初デートのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.13","url":"posts/first-date-advice-with-coworke-20260513.html"},
+{"title":"同僚との【相談】マッチングアプリの不安について悩んでいます…ゆい姉さんの回答","description":"同僚とのマッチングアプリの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.13","url":"posts/dating-app-anxiety-with-cowork-20260513.html"},
+{"title":"付き合って3ヶ月の【相談】お金の悩みの不安について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月のお金の悩みの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.13","url":"posts/money-anxiety-after-3-months-20260513.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"付き合って3ヶ月の初デートの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.13","url":"posts/first-date-mistake-after-3-mon-20260513.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"別れた後の初デートの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.13","url":"posts/first-date-strategy-after-brea-20260513.html"},
+{"title":"付き合って1年の【相談】義実家・親戚付き合いの対策について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の義実家・親戚付き合いの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.12","url":"posts/in-laws-strategy-after-1-year-20260512.html"},
+{"title":"付き合って1年の【相談】マッチングアプリのトラブルについて悩んでいます…ゆい姉さんの回答","description":"付き合って1年のマッチングアプリのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.12","url":"posts/dating-app-trouble-after-1-yea-20260512.html"},
+{"title":"年上の彼との【相談】義実家・親戚付き合いの秘密について悩んでいます…ゆい姉さんの回答","description":"年上の彼との義実家・親戚付き合いの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.12","url":"posts/in-laws-secret-with-older-man-20260512.html"},
+{"title":"別れた後の【相談】義実家・親戚付き合いの失敗について悩んでいます…ゆい姉さんの回答","description":"別れた後の義実家・親戚付き合いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.12","url":"posts/in-laws-mistake-after-breakup-20260512.html"},
+{"title":"付き合って3ヶ月の【相談】嫉妬対策について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の嫉妬対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.12","url":"posts/jealousy-strategy-after-3-mont-20260512.html"},
+{"title":"友達との【相談】元彼の解決法について悩んでいます…ゆい姉さんの回答","description":"友達との元彼の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.11","url":"posts/ex-boyfriend-success-tip-with--20260511.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"友達との社内恋愛の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.11","url":"posts/office-romance-anxiety-with-fr-20260511.html"},
+{"title":"夜の【相談】不信感・信頼関係の悩みの心理について悩んでいます…ゆい姉さんの回答","description":"夜の不信感・信頼関係の悩みの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.11","url":"posts/trust-issues-psychology-late-a-20260511.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"別れた後の年の差の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.11","url":"posts/age-gap-anxiety-after-breakup-20260511.html"},
+{"title":"年上の彼との【相談】不信感・信頼関係の悩みの対策について悩んでいます…ゆい姉さんの回答","description":"年上の彼との不信感・信頼関係の悩みの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.11","url":"posts/trust-issues-strategy-with-old-20260511.html"},
+{"title":"友達との【相談】浮気の心理について悩んでいます…ゆい姉さんの回答","description":"友達との浮気の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.10","url":"posts/cheating-psychology-with-frien-20260510.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"夜の初デートのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.10","url":"posts/first-date-trouble-late-at-nig-20260510.html"},
+{"title":"年上の彼との【相談】夜の生活・性生活の対策について悩んでいます…ゆい姉さんの回答","description":"年上の彼との夜の生活・性生活の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.10","url":"posts/sex-life-strategy-with-older-m-20260510.html"},
+{"title":"仕事中の【相談】自己研鑽・自分磨きのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"仕事中の自己研鑽・自分磨きのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.10","url":"posts/self-improvement-advice-during-20260510.html"},
+{"title":"結婚前の【相談】嫉妬の不安について悩んでいます…ゆい姉さんの回答","description":"結婚前の嫉妬の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.10","url":"posts/jealousy-anxiety-before-marria-20260510.html"},
+{"title":"付き合って3ヶ月の【相談】嫉妬のトラブルについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の嫉妬のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.09","url":"posts/jealousy-trouble-after-3-month-20260509.html"},
+{"title":"付き合って1年の【相談】嫉妬の不安について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の嫉妬の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.09","url":"posts/jealousy-anxiety-after-1-year-20260509.html"},
+{"title":"同僚との【相談】片思いの悩みについて悩んでいます…ゆい姉さんの回答","description":"同僚との片思いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.09","url":"posts/unrequited-love-panic-with-cow-20260509.html"},
+{"title":"年下の彼との【相談】結婚の心理について悩んでいます…ゆい姉さんの回答","description":"年下の彼との結婚の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.09","url":"posts/marriage-psychology-with-young-20260509.html"},
+{"title":"夜の【相談】マッチングアプリの不安について悩んでいます…ゆい姉さんの回答","description":"夜のマッチングアプリの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.09","url":"posts/dating-app-anxiety-late-at-nig-20260509.html"},
+{"title":"仕事中の【相談】嫉妬対策について悩んでいます…ゆい姉さんの回答","description":"仕事中の嫉妬対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.08","url":"posts/jealousy-strategy-during-work-20260508.html"},
+{"title":"同僚との【相談】夜の生活・性生活の心理について悩んでいます…ゆい姉さんの回答","description":"同僚との夜の生活・性生活の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.08","url":"posts/sex-life-psychology-with-cowor-20260508.html"},
+{"title":"付き合って1年の【相談】自己研鑽・自分磨きの解決法について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の自己研鑽・自分磨きの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.08","url":"posts/self-improvement-success-tip-a-20260508.html"},
+{"title":"夜の【相談】不信感・信頼関係の悩みの悩みについて悩んでいます…ゆい姉さんの回答","description":"夜の不信感・信頼関係の悩みの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.08","url":"posts/trust-issues-panic-late-at-nig-20260508.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"仕事中の社内恋愛の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.08","url":"posts/office-romance-secret-during-w-20260508.html"},
+{"title":"年下の彼との【相談】不信感・信頼関係の悩みのトラブルについて悩んでいます…ゆい姉さんの回答","description":"年下の彼との不信感・信頼関係の悩みのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.07","url":"posts/trust-issues-trouble-with-youn-20260507.html"},
+{"title":"付き合って3ヶ月の【相談】自己研鑽・自分磨きの解決法について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の自己研鑽・自分磨きの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.07","url":"posts/self-improvement-success-tip-a-20260507.html"},
+{"title":"年上の彼との【相談】嫉妬の不安について悩んでいます…ゆい姉さんの回答","description":"年上の彼との嫉妬の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.07","url":"posts/jealousy-anxiety-with-older-ma-20260507.html"},
+{"title":"別れた後の【相談】片思いの後悔について悩んでいます…ゆい姉さんの回答","description":"別れた後の片思いの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.07","url":"posts/unrequited-love-regret-after-b-20260507.html"},
+{"title":"別れた後の【相談】夜の生活・性生活の対策について悩んでいます…ゆい姉さんの回答","description":"別れた後の夜の生活・性生活の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.07","url":"posts/sex-life-strategy-after-breaku-20260507.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"結婚前の年の差の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.06","url":"posts/age-gap-secret-before-marriage-20260506.html"},
+{"title":"年上の彼との【相談】元彼の不安について悩んでいます…ゆい姉さんの回答","description":"年上の彼との元彼の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.06","url":"posts/ex-boyfriend-anxiety-with-olde-20260506.html"},
+{"title":"同僚との【相談】結婚の対策について悩んでいます…ゆい姉さんの回答","description":"同僚との結婚の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.06","url":"posts/marriage-strategy-with-coworke-20260506.html"},
+{"title":"友達との【相談】遠距離恋愛の悩みについて悩んでいます…ゆい姉さんの回答","description":"友達との遠距離恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.06","url":"posts/long-distance-panic-with-frien-20260506.html"},
+{"title":"年上の彼との【相談】お金の悩みのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"年上の彼とのお金の悩みのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.06","url":"posts/money-advice-with-older-man-20260506.html"},
+{"title":"付き合って3ヶ月の【相談】別れの悩みについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の別れの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.05","url":"posts/breakup-panic-after-3-months-20260505.html"},
+{"title":"結婚前の【相談】セフレ・都合のいい関係の不安について悩んでいます…ゆい姉さんの回答","description":"結婚前のセフレ・都合のいい関係の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.05","url":"posts/friends-with-benefits-anxiety--20260505.html"},
+{"title":"同僚との【相談】マッチングアプリの秘密について悩んでいます…ゆい姉さんの回答","description":"同僚とのマッチングアプリの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.05","url":"posts/dating-app-secret-with-coworke-20260505.html"},
+{"title":"年下の彼との【相談】LINEのメッセージのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"年下の彼とのLINEのメッセージのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.05","url":"posts/line-message-advice-with-young-20260505.html"},
+{"title":"結婚前の【相談】ファッション・服装の解決法について悩んでいます…ゆい姉さんの回答","description":"結婚前のファッション・服装の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.05","url":"posts/fashion-success-tip-before-mar-20260505.html"},
+{"title":"年下の彼との【相談】お金の悩みの解決法について悩んでいます…ゆい姉さんの回答","description":"年下の彼とのお金の悩みの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.04","url":"posts/money-success-tip-with-younger-20260504.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"仕事中の年の差の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.04","url":"posts/age-gap-anxiety-during-work-20260504.html"},
+{"title":"年下の彼との【相談】マッチングアプリの後悔について悩んでいます…ゆい姉さんの回答","description":"年下の彼とのマッチングアプリの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.04","url":"posts/dating-app-regret-with-younger-20260504.html"},
+{"title":"夜の【相談】自己研鑽・自分磨きの対策について悩んでいます…ゆい姉さんの回答","description":"夜の自己研鑽・自分磨きの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.04","url":"posts/self-improvement-strategy-late-20260504.html"},
+{"title":"結婚前の【相談】片思いの心理について悩んでいます…ゆい姉さんの回答","description":"結婚前の片思いの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.04","url":"posts/unrequited-love-psychology-bef-20260504.html"},
+{"title":"年上の彼との【相談】片思いの悩みについて悩んでいます…ゆい姉さんの回答","description":"年上の彼との片思いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.03","url":"posts/unrequited-love-panic-with-old-20260503.html"},
+{"title":"友達との【相談】ファッション・服装の秘密について悩んでいます…ゆい姉さんの回答","description":"友達とのファッション・服装の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.03","url":"posts/fashion-secret-with-friend-20260503.html"},
+{"title":"夜の【相談】夜の生活・性生活のアドバイスについて悩んでいます…ゆい姉さんの回答","description":"夜の夜の生活・性生活のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.03","url":"posts/sex-life-advice-late-at-night-20260503.html"},
+{"title":"同僚との【相談】セフレ・都合のいい関係の不安について悩んでいます…ゆい姉さんの回答","description":"同僚とのセフレ・都合のいい関係の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.03","url":"posts/friends-with-benefits-anxiety--20260503.html"},
+{"title":"付き合って1年の【相談】嫉妬のトラブルについて悩んでいます…ゆい姉さんの回答","description":"付き合って1年の嫉妬のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.03","url":"posts/jealousy-trouble-after-1-year-20260503.html"},
+{"title":"同僚との【相談】遠距離恋愛の不安について悩んでいます…ゆい姉さんの回答","description":"同僚との遠距離恋愛の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.02","url":"posts/long-distance-anxiety-with-cow-20260502.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"同僚との初デートの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.02","url":"posts/first-date-strategy-with-cowor-20260502.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"夜の初デートの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.02","url":"posts/first-date-panic-late-at-night-20260502.html"},
+{"title":"友達との【相談】浮気の相談について悩んでいます…ゆい姉さんの回答","description":"友達との浮気の相談についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.02","url":"posts/cheating-advice-with-friend-20260502.html"},
+{"title":"付き合って1年の【相談】元彼の失敗について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の元彼の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.02","url":"posts/ex-boyfriend-mistake-after-1-y-20260502.html"},
+{"title":"夜の【相談】嫉妬へのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"夜の嫉妬へのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.01","url":"posts/jealousy-advice-late-at-night-20260501.html"},
+{"title":"年上の彼との【相談】不信感・信頼関係の悩みの失敗について悩んでいます…ゆい姉さんの回答","description":"年上の彼との不信感・信頼関係の悩みの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.01","url":"posts/trust-issues-mistake-with-olde-20260501.html"},
+{"title":"年上の彼との【相談】義実家・親戚付き合いの心理について悩んでいます…ゆい姉さんの回答","description":"年上の彼との義実家・親戚付き合いの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.01","url":"posts/in-laws-psychology-with-older--20260501.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"付き合って1年の社内恋愛のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.01","url":"posts/office-romance-advice-after-1--20260501.html"},
+{"title":"仕事中の【相談】夜の生活・性生活のトラブルについて悩んでいます…ゆい姉さんの回答","description":"仕事中の夜の生活・性生活のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.05.01","url":"posts/sex-life-trouble-during-work-20260501.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"付き合って3ヶ月の初デートの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.30","url":"posts/first-date-psychology-after-3--20260430.html"},
+{"title":"付き合って3ヶ月の【相談】LINEのメッセージのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月のLINEのメッセージのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.30","url":"posts/line-message-advice-after-3-mo-20260430.html"},
+{"title":"別れた後の【相談】元彼の不安について悩んでいます…ゆい姉さんの回答","description":"別れた後の元彼の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.30","url":"posts/ex-boyfriend-anxiety-after-bre-20260430.html"},
+{"title":"年上の彼との【相談】セフレ・都合のいい関係の対策について悩んでいます…ゆい姉さんの回答","description":"年上の彼とのセフレ・都合のいい関係の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.30","url":"posts/friends-with-benefits-strategy-20260430.html"},
+{"title":"年下の彼との【相談】片思いの失敗について悩んでいます…ゆい姉さんの回答","description":"年下の彼との片思いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.30","url":"posts/unrequited-love-mistake-with-y-20260430.html"},
+{"title":"友達との【相談】お金の悩みの心理について悩んでいます…ゆい姉さんの回答","description":"友達とのお金の悩みの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.29","url":"posts/money-psychology-with-friend-20260429.html"},
+{"title":"年下の彼との【相談】元彼の対策について悩んでいます…ゆい姉さんの回答","description":"年下の彼との元彼の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.29","url":"posts/ex-boyfriend-strategy-with-you-20260429.html"},
+{"title":"付き合って3ヶ月の【相談】セフレ・都合のいい関係の悩みについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月のセフレ・都合のいい関係の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.29","url":"posts/friends-with-benefits-panic-af-20260429.html"},
+{"title":"友達との【相談】嫉妬の心理について悩んでいます…ゆい姉さんの回答","description":"友達との嫉妬の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.29","url":"posts/jealousy-psychology-with-frien-20260429.html"},
+{"title":"夜の【相談】嫉妬の心理について悩んでいます…ゆい姉さんの回答","description":"夜の嫉妬の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.29","url":"posts/jealousy-psychology-late-at-ni-20260429.html"},
+{"title":"仕事中の【相談】不信感・信頼関係の悩みの失敗について悩んでいます…ゆい姉さんの回答","description":"仕事中の不信感・信頼関係の悩みの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.28","url":"posts/trust-issues-mistake-during-wo-20260428.html"},
+{"title":"付き合って3ヶ月の【相談】セフレ・都合のいい関係の後悔について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月のセフレ・都合のいい関係の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.28","url":"posts/friends-with-benefits-regret-a-20260428.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"夜の社内恋愛の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.28","url":"posts/office-romance-anxiety-late-at-20260428.html"},
+{"title":"年上の彼との【相談】遠距離恋愛の不安について悩んでいます…ゆい姉さんの回答","description":"年上の彼との遠距離恋愛の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.28","url":"posts/long-distance-anxiety-with-old-20260428.html"},
+{"title":"夜の【相談】LINEのメッセージの心理について悩んでいます…ゆい姉さんの回答","description":"夜のLINEのメッセージの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.28","url":"posts/line-message-psychology-late-a-20260428.html"},
+{"title":"年上の彼との【相談】浮気への不安について悩んでいます…ゆい姉さんの回答","description":"年上の彼との浮気への不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.27","url":"posts/cheating-anxiety-with-older-ma-20260427.html"},
+{"title":"結婚前の【相談】嫉妬対策について悩んでいます…ゆい姉さんの回答","description":"結婚前の嫉妬対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.27","url":"posts/jealousy-strategy-before-marri-20260427.html"},
+{"title":"年上の彼との【相談】コミュニケーションの秘密について悩んでいます…ゆい姉さんの回答","description":"年上の彼とのコミュニケーションの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.27","url":"posts/communication-secret-with-olde-20260427.html"},
+{"title":"仕事中の【相談】浮気の解決法について悩んでいます…ゆい姉さんの回答","description":"仕事中の浮気の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.27","url":"posts/cheating-success-tip-during-wo-20260427.html"},
+{"title":"年下の彼との【相談】元彼のトラブルについて悩んでいます…ゆい姉さんの回答","description":"年下の彼との元彼のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.27","url":"posts/ex-boyfriend-trouble-with-youn-20260427.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"付き合って3ヶ月の社内恋愛の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.26","url":"posts/office-romance-regret-after-3--20260426.html"},
+{"title":"同僚との【相談】片思いのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"同僚との片思いのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.26","url":"posts/unrequited-love-advice-with-co-20260426.html"},
+{"title":"付き合って1年の【相談】遠距離恋愛の後悔について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の遠距離恋愛の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.26","url":"posts/long-distance-regret-after-1-y-20260426.html"},
+{"title":"付き合って1年の【相談】結婚の解決法について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の結婚の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.26","url":"posts/marriage-success-tip-after-1-y-20260426.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"結婚前の社内恋愛の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.26","url":"posts/office-romance-strategy-before-20260426.html"},
+{"title":"夜の【相談】遠距離恋愛の失敗について悩んでいます…ゆい姉さんの回答","description":"夜の遠距離恋愛の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.25","url":"posts/long-distance-mistake-late-at--20260425.html"},
+{"title":"別れた後の【相談】セフレ・都合のいい関係の後悔について悩んでいます…ゆい姉さんの回答","description":"別れた後のセフレ・都合のいい関係の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.25","url":"posts/friends-with-benefits-regret-a-20260425.html"},
+{"title":"付き合って3ヶ月の【相談】結婚のトラブルについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の結婚のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.25","url":"posts/marriage-trouble-after-3-month-20260425.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"仕事中の社内恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.25","url":"posts/office-romance-panic-during-wo-20260425.html"},
+{"title":"年下の彼との【相談】ファッション・服装の失敗について悩んでいます…ゆい姉さんの回答","description":"年下の彼とのファッション・服装の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.25","url":"posts/fashion-mistake-with-younger-m-20260425.html"},
+{"title":"年上の彼との【相談】別れのトラブルについて悩んでいます…ゆい姉さんの回答","description":"年上の彼との別れのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.24","url":"posts/breakup-trouble-with-older-man-20260424.html"},
+{"title":"同僚との【相談】ファッション・服装の心理について悩んでいます…ゆい姉さんの回答","description":"同僚とのファッション・服装の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.24","url":"posts/fashion-psychology-with-cowork-20260424.html"},
+{"title":"別れた後の【相談】嫉妬のトラブルについて悩んでいます…ゆい姉さんの回答","description":"別れた後の嫉妬のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.24","url":"posts/jealousy-trouble-after-breakup-20260424.html"},
+{"title":"年上の彼との【相談】ファッション・服装の対策について悩んでいます…ゆい姉さんの回答","description":"年上の彼とのファッション・服装の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.24","url":"posts/fashion-strategy-with-older-ma-20260424.html"},
+{"title":"同僚との【相談】お金の悩みのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"同僚とのお金の悩みのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.24","url":"posts/money-advice-with-coworker-20260424.html"},
+{"title":"年上の彼との【相談】コミュニケーションのトラブルについて悩んでいます…ゆい姉さんの回答","description":"年上の彼とのコミュニケーションのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.23","url":"posts/communication-trouble-with-old-20260423.html"},
+{"title":"友達との【相談】自己研鑽・自分磨きの対策について悩んでいます…ゆい姉さんの回答","description":"友達との自己研鑽・自分磨きの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.23","url":"posts/self-improvement-strategy-with-20260423.html"},
+{"title":"付き合って1年の【相談】お金の悩みの不安について悩んでいます…ゆい姉さんの回答","description":"付き合って1年のお金の悩みの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.23","url":"posts/money-anxiety-after-1-year-20260423.html"},
+{"title":"夜の【相談】元彼の失敗について悩んでいます…ゆい姉さんの回答","description":"夜の元彼の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.23","url":"posts/ex-boyfriend-mistake-late-at-n-20260423.html"},
+{"title":"年下の彼との【相談】コミュニケーションのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"年下の彼とのコミュニケーションのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.23","url":"posts/communication-advice-with-youn-20260423.html"},
+{"title":"付き合って1年の【相談】結婚の後悔について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の結婚の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.22","url":"posts/marriage-regret-after-1-year-20260422.html"},
+{"title":"付き合って1年の【相談】片思いの失敗について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の片思いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.22","url":"posts/unrequited-love-mistake-after--20260422.html"},
+{"title":"夜の【相談】ファッション・服装の後悔について悩んでいます…ゆい姉さんの回答","description":"夜のファッション・服装の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.22","url":"posts/fashion-regret-late-at-night-20260422.html"},
+{"title":"付き合って1年の【相談】自己研鑽・自分磨きのトラブルについて悩んでいます…ゆい姉さんの回答","description":"付き合って1年の自己研鑽・自分磨きのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.22","url":"posts/self-improvement-trouble-after-20260422.html"},
+{"title":"年下の彼との【相談】片思いの不安について悩んでいます…ゆい姉さんの回答","description":"年下の彼との片思いの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.22","url":"posts/unrequited-love-anxiety-with-y-20260422.html"},
+{"title":"年下の彼との【相談】義実家・親戚付き合いの悩みについて悩んでいます…ゆい姉さんの回答","description":"年下の彼との義実家・親戚付き合いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.21","url":"posts/in-laws-panic-with-younger-man-20260421.html"},
+{"title":"結婚前の【相談】LINEのメッセージの失敗について悩んでいます…ゆい姉さんの回答","description":"結婚前のLINEのメッセージの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.21","url":"posts/line-message-mistake-before-ma-20260421.html"},
+{"title":"別れた後の【相談】LINEのメッセージの失敗について悩んでいます…ゆい姉さんの回答","description":"別れた後のLINEのメッセージの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.21","url":"posts/line-message-mistake-after-bre-20260421.html"},
+{"title":"夜の【相談】嫉妬の秘密について悩んでいます…ゆい姉さんの回答","description":"夜の嫉妬の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.21","url":"posts/jealousy-secret-late-at-night-20260421.html"},
+{"title":"年下の彼との【相談】片思いの心理について悩んでいます…ゆい姉さんの回答","description":"年下の彼との片思いの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.21","url":"posts/unrequited-love-psychology-wit-20260421.html"},
+{"title":"年下の彼との【相談】コミュニケーションの失敗について悩んでいます…ゆい姉さんの回答","description":"年下の彼とのコミュニケーションの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.20","url":"posts/communication-mistake-with-you-20260420.html"},
+{"title":"年上の彼との【相談】遠距離恋愛の解決法について悩んでいます…ゆい姉さんの回答","description":"年上の彼との遠距離恋愛の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.20","url":"posts/long-distance-success-tip-with-20260420.html"},
+{"title":"年上の彼との【相談】ファッション・服装のトラブルについて悩んでいます…ゆい姉さんの回答","description":"年上の彼とのファッション・服装のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.20","url":"posts/fashion-trouble-with-older-man-20260420.html"},
+{"title":"付き合って3ヶ月の【相談】結婚の失敗について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の結婚の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.20","url":"posts/marriage-mistake-after-3-month-20260420.html"},
+{"title":"付き合って3ヶ月の【相談】夜の生活・性生活の不安について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の夜の生活・性生活の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.20","url":"posts/sex-life-anxiety-after-3-month-20260420.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"別れた後の社内恋愛の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.19","url":"posts/office-romance-strategy-after--20260419.html"},
+{"title":"結婚前の【相談】お金の悩みのトラブルについて悩んでいます…ゆい姉さんの回答","description":"結婚前のお金の悩みのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.19","url":"posts/money-trouble-before-marriage-20260419.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"仕事中の初デートの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.19","url":"posts/first-date-regret-during-work-20260419.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"同僚との社内恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.19","url":"posts/office-romance-panic-with-cowo-20260419.html"},
+{"title":"結婚前の【相談】片思いのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"結婚前の片思いのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.19","url":"posts/unrequited-love-advice-before--20260419.html"},
+{"title":"同僚との【相談】不信感・信頼関係の悩みの対策について悩んでいます…ゆい姉さんの回答","description":"同僚との不信感・信頼関係の悩みの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.18","url":"posts/trust-issues-strategy-with-cow-20260418.html"},
+{"title":"友達との【相談】別れの心理について悩んでいます…ゆい姉さんの回答","description":"友達との別れの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.18","url":"posts/breakup-psychology-with-friend-20260418.html"},
+{"title":"結婚前の【相談】遠距離恋愛の悩みについて悩んでいます…ゆい姉さんの回答","description":"結婚前の遠距離恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.18","url":"posts/long-distance-panic-before-mar-20260418.html"},
+{"title":"結婚前の【相談】セフレ・都合のいい関係の悩みについて悩んでいます…ゆい姉さんの回答","description":"結婚前のセフレ・都合のいい関係の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.18","url":"posts/friends-with-benefits-panic-be-20260418.html"},
+{"title":"仕事中の【相談】義実家・親戚付き合いの失敗について悩んでいます…ゆい姉さんの回答","description":"仕事中の義実家・親戚付き合いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.18","url":"posts/in-laws-mistake-during-work-20260418.html"},
+{"title":"年上の彼との【相談】LINEのメッセージのトラブルについて悩んでいます…ゆい姉さんの回答","description":"年上の彼とのLINEのメッセージのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.17","url":"posts/line-message-trouble-with-olde-20260417.html"},
+{"title":"結婚前の【相談】マッチングアプリの後悔について悩んでいます…ゆい姉さんの回答","description":"結婚前のマッチングアプリの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.17","url":"posts/dating-app-regret-before-marri-20260417.html"},
+{"title":"付き合って1年の【相談】マッチングアプリの不安について悩んでいます…ゆい姉さんの回答","description":"付き合って1年のマッチングアプリの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.17","url":"posts/dating-app-anxiety-after-1-yea-20260417.html"},
+{"title":"付き合って1年の【相談】嫉妬の秘密について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の嫉妬の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.17","url":"posts/jealousy-secret-after-1-year-20260417.html"},
+{"title":"付き合って1年の【相談】cheatingの秘密について悩んでいます…ゆい姉さんの回答","description":"付き合って1年のcheatingの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.17","url":"posts/cheating-secret-after-1-year-20260417.html"},
+{"title":"付き合って1年の【相談】不信感・信頼関係の悩みの秘密について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の不信感・信頼関係の悩みの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.16","url":"posts/trust-issues-secret-after-1-ye-20260416.html"},
+{"title":"同僚との【相談】浮気のトラブルについて悩んでいます…ゆい姉さんの回答","description":"同僚との浮気のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.16","url":"posts/cheating-trouble-with-coworker-20260416.html"},
+{"title":"付き合って1年の【相談】マッチングアプリのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"付き合って1年のマッチングアプリのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.16","url":"posts/dating-app-advice-after-1-year-20260416.html"},
+{"title":"仕事中の【相談】義実家・親戚付き合いの後悔について悩んでいます…ゆい姉さんの回答","description":"仕事中の義実家・親戚付き合いの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.16","url":"posts/in-laws-regret-during-work-20260416.html"},
+{"title":"仕事中の【相談】コミュニケーションの悩みについて悩んでいます…ゆい姉さんの回答","description":"仕事中のコミュニケーションの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.16","url":"posts/communication-panic-during-wor-20260416.html"},
+{"title":"結婚前の【相談】不信感・信頼関係の悩みの対策について悩んでいます…ゆい姉さんの回答","description":"結婚前の不信感・信頼関係の悩みの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.15","url":"posts/trust-issues-strategy-before-m-20260415.html"},
+{"title":"友達との【相談】義実家・親戚付き合いの心理について悩んでいます…ゆい姉さんの回答","description":"友達との義実家・親戚付き合いの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.15","url":"posts/in-laws-psychology-with-friend-20260415.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"結婚前の初デートの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.15","url":"posts/first-date-anxiety-before-marr-20260415.html"},
+{"title":"仕事中の【相談】ファッション・服装の秘密について悩んでいます…ゆい姉さんの回答","description":"仕事中のファッション・服装の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.15","url":"posts/fashion-secret-during-work-20260415.html"},
+{"title":"付き合って3ヶ月の【相談】片思いの解決法について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の片思いの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.15","url":"posts/unrequited-love-success-tip-af-20260415.html"},
+{"title":"年下の彼との【相談】不信感・信頼関係の悩みの後悔について悩んでいます…ゆい姉さんの回答","description":"年下の彼との不信感・信頼関係の悩みの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.14","url":"posts/trust-issues-regret-with-young-20260414.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"付き合って1年の社内恋愛の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.14","url":"posts/office-romance-secret-after-1--20260414.html"},
+{"title":"結婚前の【相談】遠距離恋愛のトラブルについて悩んでいます…ゆい姉さんの回答","description":"結婚前の遠距離恋愛のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.14","url":"posts/long-distance-trouble-before-m-20260414.html"},
+{"title":"友達との【相談】別れの秘密について悩んでいます…ゆい姉さんの回答","description":"友達との別れの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.14","url":"posts/breakup-secret-with-friend-20260414.html"},
+{"title":"仕事中の【相談】元彼の心理について悩んでいます…ゆい姉さんの回答","description":"仕事中の元彼の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.14","url":"posts/ex-boyfriend-psychology-during-20260414.html"},
+{"title":"友達との【相談】自己研鑽・自分磨きの不安について悩んでいます…ゆい姉さんの回答","description":"友達との自己研鑽・自分磨きの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.13","url":"posts/self-improvement-anxiety-with--20260413.html"},
+{"title":"年下の彼との【相談】コミュニケーションの解決法について悩んでいます…ゆい姉さんの回答","description":"年下の彼とのコミュニケーションの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.13","url":"posts/communication-success-tip-with-20260413.html"},
+{"title":"同僚との【相談】不信感・信頼関係の悩みの解決法について悩んでいます…ゆい姉さんの回答","description":"同僚との不信感・信頼関係の悩みの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.13","url":"posts/trust-issues-success-tip-with--20260413.html"},
+{"title":"結婚前の【相談】遠距離恋愛の対策について悩んでいます…ゆい姉さんの回答","description":"結婚前の遠距離恋愛の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.13","url":"posts/long-distance-strategy-before--20260413.html"},
+{"title":"結婚前の【相談】元彼の不安について悩んでいます…ゆい姉さんの回答","description":"結婚前の元彼の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.13","url":"posts/ex-boyfriend-anxiety-before-ma-20260413.html"},
+{"title":"仕事中の【相談】遠距離恋愛の失敗について悩んでいます…ゆい姉さんの回答","description":"仕事中の遠距離恋愛の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.12","url":"posts/long-distance-mistake-during-w-20260412.html"},
+{"title":"夜の【相談】結婚の解決法について悩んでいます…ゆい姉さんの回答","description":"夜の結婚の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.12","url":"posts/marriage-success-tip-late-at-n-20260412.html"},
+{"title":"付き合って1年の【相談】不信感・信頼関係の悩みの心理について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の不信感・信頼関係の悩みの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.12","url":"posts/trust-issues-psychology-after--20260412.html"},
+{"title":"別れた後の【相談】遠距離恋愛の後悔について悩んでいます…ゆい姉さんの回答","description":"別れた後の遠距離恋愛の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.12","url":"posts/long-distance-regret-after-bre-20260412.html"},
+{"title":"付き合って3ヶ月の【相談】cheatingの失敗について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月のcheatingの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.12","url":"posts/cheating-mistake-after-3-month-20260412.html"},
+{"title":"別れた後の【相談】片思いの悩みについて悩んでいます…ゆい姉さんの回答","description":"別れた後の片思いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.11","url":"posts/unrequited-love-panic-after-br-20260411.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"年上の彼との初デートのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.11","url":"posts/first-date-trouble-with-older--20260411.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"別れた後の年の差のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.11","url":"posts/age-gap-trouble-after-breakup-20260411.html"},
+{"title":"別れた後の【相談】自己研鑽・自分磨きのトラブルについて悩んでいます…ゆい姉さんの回答","description":"別れた後の自己研鑽・自分磨きのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.11","url":"posts/self-improvement-trouble-after-20260411.html"},
+{"title":"同僚との【相談】セフレ・都合のいい関係の心理について悩んでいます…ゆい姉さんの回答","description":"同僚とのセフレ・都合のいい関係の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.11","url":"posts/friends-with-benefits-psycholo-20260411.html"},
+{"title":"同僚との【相談】LINEのメッセージの不安について悩んでいます…ゆい姉さんの回答","description":"同僚とのLINEのメッセージの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.10","url":"posts/line-message-anxiety-with-cowo-20260410.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"同僚との社内恋愛の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.10","url":"posts/office-romance-psychology-with-20260410.html"},
+{"title":"夜の【相談】お金の悩みの秘密について悩んでいます…ゆい姉さんの回答","description":"夜のお金の悩みの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.10","url":"posts/money-secret-late-at-night-20260410.html"},
+{"title":"付き合って3ヶ月の【相談】元彼のアドバイスについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の元彼のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.10","url":"posts/ex-boyfriend-advice-after-3-mo-20260410.html"},
+{"title":"夜の【相談】お金の悩みの不安について悩んでいます…ゆい姉さんの回答","description":"夜のお金の悩みの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.10","url":"posts/money-anxiety-late-at-night-20260410.html"},
+{"title":"年下の彼との【相談】結婚の失敗について悩んでいます…ゆい姉さんの回答","description":"年下の彼との結婚の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.09","url":"posts/marriage-mistake-with-younger--20260409.html"},
+{"title":"別れた後の【相談】夜の生活・性生活のトラブルについて悩んでいます…ゆい姉さんの回答","description":"別れた後の夜の生活・性生活のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.09","url":"posts/sex-life-trouble-after-breakup-20260409.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"付き合って1年の年の差の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.09","url":"posts/age-gap-psychology-after-1-yea-20260409.html"},
+{"title":"結婚前の【相談】遠距離恋愛の不安について悩んでいます…ゆい姉さんの回答","description":"結婚前の遠距離恋愛の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.09","url":"posts/long-distance-anxiety-before-m-20260409.html"},
+{"title":"年上の彼との【相談】セフレ・都合のいい関係の不安について悩んでいます…ゆい姉さんの回答","description":"年上の彼とのセフレ・都合のいい関係の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.09","url":"posts/friends-with-benefits-anxiety--20260409.html"},
+{"title":"夜の【相談】別れの切り出し方について悩んでいます…ゆい姉さんの回答","description":"夜の別れの切り出し方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.08","url":"posts/breakup-strategy-late-at-night-20260408.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"付き合って3ヶ月の初デートの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.08","url":"posts/first-date-regret-after-3-mont-20260408.html"},
+{"title":"同僚との【相談】夜の生活・性生活のアドバイスについて悩んでいます…ゆい姉さんの回答","description":"同僚との夜の生活・性生活のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.08","url":"posts/sex-life-advice-with-coworker-20260408.html"},
+{"title":"年上の彼との【相談】ファッション・服装の失敗について悩んでいます…ゆい姉さんの回答","description":"年上の彼とのファッション・服装の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.08","url":"posts/fashion-mistake-with-older-man-20260408.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"年下の彼との社内恋愛のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.08","url":"posts/office-romance-trouble-with-yo-20260408.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"年下の彼との年の差の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.07","url":"posts/age-gap-psychology-with-younge-20260407.html"},
+{"title":"友達との【相談】結婚の解決法について悩んでいます…ゆい姉さんの回答","description":"友達との結婚の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.07","url":"posts/marriage-success-tip-with-frie-20260407.html"},
+{"title":"友達との【相談】自己研鑽・自分磨きの心理について悩んでいます…ゆい姉さんの回答","description":"友達との自己研鑽・自分磨きの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.07","url":"posts/self-improvement-psychology-wi-20260407.html"},
+{"title":"同僚との【相談】不信感・信頼関係の悩みのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"同僚との不信感・信頼関係の悩みのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.07","url":"posts/trust-issues-advice-with-cowor-20260407.html"},
+{"title":"別れた後の【相談】自己研鑽・自分磨きの後悔について悩んでいます…ゆい姉さんの回答","description":"別れた後の自己研鑽・自分磨きの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.07","url":"posts/self-improvement-regret-after--20260407.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"結婚前の初デートの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.06","url":"posts/first-date-strategy-before-mar-20260406.html"},
+{"title":"同僚との【相談】浮気の解決法について悩んでいます…ゆい姉さんの回答","description":"同僚との浮気の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.06","url":"posts/cheating-success-tip-with-cowo-20260406.html"},
+{"title":"夜の【相談】自己研鑽・自分磨きのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"夜の自己研鑽・自分磨きのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.06","url":"posts/self-improvement-advice-late-a-20260406.html"},
+{"title":"結婚前の【相談】ファッション・服装の失敗について悩んでいます…ゆい姉さんの回答","description":"結婚前のファッション・服装の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.06","url":"posts/fashion-mistake-before-marriag-20260406.html"},
+{"title":"結婚前の【相談】ファッション・服装の対策について悩んでいます…ゆい姉さんの回答","description":"結婚前のファッション・服装の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.06","url":"posts/fashion-strategy-before-marria-20260406.html"},
+{"title":"仕事中の【相談】お金の悩みの心理について悩んでいます…ゆい姉さんの回答","description":"仕事中のお金の悩みの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.05","url":"posts/money-psychology-during-work-20260405.html"},
+{"title":"友達との【相談】別れの切り出し方について悩んでいます…ゆい姉さんの回答","description":"友達との別れの切り出し方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.05","url":"posts/breakup-strategy-with-friend-20260405.html"},
+{"title":"年下の彼との【相談】結婚のアドバイスについて悩んでいます…ゆい姉さんの回答","description":"年下の彼との結婚のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.05","url":"posts/marriage-advice-with-younger-m-20260405.html"},
+{"title":"同僚との【相談】ファッション・服装の不安について悩んでいます…ゆい姉さんの回答","description":"同僚とのファッション・服装の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.05","url":"posts/fashion-anxiety-with-coworker-20260405.html"},
+{"title":"夜の【相談】元彼の対策について悩んでいます…ゆい姉さんの回答","description":"夜の元彼の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.05","url":"posts/ex-boyfriend-strategy-late-at--20260405.html"},
+{"title":"結婚前の【相談】お金の悩みの失敗について悩んでいます…ゆい姉さんの回答","description":"結婚前のお金の悩みの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.04","url":"posts/money-mistake-before-marriage-20260404.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"結婚前の年の差の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.04","url":"posts/age-gap-mistake-before-marriag-20260404.html"},
+{"title":"年下の彼との【相談】元彼の後悔について悩んでいます…ゆい姉さんの回答","description":"年下の彼との元彼の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.04","url":"posts/ex-boyfriend-regret-with-young-20260404.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"別れた後の初デートの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.04","url":"posts/first-date-success-tip-after-b-20260404.html"},
+{"title":"年上の彼との【相談】コミュニケーションのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"年上の彼とのコミュニケーションのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.04","url":"posts/communication-advice-with-olde-20260404.html"},
+{"title":"付き合って3ヶ月の【相談】コミュニケーションのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月のコミュニケーションのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.03","url":"posts/communication-advice-after-3-m-20260403.html"},
+{"title":"結婚前の【相談】セフレ・都合のいい関係のアドバイスについて悩んでいます…ゆい姉さんの回答","description":"結婚前のセフレ・都合のいい関係のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.03","url":"posts/friends-with-benefits-advice-b-20260403.html"},
+{"title":"年下の彼との【相談】義実家・親戚付き合いの失敗について悩んでいます…ゆい姉さんの回答","description":"年下の彼との義実家・親戚付き合いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.03","url":"posts/in-laws-mistake-with-younger-m-20260403.html"},
+{"title":"結婚前の【相談】セフレ・都合のいい関係の心理について悩んでいます…ゆい姉さんの回答","description":"結婚前のセフレ・都合のいい関係の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.03","url":"posts/friends-with-benefits-psycholo-20260403.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"夜の社内恋愛の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.03","url":"posts/office-romance-success-tip-lat-20260403.html"},
+{"title":"同僚との【相談】お金の悩みのトラブルについて悩んでいます…ゆい姉さんの回答","description":"同僚とのお金の悩みのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.02","url":"posts/money-trouble-with-coworker-20260402.html"},
+{"title":"付き合って3ヶ月の【相談】別れのトラブルについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の別れのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.02","url":"posts/breakup-trouble-after-3-months-20260402.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"年下の彼との社内恋愛の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.02","url":"posts/office-romance-strategy-with-y-20260402.html"},
+{"title":"仕事中の【相談】不信感・信頼関係の悩みの心理について悩んでいます…ゆい姉さんの回答","description":"仕事中の不信感・信頼関係の悩みの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.02","url":"posts/trust-issues-psychology-during-20260402.html"},
+{"title":"年下の彼との【相談】義実家・親戚付き合いの後悔について悩んでいます…ゆい姉さんの回答","description":"年下の彼との義実家・親戚付き合いの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.02","url":"posts/in-laws-regret-with-younger-ma-20260402.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"結婚前の社内恋愛の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.01","url":"posts/office-romance-success-tip-bef-20260401.html"},
+{"title":"友達との【相談】遠距離恋愛の後悔について悩んでいます…ゆい姉さんの回答","description":"友達との遠距離恋愛の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.01","url":"posts/long-distance-regret-with-frie-20260401.html"},
+{"title":"年上の彼との【相談】セフレ・都合のいい関係の後悔について悩んでいます…ゆい姉さんの回答","description":"年上の彼とのセフレ・都合のいい関係の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.01","url":"posts/friends-with-benefits-regret-w-20260401.html"},
+{"title":"夜の【相談】お金の悩みの解決法について悩んでいます…ゆい姉さんの回答","description":"夜のお金の悩みの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.01","url":"posts/money-success-tip-late-at-nigh-20260401.html"},
+{"title":"夜の【相談】自己研鑽・自分磨きの心理について悩んでいます…ゆい姉さんの回答","description":"夜の自己研鑽・自分磨きの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.04.01","url":"posts/self-improvement-psychology-la-20260401.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"結婚前の年の差の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.31","url":"posts/age-gap-psychology-before-marr-20260331.html"},
+{"title":"夜の【相談】不信感・信頼関係の悩みの秘密について悩んでいます…ゆい姉さんの回答","description":"夜の不信感・信頼関係の悩みの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.31","url":"posts/trust-issues-secret-late-at-ni-20260331.html"},
+{"title":"年下の彼との【相談】片思いの解決法について悩んでいます…ゆい姉さんの回答","description":"年下の彼との片思いの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.31","url":"posts/unrequited-love-success-tip-wi-20260331.html"},
+{"title":"付き合って3ヶ月の【相談】自己研鑽・自分磨きのトラブルについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の自己研鑽・自分磨きのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.31","url":"posts/self-improvement-trouble-after-20260331.html"},
+{"title":"同僚との【相談】結婚の後悔について悩んでいます…ゆい姉さんの回答","description":"同僚との結婚の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.31","url":"posts/marriage-regret-with-coworker-20260331.html"},
+{"title":"別れた後の【相談】お金の悩みのトラブルについて悩んでいます…ゆい姉さんの回答","description":"別れた後のお金の悩みのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.30","url":"posts/money-trouble-after-breakup-20260330.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"付き合って3ヶ月の年の差の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.30","url":"posts/age-gap-mistake-after-3-months-20260330.html"},
+{"title":"付き合って1年の【相談】遠距離恋愛の悩みについて悩んでいます…ゆい姉さんの回答","description":"付き合って1年の遠距離恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.30","url":"posts/long-distance-panic-after-1-ye-20260330.html"},
+{"title":"結婚前の【相談】コミュニケーション戦略について悩んでいます…ゆい姉さんの回答","description":"結婚前のコミュニケーション戦略についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.30","url":"posts/communication-strategy-before--20260330.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"同僚との年の差の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.30","url":"posts/age-gap-panic-with-coworker-20260330.html"},
+{"title":"付き合って1年の【相談】自己研鑽・自分磨きの悩みについて悩んでいます…ゆい姉さんの回答","description":"付き合って1年の自己研鑽・自分磨きの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.29","url":"posts/self-improvement-panic-after-1-20260329.html"},
+{"title":"結婚前の【相談】結婚の解決法について悩んでいます…ゆい姉さんの回答","description":"結婚前の結婚の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.29","url":"posts/marriage-success-tip-before-ma-20260329.html"},
+{"title":"年下の彼との【相談】夜の生活・性生活のトラブルについて悩んでいます…ゆい姉さんの回答","description":"年下の彼との夜の生活・性生活のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.29","url":"posts/sex-life-trouble-with-younger--20260329.html"},
+{"title":"仕事中の【相談】お金の悩みの悩みについて悩んでいます…ゆい姉さんの回答","description":"仕事中のお金の悩みの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.29","url":"posts/money-panic-during-work-20260329.html"},
+{"title":"付き合って1年の【相談】マッチングアプリの解決法について悩んでいます…ゆい姉さんの回答","description":"付き合って1年のマッチングアプリの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.29","url":"posts/dating-app-success-tip-after-1-20260329.html"},
+{"title":"同僚との【相談】嫉妬の不安について悩んでいます…ゆい姉さんの回答","description":"同僚との嫉妬の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.28","url":"posts/jealousy-anxiety-with-coworker-20260328.html"},
+{"title":"夜の【相談】ファッション・服装の悩みについて悩んでいます…ゆい姉さんの回答","description":"夜のファッション・服装の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.28","url":"posts/fashion-panic-late-at-night-20260328.html"},
+{"title":"付き合って1年の【相談】LINEのメッセージの対策について悩んでいます…ゆい姉さんの回答","description":"付き合って1年のLINEのメッセージの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.28","url":"posts/line-message-strategy-after-1--20260328.html"},
+{"title":"付き合って3ヶ月の【相談】夜の生活・性生活の解決法について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の夜の生活・性生活の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.28","url":"posts/sex-life-success-tip-after-3-m-20260328.html"},
+{"title":"付き合って1年の【相談】元彼の心理について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の元彼の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.28","url":"posts/ex-boyfriend-psychology-after--20260328.html"},
+{"title":"年下の彼との【相談】嫉妬対策について悩んでいます…ゆい姉さんの回答","description":"年下の彼との嫉妬対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.27","url":"posts/jealousy-strategy-with-younger-20260327.html"},
+{"title":"友達との【相談】義実家・親戚付き合いの失敗について悩んでいます…ゆい姉さんの回答","description":"友達との義実家・親戚付き合いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.27","url":"posts/in-laws-mistake-with-friend-20260327.html"},
+{"title":"付き合って3ヶ月の【相談】遠距離恋愛の解決法について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の遠距離恋愛の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.27","url":"posts/long-distance-success-tip-afte-20260327.html"},
+{"title":"付き合って3ヶ月の【相談】不信感・信頼関係の悩みの失敗について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の不信感・信頼関係の悩みの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.27","url":"posts/trust-issues-mistake-after-3-m-20260327.html"},
+{"title":"別れた後の【相談】浮気の相談について悩んでいます…ゆい姉さんの回答","description":"別れた後の浮気の相談についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.27","url":"posts/cheating-advice-after-breakup-20260327.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"別れた後の社内恋愛の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.26","url":"posts/office-romance-psychology-afte-20260326.html"},
+{"title":"付き合って1年の【相談】マッチングアプリの悩みについて悩んでいます…ゆい姉さんの回答","description":"付き合って1年のマッチングアプリの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.26","url":"posts/dating-app-panic-after-1-year-20260326.html"},
+{"title":"付き合って3ヶ月の【相談】ファッション・服装の失敗について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月のファッション・服装の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.26","url":"posts/fashion-mistake-after-3-months-20260326.html"},
+{"title":"付き合って1年の【相談】別れの悩みについて悩んでいます…ゆい姉さんの回答","description":"付き合って1年の別れの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.26","url":"posts/breakup-panic-after-1-year-20260326.html"},
+{"title":"結婚前の【相談】嫉妬へのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"結婚前の嫉妬へのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.26","url":"posts/jealousy-advice-before-marriag-20260326.html"},
+{"title":"年下の彼との【相談】嫉妬の心理について悩んでいます…ゆい姉さんの回答","description":"年下の彼との嫉妬の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.25","url":"posts/jealousy-psychology-with-young-20260325.html"},
+{"title":"付き合って1年の【相談】嫉妬克服のコツについて悩んでいます…ゆい姉さんの回答","description":"付き合って1年の嫉妬克服のコツについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.25","url":"posts/jealousy-success-tip-after-1-y-20260325.html"},
+{"title":"別れた後の【相談】LINEのメッセージの対策について悩んでいます…ゆい姉さんの回答","description":"別れた後のLINEのメッセージの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.25","url":"posts/line-message-strategy-after-br-20260325.html"},
+{"title":"仕事中の【相談】自己研鑽・自分磨きの対策について悩んでいます…ゆい姉さんの回答","description":"仕事中の自己研鑽・自分磨きの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.25","url":"posts/self-improvement-strategy-duri-20260325.html"},
+{"title":"別れた後の【相談】結婚の後悔について悩んでいます…ゆい姉さんの回答","description":"別れた後の結婚の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.25","url":"posts/marriage-regret-after-breakup-20260325.html"},
+{"title":"付き合って1年の【相談】元彼のアドバイスについて悩んでいます…ゆい姉さんの回答","description":"付き合って1年の元彼のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.24","url":"posts/ex-boyfriend-advice-after-1-ye-20260324.html"},
+{"title":"年下の彼との【相談】夜の生活・性生活の対策について悩んでいます…ゆい姉さんの回答","description":"年下の彼との夜の生活・性生活の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.24","url":"posts/sex-life-strategy-with-younger-20260324.html"},
+{"title":"夜の【相談】浮気の心理について悩んでいます…ゆい姉さんの回答","description":"夜の浮気の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.24","url":"posts/cheating-psychology-late-at-ni-20260324.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"別れた後の年の差の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.24","url":"posts/age-gap-regret-after-breakup-20260324.html"},
+{"title":"夜の【相談】LINEのメッセージのトラブルについて悩んでいます…ゆい姉さんの回答","description":"夜のLINEのメッセージのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.24","url":"posts/line-message-trouble-late-at-n-20260324.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"結婚前の社内恋愛の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.23","url":"posts/office-romance-anxiety-before--20260323.html"},
+{"title":"付き合って3ヶ月の【相談】夜の生活・性生活の秘密について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の夜の生活・性生活の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.23","url":"posts/sex-life-secret-after-3-months-20260323.html"},
+{"title":"友達との【相談】お金の悩みのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"友達とのお金の悩みのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.23","url":"posts/money-advice-with-friend-20260323.html"},
+{"title":"年下の彼との【相談】義実家・親戚付き合いの心理について悩んでいます…ゆい姉さんの回答","description":"年下の彼との義実家・親戚付き合いの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.23","url":"posts/in-laws-psychology-with-younge-20260323.html"},
+{"title":"付き合って3ヶ月の【相談】夜の生活・性生活の失敗について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の夜の生活・性生活の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.23","url":"posts/sex-life-mistake-after-3-month-20260323.html"},
+{"title":"友達との【相談】LINEのメッセージの後悔について悩んでいます…ゆい姉さんの回答","description":"友達とのLINEのメッセージの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.22","url":"posts/line-message-regret-with-frien-20260322.html"},
+{"title":"付き合って1年の【相談】浮気対策について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の浮気対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.22","url":"posts/cheating-strategy-after-1-year-20260322.html"},
+{"title":"別れた後の【相談】浮気への不安について悩んでいます…ゆい姉さんの回答","description":"別れた後の浮気への不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.22","url":"posts/cheating-anxiety-after-breakup-20260322.html"},
+{"title":"付き合って1年の【相談】自己研鑽・自分磨きの失敗について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の自己研鑽・自分磨きの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.22","url":"posts/self-improvement-mistake-after-20260322.html"},
+{"title":"付き合って3ヶ月の【相談】元彼の対策について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の元彼の対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.22","url":"posts/ex-boyfriend-strategy-after-3--20260322.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"夜の社内恋愛の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.21","url":"posts/office-romance-secret-late-at--20260321.html"},
+{"title":"仕事中の【相談】不信感・信頼関係の悩みの不安について悩んでいます…ゆい姉さんの回答","description":"仕事中の不信感・信頼関係の悩みの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.21","url":"posts/trust-issues-anxiety-during-wo-20260321.html"},
+{"title":"年上の彼との【相談】義実家・親戚付き合いの失敗について悩んでいます…ゆい姉さんの回答","description":"年上の彼との義実家・親戚付き合いの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.21","url":"posts/in-laws-mistake-with-older-man-20260321.html"},
+{"title":"付き合って1年の【相談】マッチングアプリの後悔について悩んでいます…ゆい姉さんの回答","description":"付き合って1年のマッチングアプリの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.21","url":"posts/dating-app-regret-after-1-year-20260321.html"},
+{"title":"年下の彼との【相談】片思いの対策について悩んでいます…ゆい姉さんの回答","description":"年下の彼との片思いの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.21","url":"posts/unrequited-love-strategy-with--20260321.html"},
+{"title":"付き合って1年の【相談】別れのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"付き合って1年の別れのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.20","url":"posts/breakup-advice-after-1-year-20260320.html"},
+{"title":"年下の彼との【相談】夜の生活・性生活の秘密について悩んでいます…ゆい姉さんの回答","description":"年下の彼との夜の生活・性生活の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.20","url":"posts/sex-life-secret-with-younger-m-20260320.html"},
+{"title":"付き合って1年の【相談】セフレ・都合のいい関係の心理について悩んでいます…ゆい姉さんの回答","description":"付き合って1年のセフレ・都合のいい関係の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.20","url":"posts/friends-with-benefits-psycholo-20260320.html"},
+{"title":"年下の彼との【相談】元彼の秘密について悩んでいます…ゆい姉さんの回答","description":"年下の彼との元彼の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.20","url":"posts/ex-boyfriend-secret-with-young-20260320.html"},
+{"title":"夜の【相談】浮気のトラブルについて悩んでいます…ゆい姉さんの回答","description":"夜の浮気のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.20","url":"posts/cheating-trouble-late-at-night-20260320.html"},
+{"title":"別れた後の【相談】マッチングアプリの対策について悩んでいます…ゆい姉さんの回答","description":"別れた後のマッチングアプリの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.19","url":"posts/dating-app-strategy-after-brea-20260319.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"付き合って3ヶ月の社内恋愛の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.19","url":"posts/office-romance-mistake-after-3-20260319.html"},
+{"title":"夜の【相談】別れの失敗について悩んでいます…ゆい姉さんの回答","description":"夜の別れの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.19","url":"posts/breakup-mistake-late-at-night-20260319.html"},
+{"title":"仕事中の【相談】LINEのメッセージの失敗について悩んでいます…ゆい姉さんの回答","description":"仕事中のLINEのメッセージの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.19","url":"posts/line-message-mistake-during-wo-20260319.html"},
+{"title":"別れた後の【相談】義実家・親戚付き合いの後悔について悩んでいます…ゆい姉さんの回答","description":"別れた後の義実家・親戚付き合いの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.19","url":"posts/in-laws-regret-after-breakup-20260319.html"},
+{"title":"年上の彼との【相談】夜の生活・性生活の悩みについて悩んでいます…ゆい姉さんの回答","description":"年上の彼との夜の生活・性生活の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.18","url":"posts/sex-life-panic-with-older-man-20260318.html"},
+{"title":"年下の彼との【相談】マッチングアプリのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"年下の彼とのマッチングアプリのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.18","url":"posts/dating-app-advice-with-younger-20260318.html"},
+{"title":"結婚前の【相談】夜の生活・性生活の秘密について悩んでいます…ゆい姉さんの回答","description":"結婚前の夜の生活・性生活の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.18","url":"posts/sex-life-secret-before-marriag-20260318.html"},
+{"title":"年下の彼との【相談】義実家・親戚付き合いの対策について悩んでいます…ゆい姉さんの回答","description":"年下の彼との義実家・親戚付き合いの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.18","url":"posts/in-laws-strategy-with-younger--20260318.html"},
+{"title":"年上の彼との【相談】ファッション・服装の悩みについて悩んでいます…ゆい姉さんの回答","description":"年上の彼とのファッション・服装の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.18","url":"posts/fashion-panic-with-older-man-20260318.html"},
+{"title":"友達との【相談】嫉妬のトラブルについて悩んでいます…ゆい姉さんの回答","description":"友達との嫉妬のトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.17","url":"posts/jealousy-trouble-with-friend-20260317.html"},
+{"title":"付き合って3ヶ月の【相談】ファッション・服装の心理について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月のファッション・服装の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.17","url":"posts/fashion-psychology-after-3-mon-20260317.html"},
+{"title":"別れた後の【相談】別れの解決法について悩んでいます…ゆい姉さんの回答","description":"別れた後の別れの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.17","url":"posts/breakup-success-tip-after-brea-20260317.html"},
+{"title":"年上の彼との【相談】浮気の相談について悩んでいます…ゆい姉さんの回答","description":"年上の彼との浮気の相談についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.17","url":"posts/cheating-advice-with-older-man-20260317.html"},
+{"title":"仕事中の【相談】夜の生活・性生活の悩みについて悩んでいます…ゆい姉さんの回答","description":"仕事中の夜の生活・性生活の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.17","url":"posts/sex-life-panic-during-work-20260317.html"},
+{"title":"仕事中の【相談】マッチングアプリの秘密について悩んでいます…ゆい姉さんの回答","description":"仕事中のマッチングアプリの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.16","url":"posts/dating-app-secret-during-work-20260316.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"友達との年の差の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.16","url":"posts/age-gap-secret-with-friend-20260316.html"},
+{"title":"年下の彼との【相談】LINEのメッセージの対策について悩んでいます…ゆい姉さんの回答","description":"年下の彼とのLINEのメッセージの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.16","url":"posts/line-message-strategy-with-you-20260316.html"},
+{"title":"友達との【相談】義実家・親戚付き合いの悩みについて悩んでいます…ゆい姉さんの回答","description":"友達との義実家・親戚付き合いの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.16","url":"posts/in-laws-panic-with-friend-20260316.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"年下の彼との初デートの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.16","url":"posts/first-date-psychology-with-you-20260316.html"},
+{"title":"仕事中の【相談】コミュニケーション戦略について悩んでいます…ゆい姉さんの回答","description":"仕事中のコミュニケーション戦略についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.15","url":"posts/communication-strategy-during--20260315.html"},
+{"title":"年上の彼との【相談】ファッション・服装の後悔について悩んでいます…ゆい姉さんの回答","description":"年上の彼とのファッション・服装の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.15","url":"posts/fashion-regret-with-older-man-20260315.html"},
+{"title":"友達との【相談】ファッション・服装の悩みについて悩んでいます…ゆい姉さんの回答","description":"友達とのファッション・服装の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.15","url":"posts/fashion-panic-with-friend-20260315.html"},
+{"title":"友達との【相談】嫉妬の不安について悩んでいます…ゆい姉さんの回答","description":"友達との嫉妬の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.15","url":"posts/jealousy-anxiety-with-friend-20260315.html"},
+{"title":"付き合って1年の【相談】自己研鑽・自分磨きの秘密について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の自己研鑽・自分磨きの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.15","url":"posts/self-improvement-secret-after--20260315.html"},
+{"title":"年上の彼との【相談】セフレ・都合のいい関係の悩みについて悩んでいます…ゆい姉さんの回答","description":"年上の彼とのセフレ・都合のいい関係の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.14","url":"posts/friends-with-benefits-panic-wi-20260314.html"},
+{"title":"結婚前の【相談】お金の悩みの不安について悩んでいます…ゆい姉さんの回答","description":"結婚前のお金の悩みの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.14","url":"posts/money-anxiety-before-marriage-20260314.html"},
+{"title":"同僚との【相談】遠距離恋愛の悩みについて悩んでいます…ゆい姉さんの回答","description":"同僚との遠距離恋愛の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.14","url":"posts/long-distance-panic-with-cowor-20260314.html"},
+{"title":"付き合って3ヶ月の【相談】元彼の秘密について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の元彼の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.14","url":"posts/ex-boyfriend-secret-after-3-mo-20260314.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"同僚との初デートの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.14","url":"posts/first-date-anxiety-with-cowork-20260314.html"},
+{"title":"年下の彼との【相談】cheatingの失敗について悩んでいます…ゆい姉さんの回答","description":"年下の彼とのcheatingの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.13","url":"posts/cheating-mistake-with-younger--20260313.html"},
+{"title":"仕事中の【相談】自己研鑽・自分磨きの解決法について悩んでいます…ゆい姉さんの回答","description":"仕事中の自己研鑽・自分磨きの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.13","url":"posts/self-improvement-success-tip-d-20260313.html"},
+{"title":"年下の彼との【相談】別れの悩みについて悩んでいます…ゆい姉さんの回答","description":"年下の彼との別れの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.13","url":"posts/breakup-panic-with-younger-man-20260313.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"夜の年の差の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.13","url":"posts/age-gap-secret-late-at-night-20260313.html"},
+{"title":"年上の彼との【相談】セフレ・都合のいい関係の心理について悩んでいます…ゆい姉さんの回答","description":"年上の彼とのセフレ・都合のいい関係の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.13","url":"posts/friends-with-benefits-psycholo-20260313.html"},
+{"title":"仕事中の【相談】コミュニケーションの後悔について悩んでいます…ゆい姉さんの回答","description":"仕事中のコミュニケーションの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.12","url":"posts/communication-regret-during-wo-20260312.html"},
+{"title":"夜の【相談】お金の悩みの悩みについて悩んでいます…ゆい姉さんの回答","description":"夜のお金の悩みの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.12","url":"posts/money-panic-late-at-night-20260312.html"},
+{"title":"別れた後の【相談】結婚の心理について悩んでいます…ゆい姉さんの回答","description":"別れた後の結婚の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.12","url":"posts/marriage-psychology-after-brea-20260312.html"},
+{"title":"別れた後の【相談】義実家・親戚付き合いの心理について悩んでいます…ゆい姉さんの回答","description":"別れた後の義実家・親戚付き合いの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.12","url":"posts/in-laws-psychology-after-break-20260312.html"},
+{"title":"結婚前の【相談】セフレ・都合のいい関係の失敗について悩んでいます…ゆい姉さんの回答","description":"結婚前のセフレ・都合のいい関係の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.12","url":"posts/friends-with-benefits-mistake--20260312.html"},
+{"title":"付き合って3ヶ月の【相談】コミュニケーションの心理について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月のコミュニケーションの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.11","url":"posts/communication-psychology-after-20260311.html"},
+{"title":"年上の彼との【相談】お金の悩みの後悔について悩んでいます…ゆい姉さんの回答","description":"年上の彼とのお金の悩みの後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.11","url":"posts/money-regret-with-older-man-20260311.html"},
+{"title":"年下の彼との【相談】マッチングアプリの悩みについて悩んでいます…ゆい姉さんの回答","description":"年下の彼とのマッチングアプリの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.11","url":"posts/dating-app-panic-with-younger--20260311.html"},
+{"title":"付き合って1年の【相談】マッチングアプリの対策について悩んでいます…ゆい姉さんの回答","description":"付き合って1年のマッチングアプリの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.11","url":"posts/dating-app-strategy-after-1-ye-20260311.html"},
+{"title":"付き合って3ヶ月の【相談】コミュニケーションのトラブルについて悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月のコミュニケーションのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.11","url":"posts/communication-trouble-after-3--20260311.html"},
+{"title":"友達との【相談】別れの悩みについて悩んでいます…ゆい姉さんの回答","description":"友達との別れの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.10","url":"posts/breakup-panic-with-friend-20260310.html"},
+{"title":"年下の彼との【相談】義実家・親戚付き合いのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"年下の彼との義実家・親戚付き合いのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.10","url":"posts/in-laws-advice-with-younger-ma-20260310.html"},
+{"title":"結婚前の【相談】自己研鑽・自分磨きの不安について悩んでいます…ゆい姉さんの回答","description":"結婚前の自己研鑽・自分磨きの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.10","url":"posts/self-improvement-anxiety-befor-20260310.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"年上の彼との初デートのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.10","url":"posts/first-date-advice-with-older-m-20260310.html"},
+{"title":"友達との【相談】自己研鑽・自分磨きの失敗について悩んでいます…ゆい姉さんの回答","description":"友達との自己研鑽・自分磨きの失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.10","url":"posts/self-improvement-mistake-with--20260310.html"},
+{"title":"同僚との【相談】お金の悩みの秘密について悩んでいます…ゆい姉さんの回答","description":"同僚とのお金の悩みの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.09","url":"posts/money-secret-with-coworker-20260309.html"},
+{"title":"付き合って1年の【相談】セフレ・都合のいい関係の後悔について悩んでいます…ゆい姉さんの回答","description":"付き合って1年のセフレ・都合のいい関係の後悔についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.09","url":"posts/friends-with-benefits-regret-a-20260309.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"仕事中の初デートのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.09","url":"posts/first-date-advice-during-work-20260309.html"},
+{"title":"付き合って1年の【相談】別れの不安について悩んでいます…ゆい姉さんの回答","description":"付き合って1年の別れの不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.09","url":"posts/breakup-anxiety-after-1-year-20260309.html"},
+{"title":"夜の【相談】元彼の心理について悩んでいます…ゆい姉さんの回答","description":"夜の元彼の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.09","url":"posts/ex-boyfriend-psychology-late-a-20260309.html"},
+{"title":"付き合って3ヶ月の【相談】自己研鑽・自分磨きの心理について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の自己研鑽・自分磨きの心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.08","url":"posts/self-improvement-psychology-af-20260308.html"},
+{"title":"夜の【相談】不信感・信頼関係の悩みのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"夜の不信感・信頼関係の悩みのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.08","url":"posts/trust-issues-advice-late-at-ni-20260308.html"},
+{"title":"仕事中の【相談】浮気対策について悩んでいます…ゆい姉さんの回答","description":"仕事中の浮気対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.08","url":"posts/cheating-strategy-during-work-20260308.html"},
+{"title":"年下の彼との【相談】別れの解決法について悩んでいます…ゆい姉さんの回答","description":"年下の彼との別れの解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.08","url":"posts/breakup-success-tip-with-young-20260308.html"},
+{"title":"仕事中の【相談】自己研鑽・自分磨きの悩みについて悩んでいます…ゆい姉さんの回答","description":"仕事中の自己研鑽・自分磨きの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.08","url":"posts/self-improvement-panic-during--20260308.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"付き合って1年の社内恋愛の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.07","url":"posts/office-romance-mistake-after-1-20260307.html"},
+{"title":"結婚前の【相談】片思いのトラブルについて悩んでいます…ゆい姉さんの回答","description":"結婚前の片思いのトラブルについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.07","url":"posts/unrequited-love-trouble-before-20260307.html"},
+{"title":"年上の彼との【相談】元彼の心理について悩んでいます…ゆい姉さんの回答","description":"年上の彼との元彼の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.07","url":"posts/ex-boyfriend-psychology-with-o-20260307.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"付き合って1年の初デートの秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.07","url":"posts/first-date-secret-after-1-year-20260307.html"},
+{"title":"年下の彼との【相談】自己研鑽・自分磨きの悩みについて悩んでいます…ゆい姉さんの回答","description":"年下の彼との自己研鑽・自分磨きの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.07","url":"posts/self-improvement-panic-with-yo-20260307.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"別れた後の初デートの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.06","url":"posts/first-date-panic-after-breakup-20260306.html"},
+{"title":"別れた後の【相談】嫉妬の秘密について悩んでいます…ゆい姉さんの回答","description":"別れた後の嫉妬の秘密についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.06","url":"posts/jealousy-secret-after-breakup-20260306.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"夜の年の差の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.06","url":"posts/age-gap-panic-late-at-night-20260306.html"},
+{"title":"付き合って3ヶ月の【相談】元彼の失敗について悩んでいます…ゆい姉さんの回答","description":"付き合って3ヶ月の元彼の失敗についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.06","url":"posts/ex-boyfriend-mistake-after-3-m-20260306.html"},
+{"title":"仕事中の【相談】元彼の不安について悩んでいます…ゆい姉さんの回答","description":"仕事中の元彼の不安についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.06","url":"posts/ex-boyfriend-anxiety-during-wo-20260306.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"同僚との年の差のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.05","url":"posts/age-gap-advice-with-coworker-20260305.html"},
+{"title":"結婚前の【相談】結婚のアドバイスについて悩んでいます…ゆい姉さんの回答","description":"結婚前の結婚のアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.05","url":"posts/marriage-advice-before-marriag-20260305.html"},
+{"title":"別れた後の【相談】別れのアドバイスについて悩んでいます…ゆい姉さんの回答","description":"別れた後の別れのアドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.05","url":"posts/breakup-advice-after-breakup-20260305.html"},
+{"title":"付き合って1年の【相談】お金の悩みの対策について悩んでいます…ゆい姉さんの回答","description":"付き合って1年のお金の悩みの対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.05","url":"posts/money-strategy-after-1-year-20260305.html"},
+{"title":"年上の彼との【相談】ファッション・服装の解決法について悩んでいます…ゆい姉さんの回答","description":"年上の彼とのファッション・服装の解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.05","url":"posts/fashion-success-tip-with-older-20260305.html"},
+{"title":"【相談】付き合う上での境界線の引き方について悩んでいます…ゆい姉さんの回答","description":"付き合う上での境界線の引き方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.04","url":"posts/boundaries-in-dating-20260304.html"},
+{"title":"【相談】パートナー間の同意と尊重についてについて悩んでいます…ゆい姉さんの回答","description":"パートナー間の同意と尊重についてについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.04","url":"posts/consent-in-relationships-20260304.html"},
+{"title":"【相談】安全なセクスティングのルールについて悩んでいます…ゆい姉さんの回答","description":"安全なセクスティングのルールについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.04","url":"posts/safe-sexting-practices-20260304.html"},
+{"title":"【相談】なりすまし（キャットフィッシング） 兆候について悩んでいます…ゆい姉さんの回答","description":"なりすまし（キャットフィッシング） 兆候についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.04","url":"posts/catfishing-signs-20260304.html"},
+{"title":"【相談】国際ロマンス詐欺の見分け方について悩んでいます…ゆい姉さんの回答","description":"国際ロマンス詐欺の見分け方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.04","url":"posts/how-to-spot-a-romance-scammer-20260304.html"},
+{"title":"【相談】シニア世代のマッチングアプリ事情について悩んでいます…ゆい姉さんの回答","description":"シニア世代のマッチングアプリ事情についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.03","url":"posts/online-dating-for-seniors-20260303.html"},
+{"title":"【相談】中高年の恋愛・デートのコツについて悩んでいます…ゆい姉さんの回答","description":"中高年の恋愛・デートのコツについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.03","url":"posts/senior-dating-tips-20260303.html"},
+{"title":"【相談】50代からの恋愛について悩んでいます…ゆい姉さんの回答","description":"50代からの恋愛についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.03","url":"posts/dating-after-50-20260303.html"},
+{"title":"【相談】40代からの恋愛について悩んでいます…ゆい姉さんの回答","description":"40代からの恋愛についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.03","url":"posts/dating-after-40-20260303.html"},
+{"title":"【相談】シングルファザー・マザーの恋愛アドバイスについて悩んでいます…ゆい姉さんの回答","description":"シングルファザー・マザーの恋愛アドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.03","url":"posts/single-parent-dating-advice-20260303.html"},
+{"title":"【相談】継親（ステップファミリー）の悩みについて悩んでいます…ゆい姉さんの回答","description":"継親（ステップファミリー）の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.02","url":"posts/step-parenting-challenges-20260302.html"},
+{"title":"【相談】養子縁組を考える際のポイントについて悩んでいます…ゆい姉さんの回答","description":"養子縁組を考える際のポイントについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.02","url":"posts/adoption-considerations-20260302.html"},
+{"title":"【相談】不妊治療の悩みとパートナーとの絆について悩んでいます…ゆい姉さんの回答","description":"不妊治療の悩みとパートナーとの絆についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.02","url":"posts/infertility-struggles-content-20260302.html"},
+{"title":"【相談】子供を持たない選択をしたカップルの悩みについて悩んでいます…ゆい姉さんの回答","description":"子供を持たない選択をしたカップルの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.02","url":"posts/childfree-by-choice-relationsh-20260302.html"},
+{"title":"【相談】カップルの共同口座は作るべき？について悩んでいます…ゆい姉さんの回答","description":"カップルの共同口座は作るべき？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.02","url":"posts/should-we-have-a-joint-bank-ac-20260302.html"},
+{"title":"【相談】結婚後の姓の変更：メリットとデメリットについて悩んでいます…ゆい姉さんの回答","description":"結婚後の姓の変更：メリットとデメリットについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.01","url":"posts/changing-last-name-pros-and-co-20260301.html"},
+{"title":"結婚前の【相談】マリッジブルー（結婚前の不安）について悩んでいます…ゆい姉さんの回答","description":"結婚前のマリッジブルー（結婚前の不安）についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.01","url":"posts/cold-feet-before-marriage-20260301.html"},
+{"title":"【相談】結婚準備のストレスについて悩んでいます…ゆい姉さんの回答","description":"結婚準備のストレスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.01","url":"posts/wedding-planning-stress-20260301.html"},
+{"title":"【相談】結婚前カウンセリングのメリットについて悩んでいます…ゆい姉さんの回答","description":"結婚前カウンセリングのメリットについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.01","url":"posts/premarital-counseling-benefits-20260301.html"},
+{"title":"【相談】性的ファンタジーの共有についてについて悩んでいます…ゆい姉さんの回答","description":"性的ファンタジーの共有についてについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.03.01","url":"posts/talking-about-fantasies-20260301.html"},
+{"title":"【相談】性的嗜好の話し合い方について悩んでいます…ゆい姉さんの回答","description":"性的嗜好の話し合い方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.28","url":"posts/kink-negotiation-for-beginners-20260228.html"},
+{"title":"【相談】性欲が強いパートナーへの悩みについて悩んでいます…ゆい姉さんの回答","description":"性欲が強いパートナーへの悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.28","url":"posts/high-libido-partner-advice-20260228.html"},
+{"title":"【相談】セックスレス・性欲減退の悩みについて悩んでいます…ゆい姉さんの回答","description":"セックスレス・性欲減退の悩みについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.28","url":"posts/low-libido-partner-advice-20260228.html"},
+{"title":"【相談】性の不一致について悩んでいます…ゆい姉さんの回答","description":"性の不一致についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.28","url":"posts/sexual-incompatibility-20260228.html"},
+{"title":"【相談】重くならずに要望を伝える方法について悩んでいます…ゆい姉さんの回答","description":"重くならずに要望を伝える方法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.28","url":"posts/how-to-express-needs-without-n-20260228.html"},
+{"title":"【相談】無視するパートナー（サイレント・トリートメント）への対処法について悩んでいます…ゆい姉さんの回答","description":"無視するパートナー（サイレント・トリートメント）への対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.27","url":"posts/silent-treatment-how-to-break--20260227.html"},
+{"title":"【相談】関係を深めるための喧嘩のルールについて悩んでいます…ゆい姉さんの回答","description":"関係を深めるための喧嘩のルールについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.27","url":"posts/fighting-fair-in-relationships-20260227.html"},
+{"title":"【相談】効果的な謝罪の方法について悩んでいます…ゆい姉さんの回答","description":"効果的な謝罪の方法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.27","url":"posts/how-to-apologize-effectively-20260227.html"},
+{"title":"【相談】愛を伝える5つの方法（ラブランゲージ）について悩んでいます…ゆい姉さんの回答","description":"愛を伝える5つの方法（ラブランゲージ）についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.27","url":"posts/love-languages-explanation-20260227.html"},
+{"title":"【相談】回避型愛着スタイルの人との付き合い方について悩んでいます…ゆい姉さんの回答","description":"回避型愛着スタイルの人との付き合い方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.27","url":"posts/avoidant-attachment-style-dati-20260227.html"},
+{"title":"【相談】不安型愛着スタイルの恋愛アドバイスについて悩んでいます…ゆい姉さんの回答","description":"不安型愛着スタイルの恋愛アドバイスについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.26","url":"posts/anxious-attachment-style-advic-20260226.html"},
+{"title":"【相談】見捨てられ不安の克服について悩んでいます…ゆい姉さんの回答","description":"見捨てられ不安の克服についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.26","url":"posts/fear-of-abandonment-20260226.html"},
+{"title":"【相談】責任を負いたがらない男性の心理について悩んでいます…ゆい姉さんの回答","description":"責任を負いたがらない男性の心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.26","url":"posts/commitment-issues-in-men-20260226.html"},
+{"title":"【相談】親密になることへの恐怖心について悩んでいます…ゆい姉さんの回答","description":"親密になることへの恐怖心についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.26","url":"posts/fear-of-intimacy-20260226.html"},
+{"title":"【相談】有害な恋愛後の自己肯定感の回復について悩んでいます…ゆい姉さんの回答","description":"有害な恋愛後の自己肯定感の回復についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.26","url":"posts/self-love-after-a-toxic-relati-20260226.html"},
+{"title":"【相談】リバウンド・リレーションシップ（失恋直後の恋愛）はうまくいく？について悩んでいます…ゆい姉さんの回答","description":"リバウンド・リレーションシップ（失恋直後の恋愛）はうまくいく？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.25","url":"posts/rebound-relationships-do-they--20260225.html"},
+{"title":"【相談】元彼を完全に断ち切る方法について悩んでいます…ゆい姉さんの回答","description":"元彼を完全に断ち切る方法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.25","url":"posts/how-to-block-an-ex-completely-20260225.html"},
+{"title":"【相談】元彼からのストーカー被害への対策について悩んでいます…ゆい姉さんの回答","description":"元彼からのストーカー被害への対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.25","url":"posts/my-ex-is-stalking-me-20260225.html"},
+{"title":"【相談】浮気を許す方法について悩んでいます…ゆい姉さんの回答","description":"浮気を許す方法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.25","url":"posts/how-to-forgive-a-cheater-20260225.html"},
+{"title":"【相談】マイクロチーティング（浮気未満の浮気）の事例について悩んでいます…ゆい姉さんの回答","description":"マイクロチーティング（浮気未満の浮気）の事例についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.25","url":"posts/micro-cheating-examples-20260225.html"},
+{"title":"【相談】セクスティング（性的なメッセージ）は浮気？について悩んでいます…ゆい姉さんの回答","description":"セクスティング（性的なメッセージ）は浮気？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.24","url":"posts/sexting-is-it-cheating-20260224.html"},
+{"title":"【相談】心の浮気と体の浮気の違いについて悩んでいます…ゆい姉さんの回答","description":"心の浮気と体の浮気の違いについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.24","url":"posts/emotional-affair-vs-physical-a-20260224.html"},
+{"title":"【相談】なぜ女性は浮気をするの？について悩んでいます…ゆい姉さんの回答","description":"なぜ女性は浮気をするの？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.24","url":"posts/why-do-women-cheat-20260224.html"},
+{"title":"【相談】なぜ男性は浮気をするの？について悩んでいます…ゆい姉さんの回答","description":"なぜ男性は浮気をするの？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.24","url":"posts/why-do-men-cheat-20260224.html"},
+{"title":"【相談】浮気が発覚した後の信頼回復について悩んでいます…ゆい姉さんの回答","description":"浮気が発覚した後の信頼回復についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.24","url":"posts/affair-recovery-can-trust-be-r-20260224.html"},
+{"title":"【相談】既婚者への片思い（不倫の悩み）について悩んでいます…ゆい姉さんの回答","description":"既婚者への片思い（不倫の悩み）についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.23","url":"posts/unrequited-love-for-a-married--20260223.html"},
+{"title":"【相談】職場恋愛で別れた後の気まずさ解消法について悩んでいます…ゆい姉さんの回答","description":"職場恋愛で別れた後の気まずさ解消法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.23","url":"posts/breakup-at-work-how-to-handle--20260223.html"},
+{"title":"社内恋愛の注意点！仕事と恋を両立させるためのルール","description":"社内恋愛を隠し通すコツについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.23","url":"posts/office-romance-secrecy-tips-20260223.html"},
+{"title":"【相談】上司との恋愛：メリットとデメリットについて悩んでいます…ゆい姉さんの回答","description":"上司との恋愛：メリットとデメリットについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.23","url":"posts/dating-the-boss-pros-and-cons-20260223.html"},
+{"title":"【相談】職場恋愛：同僚との交際について悩んでいます…ゆい姉さんの回答","description":"職場恋愛：同僚との交際についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.23","url":"posts/workplace-romance-dating-a-cow-20260223.html"},
+{"title":"【相談】親友を好きになってしまった時の対処法について悩んでいます…ゆい姉さんの回答","description":"親友を好きになってしまった時の対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.22","url":"posts/falling-in-love-with-best-frie-20260222.html"},
+{"title":"【相談】友達の元彼への片思いについて悩んでいます…ゆい姉さんの回答","description":"友達の元彼への片思いについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.22","url":"posts/crush-on-a-friends-ex-20260222.html"},
+{"title":"【相談】先生・教授への片思いについて悩んでいます…ゆい姉さんの回答","description":"先生・教授への片思いについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.22","url":"posts/crush-on-a-teacherprofessor-20260222.html"},
+{"title":"【相談】叶わぬ片思いからの立ち直り方について悩んでいます…ゆい姉さんの回答","description":"叶わぬ片思いからの立ち直り方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.22","url":"posts/one-sided-love-how-to-move-on-20260222.html"},
+{"title":"【相談】セフレに本気になってしまった時について悩んでいます…ゆい姉さんの回答","description":"セフレに本気になってしまった時についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.22","url":"posts/friends-with-benefits-catching-20260222.html"},
+{"title":"【相談】オープン・リレーションシップのルールについて悩んでいます…ゆい姉さんの回答","description":"オープン・リレーションシップのルールについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.21","url":"posts/open-relationship-rules-20260221.html"},
+{"title":"【相談】ポリアモリー（複数愛）についてについて悩んでいます…ゆい姉さんの回答","description":"ポリアモリー（複数愛）についてについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.21","url":"posts/polyamory-is-it-right-for-me-20260221.html"},
+{"title":"【相談】パートナーへのカミングアウトについて悩んでいます…ゆい姉さんの回答","description":"パートナーへのカミングアウトについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.21","url":"posts/lgbtq-coming-out-to-partner-20260221.html"},
+{"title":"【相談】配偶者と死別した人との恋愛について悩んでいます…ゆい姉さんの回答","description":"配偶者と死別した人との恋愛についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.21","url":"posts/dating-a-widowwidower-20260221.html"},
+{"title":"【相談】子持ちバツイチ男性との恋愛について悩んでいます…ゆい姉さんの回答","description":"子持ちバツイチ男性との恋愛についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.21","url":"posts/dating-a-divorced-man-with-kid-20260221.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"年下彼氏との年の差恋愛についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.20","url":"posts/age-gap-relationship-younger-m-20260220.html"},
+{"title":"年の差恋愛の悩み…ジェネレーションギャップを乗り越える方法","description":"15歳年上の彼との年の差恋愛についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.20","url":"posts/age-gap-relationship-15-years--20260220.html"},
+{"title":"【相談】遠距離恋愛の解消：どちらが引っ越すべき？について悩んでいます…ゆい姉さんの回答","description":"遠距離恋愛の解消：どちらが引っ越すべき？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.20","url":"posts/closing-the-distance-who-moves-20260220.html"},
+{"title":"【相談】遠距離恋愛での浮気の兆候について悩んでいます…ゆい姉さんの回答","description":"遠距離恋愛での浮気の兆候についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.20","url":"posts/cheating-in-ldr-signs-to-watch-20260220.html"},
+{"title":"【相談】遠距離恋愛での信頼関係の築き方について悩んでいます…ゆい姉さんの回答","description":"遠距離恋愛での信頼関係の築き方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.20","url":"posts/trust-issues-in-long-distance-20260220.html"},
+{"title":"【相談】遠距離恋愛の会う頻度の正解について悩んでいます…ゆい姉さんの回答","description":"遠距離恋愛の会う頻度の正解についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.19","url":"posts/how-often-to-visit-in-ldr-20260219.html"},
+{"title":"【相談】遠距離恋愛を長続きさせるコツについて悩んでいます…ゆい姉さんの回答","description":"遠距離恋愛を長続きさせるコツについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.19","url":"posts/long-distance-relationship-hac-20260219.html"},
+{"title":"【相談】国際恋愛での文化の違いについて悩んでいます…ゆい姉さんの回答","description":"国際恋愛での文化の違いについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.19","url":"posts/cultural-differences-in-relati-20260219.html"},
+{"title":"【相談】親に交際を反対された時の対処法について悩んでいます…ゆい姉さんの回答","description":"親に交際を反対された時の対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.19","url":"posts/my-parents-dont-approve-of-my--20260219.html"},
+{"title":"【相談】義母との確執・トラブル解決法について悩んでいます…ゆい姉さんの回答","description":"義母との確執・トラブル解決法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.19","url":"posts/in-law-problems-mother-in-law--20260219.html"},
+{"title":"【相談】失業したパートナーの支え方について悩んでいます…ゆい姉さんの回答","description":"失業したパートナーの支え方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.18","url":"posts/supporting-a-partner-through-j-20260218.html"},
+{"title":"【相談】パートナーがうつになった時の支え方について悩んでいます…ゆい姉さんの回答","description":"パートナーがうつになった時の支え方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.18","url":"posts/how-to-handle-partners-depress-20260218.html"},
+{"title":"【相談】怒りっぽいパートナーへの対処法について悩んでいます…ゆい姉さんの回答","description":"怒りっぽいパートナーへの対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.18","url":"posts/dealing-with-partners-anger-is-20260218.html"},
+{"title":"【相談】束縛・支配的なパートナーへの対処法について悩んでいます…ゆい姉さんの回答","description":"束縛・支配的なパートナーへの対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.18","url":"posts/my-partner-is-controlling-20260218.html"},
+{"title":"【相談】ガスライティング（心理的支配）のサインについて悩んでいます…ゆい姉さんの回答","description":"ガスライティング（心理的支配）のサインについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.18","url":"posts/gaslighting-in-relationships-w-20260218.html"},
+{"title":"【相談】感情的な操作（マニピュレーション）のサインについて悩んでいます…ゆい姉さんの回答","description":"感情的な操作（マニピュレーション）のサインについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.17","url":"posts/signs-of-emotional-manipulatio-20260217.html"},
+{"title":"【相談】元彼との復縁：すべきかどうか？について悩んでいます…ゆい姉さんの回答","description":"元彼との復縁：すべきかどうか？についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.17","url":"posts/getting-back-with-an-ex-good-o-20260217.html"},
+{"title":"【相談】相手を傷つけずに別れる方法について悩んでいます…ゆい姉さんの回答","description":"相手を傷つけずに別れる方法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.17","url":"posts/how-to-break-up-gently-20260217.html"},
+{"title":"【相談】パートナーのスマホを見るのはアリかナシかについて悩んでいます…ゆい姉さんの回答","description":"パートナーのスマホを見るのはアリかナシかについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.17","url":"posts/is-it-okay-to-look-through-my--20260217.html"},
+{"title":"【相談】太ったパートナーに冷めてしまった時について悩んでいます…ゆい姉さんの回答","description":"太ったパートナーに冷めてしまった時についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.17","url":"posts/my-partner-gained-weight-and-i-20260217.html"},
+{"title":"【セフレ・都合のいい関係】夜の悩みから卒業。本命彼女になるための逆転プラン","description":"都合のいい関係から抜け出せない悩みは深いですよね。ゆい姉さんが本命彼女になるための逆転プランを解説します。","date":"2026.02.16","url":"posts/friends-with-benefits-escape-20260216.html"},
+{"title":"【相談】マンネリカップルの刺激の作り方について悩んでいます…ゆい姉さんの回答","description":"マンネリカップルの刺激の作り方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.16","url":"posts/how-to-spice-up-a-long-term-re-20260216.html"},
+{"title":"【相談】だらしないパートナーへの対処法について悩んでいます…ゆい姉さんの回答","description":"だらしないパートナーへの対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.16","url":"posts/dealing-with-a-messy-partner-20260216.html"},
+{"title":"【相談】カップルのお金に関する価値観の不一致について悩んでいます…ゆい姉さんの回答","description":"カップルのお金に関する価値観の不一致についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.16","url":"posts/financial-disagreements-in-rel-20260216.html"},
+{"title":"【相談】同棲中の家事分担のコツについて悩んでいます…ゆい姉さんの回答","description":"同棲中の家事分担のコツについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.16","url":"posts/living-together-how-to-split-c-20260216.html"},
+{"title":"【相談】マザコン彼氏への対処法について悩んでいます…ゆい姉さんの回答","description":"マザコン彼氏への対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.16","url":"posts/my-boyfriend-is-too-close-to-h-20260216.html"},
+{"title":"【相談】彼氏に記念日を忘れられた時の対処法について悩んでいます…ゆい姉さんの回答","description":"彼氏に記念日を忘れられた時の対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.15","url":"posts/boyfriend-forgot-our-anniversa-20260215.html"},
+{"title":"【相談】仕事中毒な彼氏との付き合い方について悩んでいます…ゆい姉さんの回答","description":"仕事中毒な彼氏との付き合い方についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.15","url":"posts/how-to-deal-with-a-workaholic--20260215.html"},
+{"title":"【相談】彼氏がインスタモデルの写真にいいねする心理について悩んでいます…ゆい姉さんの回答","description":"彼氏がインスタモデルの写真にいいねする心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.15","url":"posts/boyfriend-likes-instagram-mode-20260215.html"},
+{"title":"【相談】彼氏の女友達への嫉妬の対処法について悩んでいます…ゆい姉さんの回答","description":"彼氏の女友達への嫉妬の対処法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.15","url":"posts/jealous-of-boyfriends-female-f-20260215.html"},
+{"title":"【相談】SNSに彼女を載せない男性心理について悩んでいます…ゆい姉さんの回答","description":"SNSに彼女を載せない男性心理についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.15","url":"posts/my-boyfriend-never-posts-about-20260215.html"},
+{"title":"【相談】付き合うタイミング（関係性をはっきりさせる時）について悩んでいます…ゆい姉さんの回答","description":"付き合うタイミング（関係性をはっきりさせる時）についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.14","url":"posts/when-to-define-the-relationshi-20260214.html"},
+{"title":"【相談】マッチングアプリからLINEへ移行するタイミングと方法について悩んでいます…ゆい姉さんの回答","description":"マッチングアプリからLINEへ移行するタイミングと方法についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.14","url":"posts/how-to-transition-from-app-to--20260214.html"},
+{"title":"【相談】マッチングアプリの要注意プロフィールの特徴について悩んでいます…ゆい姉さんの回答","description":"マッチングアプリの要注意プロフィールの特徴についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.14","url":"posts/red-flags-in-dating-app-profil-20260214.html"},
+{"title":"【相談】マッチングアプリで会う時の安全対策について悩んでいます…ゆい姉さんの回答","description":"マッチングアプリで会う時の安全対策についての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.14","url":"posts/safety-tips-for-meeting-online-20260214.html"},
+{"title":"初デートで失敗しない！彼に『また会いたい』と思わせる振る舞い","description":"初デートで盛り上がる会話のきっかけについての悩みは深いですよね。ゆい姉さんが男性心理と解決策をズバリ解説します。","date":"2026.02.14","url":"posts/first-date-conversation-starte-20260214.html"},
+{"title":"マッチングアプリで会話が続かない…話題切れを防ぎ、デートに繋げるトーク術","description":"「趣味は？」「休みの日は？」これ以上何を聞けばいいの？マッチングアプリでの沈黙が怖いあなたへ。会話を無限に広げ、相手を楽しませる質問テクニックを伝授します。","date":"2026.02.13","url":"posts/conversation-tips-online.html"},
+{"title":"マッチング後の失速…彼が興味を失いつつあるサインと挽回策","description":"最初は盛り上がっていたのに、最近彼の反応が薄い…。それは「脈なし」への変化のサインかも。男性が見せる興味喪失のサインを見極め、関係を修復する方法を教えます。","date":"2026.02.13","url":"posts/signs-he-is-losing-interest.html"},
+{"title":"マッチングアプリで「追いメッセージ」はNG？連投しても許されるケースと嫌われる境界線","description":"返信来てないのに送っちゃった…。ダブルテキスト（連投）は脈なしへの片道切符？不安なあなたへ、許される連投とアウトな連投の違いを解説します。","date":"2026.02.13","url":"posts/app-double-texting.html"},
+{"title":"マッチングアプリで既読無視された！追撃していい？フェードアウトを挽回するメッセージ術","description":"いい感じだったのに急に返信が来なくなった…。相手の心理と、ここから復活するための「ザオラルメール」のコツ、そして諦めるべき引き際を解説します。","date":"2026.02.13","url":"posts/reply-to-ghosting-match.html"},
+{"title":"マッチングアプリ初デートの服装選び｜彼に「いいね」と思わせるコーデ術とNG例","description":"マッチングアプリで出会った彼との初デート。何を着ていけばいい？張り切りすぎず、でも好印象な「正解コーデ」と、避けるべきNGファッションをゆい姉さんが解説します。","date":"2026.02.13","url":"posts/matching-app-first-date-outfit.html"},
+{"title":"別れた彼氏が忘れられない…3ヶ月経っても辛いあなたへ贈る「執着」の手放し方","description":"失恋から3ヶ月、まだ元彼が忘れられない…。復縁を願うべき？吹っ切るべき？止まった時間を動かし、新しい幸せを掴むための心の整理術をアドバイスします。","date":"2026.02.13","url":"posts/forget-ex-boyfriend.html"},
+{"title":"10歳年下の彼氏との結婚…「姉さん女房」の不安を解消し、愛され続ける秘訣","description":"10歳下の彼からのプロポーズ。嬉しいけれど、年齢差や将来の悩みが尽きない…そんな不安を抱える年上彼女へ、自信を持って結婚へ進むためのマインドセットをお届けします。","date":"2026.02.13","url":"posts/age-gap-marriage.html"},
+{"title":"彼氏のポケットからテーマパークのレシートが…浮気を問い詰めるべき？賢い対処法","description":"同棲中の彼氏の服から見知らぬレシートが…浮気？それとも誤解？動揺する気持ちを抑え、決定的な証拠が出るまでの振る舞い方と、彼への切り出し方をアドバイスします。","date":"2026.02.13","url":"posts/cheating-suspicion.html"},
+{"title":"遠距離恋愛で連絡が減った彼氏…自然消滅を避けるための対処法と男性心理","description":"遠距離恋愛中の彼からの連絡が減った…このまま自然消滅？不安なあなたへ、男性が連絡を減らす心理と、愛を再燃させるためのコミュニケーション術を伝授します。","date":"2026.02.13","url":"posts/long-distance-silence.html"},
+{"title":"職場の上司に片思い…彼女持ちの彼を振り向かせるには？NG行動とアプローチ法","description":"彼女がいる職場の上司や先輩を好きになってしまった…諦めるべき？それとも待つべき？辛い恋の行方と、関係を壊さずに距離を縮める方法をゆい姉さんが解説します。","date":"2026.02.13","url":"posts/workplace-crush.html"},
+{"title":"結婚の話を避ける彼氏の本音とは？プレッシャーをかけずに切り出す方法","description":"3年以上付き合っている彼氏が結婚の話を避ける…その心理と、関係を壊さずに将来の話をするための具体的なステップをゆい姉さんが解説します。","date":"2026.02.13","url":"posts/marriage-anxiety.html"}
+];
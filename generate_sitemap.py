@@ -2,12 +2,16 @@ import json
 import os
 from datetime import datetime
 
+from post_log import compact_if_needed
+
 BASE_URL = "https://yui-love.vercel.app/"
 JSON_FILE = "data/questions.json"
 SITEMAP_ROOT = "sitemap.xml"
 SITEMAP_PUBLIC = "public/sitemap.xml"
 
 def generate_sitemap():
+    # Appends to the post log only reach questions.json on compaction
+    compact_if_needed(threshold=1)
     if not os.path.exists(JSON_FILE):
         print(f"Error: {JSON_FILE} not found.")
         return
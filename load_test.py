@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+ビルド済みの出力（dist/）をローカルで配信し、asyncio のクライアントで負荷をかける計測ツール。
+
+サーバーは vercel.json の cleanUrls と同じ振る舞い（/posts/slug → slug.html、
+*.html へのアクセスは拡張子なしへ308）で配信し、.br / .gz が隣にあれば
+Accept-Encoding に応じて事前圧縮済みのファイルを返す。サーバーは別プロセスで動かし、
+クライアント側の負荷が計測結果に混ざらないようにする。
+
+  python load_test.py                         # dist/ を計測
+  python load_test.py dist /tmp/dist-sharded  # 2つのビルドを同じ条件で比較
+  python load_test.py dist /tmp/dist-gz --precompress /tmp/dist-gz  # 事前圧縮の効果を比較
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import mimetypes
+import multiprocessing
+import random
+import sys
+import time
+from pathlib import Path
+from urllib.parse import unquote
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DIST_DIR = "dist"
+REPORT_FILE = ".build/load-test.json"
+DEFAULT_MIX = "index=2,archive=1,post=7"
+DEFAULT_CONCURRENCY = 50
+DEFAULT_DURATION = 10.0
+ACCEPT_ENCODING = "br, gzip"
+PRECOMPRESS_SUFFIXES = (".html", ".css", ".js", ".xml", ".json")
+PERCENTILES = (50, 90, 99)
+
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+
+# --- サーバー ---
+
+def resolve_path(root, url_path, clean_urls):
+    """URLのパスを (ファイル, リダイレクト先) に解決する"""
+    path = unquote(url_path.split("?", 1)[0])
+    rel = path.lstrip("/")
+    if ".." in rel.split("/"):
+        return None, None
+    if clean_urls and rel.endswith(".html"):
+        stem = rel[:-len(".html")]
+        target = "/" if stem == "index" else "/" + (stem[:-len("/index")] if stem.endswith("/index") else stem)
+        if (root / rel).is_file():
+            return None, target
+    candidates = [rel] if rel and not rel.endswith("/") else []
+    if clean_urls and rel and not rel.endswith("/"):
+        candidates.append(rel + ".html")
+    candidates.append((rel.rstrip("/") + "/index.html").lstrip("/"))
+    for candidate in candidates:
+        if (root / candidate).is_file():
+            return root / candidate, None
+    return None, None
+
+
+def pick_encoding(path, accept_encoding):
+    """Accept-Encoding に合う事前圧縮ファイルがあれば (エンコーディング, パス) を返す"""
+    accepted = {token.split(";")[0].strip() for token in accept_encoding.lower().split(",")}
+    for encoding, suffix in ENCODINGS:
+        compressed = path.with_name(path.name + suffix)
+        if encoding in accepted and compressed.is_file():
+            return encoding, compressed
+    return None, path
+
+
+async def handle_client(reader, writer, root, clean_urls):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            method, url_path, _ = request_line.decode("latin-1").split(" ", 2)
+
+            path, redirect = resolve_path(root, url_path, clean_urls)
+            extra = ""
+            if redirect:
+                status, body = "308 Permanent Redirect", b""
+                extra = f"Location: {redirect}\r\n"
+            elif path is None:
+                status, body = "404 Not Found", b"Not Found"
+            else:
+                encoding, served = pick_encoding(path, headers.get("accept-encoding", ""))
+                status, body = "200 OK", served.read_bytes()
+                content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+                extra = f"Content-Type: {content_type}\r\nVary: Accept-Encoding\r\n"
+                if encoding:
+                    extra += f"Content-Encoding: {encoding}\r\n"
+            head = f"HTTP/1.1 {status}\r\nContent-Length: {len(body)}\r\n{extra}\r\n".encode("latin-1")
+            writer.write(head if method == "HEAD" else head + body)
+            await writer.drain()
+            if headers.get("connection", "").lower() == "close":
+                break
+    except (ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+def serve(root, clean_urls, port_queue):
+    """子プロセスでサーバーを起動し、割り当てられたポートを親に返す"""
+    async def run():
+        server = await asyncio.start_server(
+            lambda r, w: handle_client(r, w, Path(root), clean_urls), "127.0.0.1", 0, backlog=1024)
+        port_queue.put(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
+
+
+def precompress(root):
+    """テキスト系ファイルの .gz（brotli があれば .br も）を隣に書き出す"""
+    count = 0
+    for path in sorted(Path(root).rglob("*")):
+        if not path.is_file() or path.suffix not in PRECOMPRESS_SUFFIXES:
+            continue
+        data = path.read_bytes()
+        path.with_name(path.name + ".gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            path.with_name(path.name + ".br").write_bytes(brotli.compress(data))
+        count += 1
+    formats = "gz, br" if brotli is not None else "gz（brotli 未インストールのため .br なし）"
+    print(f"事前圧縮: {count}ファイル（{formats}）")
+
+
+# --- クライアント ---
+
+def clean_url(rel, clean_urls):
+    if not clean_urls:
+        return "/" + rel
+    stem = rel[:-len(".html")]
+    return "/" if stem == "index" else "/" + stem
+
+
+def build_targets(root, clean_urls):
+    """種別ごとのリクエスト先URL"""
+    root = Path(root)
+    posts = sorted(p.relative_to(root).as_posix() for p in (root / "posts").rglob("*.html"))
+    return {
+        "index": [clean_url("index.html", clean_urls)],
+        "archive": [clean_url("archive.html", clean_urls)],
+        "post": [clean_url(rel, clean_urls) for rel in posts],
+    }
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        kind, _, weight = part.partition("=")
+        mix[kind.strip()] = float(weight or 1)
+    return mix
+
+
+async def fetch(reader, writer, url, accept_encoding):
+    """1リクエストを送り、(ステータス, 受信バイト数) を返す"""
+    request = f"GET {url} HTTP/1.1\r\nHost: localhost\r\nConnection: keep-alive\r\n"
+    if accept_encoding:
+        request += f"Accept-Encoding: {accept_encoding}\r\n"
+    writer.write((request + "\r\n").encode("latin-1"))
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("接続が閉じられました")
+    received = len(status_line)
+    length = 0
+    while True:
+        line = await reader.readline()
+        received += len(line)
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value.strip())
+    await reader.readexactly(length)
+    return int(status_line.split()[1]), received + length
+
+
+async def worker(port, schedule, deadline, accept_encoding, results):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for kind, url in schedule:
+            if time.perf_counter() >= deadline:
+                break
+            start = time.perf_counter()
+            try:
+                status, size = await fetch(reader, writer, url, accept_encoding)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                results.append((kind, time.perf_counter() - start, 0, 0))
+                writer.close()
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                continue
+            results.append((kind, time.perf_counter() - start, status, size))
+    finally:
+        writer.close()
+
+
+def iter_schedule(targets, mix, rng, count=None):
+    """(種別, URL) を配分どおりに返す。count が None なら終わりなく続ける"""
+    kinds = [k for k in mix if targets.get(k)]
+    weights = [mix[k] for k in kinds]
+    sent = 0
+    while count is None or sent < count:
+        kind = rng.choices(kinds, weights)[0]
+        yield kind, rng.choice(targets[kind])
+        sent += 1
+
+
+async def run_clients(port, targets, mix, concurrency, duration, requests, accept_encoding, seed):
+    # 接続ごとに乱数を分けるので、同じシードなら各接続の順序は毎回同じになる
+    rngs = [random.Random(seed + i) for i in range(concurrency)]
+    if requests:
+        # 総数指定のときだけ計測前にリストを作る（合計が requests 件ちょうどになるよう配る）
+        counts = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+        schedules = [list(iter_schedule(targets, mix, rng, n)) for rng, n in zip(rngs, counts)]
+    else:
+        # 時間指定のときは締め切りまで1件ずつ作る
+        schedules = [iter_schedule(targets, mix, rng) for rng in rngs]
+    deadline = time.perf_counter() + (duration if not requests else float("inf"))
+    results = []
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(port, s, deadline, accept_encoding, results) for s in schedules))
+    return results, time.perf_counter() - start
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+
+def summarize(results, elapsed):
+    def stats(rows):
+        latencies = sorted(r[1] * 1000 for r in rows)
+        ok = [r for r in rows if 200 <= r[2] < 400]
+        total_bytes = sum(r[3] for r in rows)
+        entry = {
+            "requests": len(rows),
+            "errors": len(rows) - len(ok),
+            "rps": round(len(rows) / elapsed, 1) if elapsed else 0,
+            "bytes": total_bytes,
+            "mb_per_s": round(total_bytes / elapsed / 1e6, 2) if elapsed else 0,
+            "mean_bytes": round(total_bytes / len(rows)) if rows else 0,
+        }
+        for p in PERCENTILES:
+            entry[f"p{p}_ms"] = round(percentile(latencies, p), 2)
+        entry["max_ms"] = round(latencies[-1], 2) if latencies else 0
+        return entry
+
+    summary = {"elapsed_s": round(elapsed, 2), "total": stats(results), "by_kind": {}}
+    for kind in sorted({r[0] for r in results}):
+        summary["by_kind"][kind] = stats([r for r in results if r[0] == kind])
+    return summary
+
+
+def load_test(root, args):
+    root = Path(root).resolve()
+    if not root.exists():
+        print(f"Error: {root} が見つかりません。先に build_dist.py を実行してください。")
+        return None
+    clean_urls = not args.no_clean_urls
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(str(root), clean_urls, port_queue), daemon=True)
+    server.start()
+    try:
+        port = port_queue.get(timeout=10)
+        targets = build_targets(root, clean_urls)
+        results, elapsed = asyncio.run(run_clients(
+            port, targets, parse_mix(args.mix), args.concurrency, args.duration,
+            args.requests, args.accept_encoding, args.seed))
+    finally:
+        server.terminate()
+        server.join()
+    return summarize(results, elapsed)
+
+
+def print_table(labels, summaries):
+    """ビルドごとの結果を横に並べて表示する"""
+    width = max(14, *(len(label) for label in labels)) + 2
+    metrics = ["requests", "errors", "rps", "mb_per_s", "mean_bytes"] + \
+        [f"p{p}_ms" for p in PERCENTILES] + ["max_ms"]
+    print(f"{'':<22}" + "".join(f"{label:>{width}}" for label in labels))
+    sections = [("total", [s["total"] for s in summaries])]
+    for kind in sorted({k for s in summaries for k in s["by_kind"]}):
+        sections.append((kind, [s["by_kind"].get(kind, {}) for s in summaries]))
+    for name, entries in sections:
+        print(f"[{name}]")
+        for metric in metrics:
+            print(f"  {metric:<20}" + "".join(f"{str(e.get(metric, '-')):>{width}}" for e in entries))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ビルド済みサイトのローカル負荷テスト")
+    parser.add_argument("roots", nargs="*", default=[DIST_DIR], help="計測するビルド（複数指定で比較）")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="リクエストの配分（例: index=2,archive=1,post=7）")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="同時接続数")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="計測時間（秒）")
+    parser.add_argument("--requests", type=int, help="時間ではなく総リクエスト数で計測する")
+    parser.add_argument("--accept-encoding", default=ACCEPT_ENCODING,
+                        help="送信する Accept-Encoding（空文字で圧縮なし）")
+    parser.add_argument("--precompress", action="append", default=[], metavar="ROOT",
+                        help="計測前に指定したビルドへ .gz / .br を書き出す（複数指定可）")
+    parser.add_argument("--no-clean-urls", action="store_true", help="cleanUrls を無効にして *.html で配信する")
+    parser.add_argument("--seed", type=int, default=0, help="リクエスト順序の乱数シード")
+    parser.add_argument("--json", default=REPORT_FILE, help="結果を書き出すJSONファイル")
+    args = parser.parse_args()
+
+    for root in args.precompress:
+        precompress(root)
+    summaries = []
+    for root in args.roots:
+        print(f"--- 計測: {root}")
+        summary = load_test(root, args)
+        if summary is None:
+            sys.exit(1)
+        summaries.append(summary)
+    print_table(args.roots, summaries)
+
+    report_path = Path(args.json)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(dict(zip(args.roots, summaries)), f, indent=1, ensure_ascii=False)
+    if any(s["total"]["errors"] for s in summaries):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
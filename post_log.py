@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+記事カタログの追記専用ログ（data/posts.jsonl）と、そのコンパクション。
+
+新しい記事は1行1件でログの末尾に追記するだけなので、追加コストは新規記事数にしか比例しない。
+フロントエンドが読む data/questions.json / data/questions.js は、コンパクション時に
+ログから日付の新しい順に並べ直したスナップショットとして書き出す（一時ファイル + rename）。
+generate_batch.py は未反映の追記が閾値を超えたときだけコンパクションし、スナップショットを
+読む側（generate_sitemap.py・build_dist.py）は読む前に compact_if_needed(threshold=1) で追いつかせる。
+"""
+import argparse
+import heapq
+import json
+import os
+import re
+import tempfile
+
+LOG_FILE = "data/posts.jsonl"
+# 最後にコンパクションした時点のログのサイズ（バイト）
+STATE_FILE = "data/.posts-compacted"
+JSON_FILE = "data/questions.json"
+JS_FILE = "data/questions.js"
+JS_PREFIX = "const questionsData = "
+
+# これだけ未反映の追記が溜まったら generate_batch.py の終わりにコンパクションする
+COMPACT_THRESHOLD_BYTES = 256 * 1024
+# 外部ソートで一度にメモリへ載せる件数
+RUN_SIZE = 50000
+# generate_batch.py の記事URLは公開日で終わる（slug-20260520.html）
+DATED_URL_RE = re.compile(r"-(\d{4})(\d{2})(\d{2})\.html$")
+
+
+def fsync_replace(tmp_path, path):
+    with open(tmp_path, "rb+") as f:
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def ensure_log(log_file=LOG_FILE, json_file=None):
+    """ログが無ければ既存の questions.json から作る（古い順に並べる）"""
+    if os.path.exists(log_file):
+        return
+    json_file = json_file or os.path.join(os.path.dirname(log_file), os.path.basename(JSON_FILE))
+    entries = []
+    if os.path.exists(json_file):
+        with open(json_file, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    tmp_path = log_file + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for entry in reversed(entries):
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    fsync_replace(tmp_path, log_file)
+    write_state(os.path.getsize(log_file), log_file)
+    print(f"{json_file} から {log_file} を作成しました（{len(entries)}件）")
+
+
+def url_date(url):
+    """URLのファイル名の日付（2026.05.20 の形式）。日付の無い旧URLは None"""
+    match = DATED_URL_RE.search(url)
+    return ".".join(match.groups()) if match else None
+
+
+def repair_tail(log_file):
+    """書き込み途中で落ちた最終行（改行で終わっていない部分）を切り捨てる"""
+    with open(log_file, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        pos = size
+        while pos > 0:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            idx = f.read(step).rfind(b"\n")
+            if idx != -1:
+                f.truncate(pos + idx + 1)
+                return
+        f.truncate(0)
+
+
+class PostLog:
+    """with PostLog() as log: log.append(entry) で1件ずつ追記する"""
+
+    def __init__(self, log_file=LOG_FILE):
+        self.log_file = log_file
+        self.count = 0
+
+    def __enter__(self):
+        ensure_log(self.log_file)
+        repair_tail(self.log_file)
+        self.f = open(self.log_file, "a", encoding="utf-8")
+        return self
+
+    def append(self, entry):
+        # 日付付きのURLは必ずその日付で載せる（compact_posts の重複除去がこれを前提にしている）
+        dated = url_date(entry["url"])
+        if dated is not None and dated != entry["date"]:
+            raise ValueError(f"{entry['url']} の日付と date（{entry['date']}）が一致しません")
+        # 1行で書き切ってフラッシュし、途中で落ちても壊れるのは最終行だけにする
+        self.f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.f.flush()
+        self.count += 1
+
+    def __exit__(self, *exc):
+        os.fsync(self.f.fileno())
+        self.f.close()
+        return False
+
+
+def read_state(log_file=LOG_FILE):
+    state_file = os.path.join(os.path.dirname(log_file), os.path.basename(STATE_FILE))
+    if not os.path.exists(state_file):
+        return 0
+    with open(state_file, "r") as f:
+        return int(f.read().strip() or 0)
+
+
+def write_state(offset, log_file=LOG_FILE):
+    state_file = os.path.join(os.path.dirname(log_file), os.path.basename(STATE_FILE))
+    tmp_path = state_file + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(f"{offset}\n")
+    fsync_replace(tmp_path, state_file)
+
+
+def pending_bytes(log_file=LOG_FILE):
+    """前回のコンパクション以降に追記されたバイト数"""
+    if not os.path.exists(log_file):
+        return 0
+    return os.path.getsize(log_file) - read_state(log_file)
+
+
+def iter_log(log_file):
+    """(通し番号, エントリ) を追記順に返す。壊れた行は読み飛ばす"""
+    with open(log_file, "r", encoding="utf-8") as f:
+        for seq, line in enumerate(f):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield seq, json.loads(line)
+            except json.JSONDecodeError:
+                print(f"Warning: {log_file} の{seq + 1}行目を読み飛ばしました")
+
+
+def iter_sorted(log_file, tmp_dir):
+    """日付の新しい順（同じ日付は後から追記したものが先）に並べる外部ソート"""
+    def sort_key(item):
+        return item[0], item[1]
+
+    runs = []
+    run = []
+    for seq, entry in iter_log(log_file):
+        run.append((entry["date"], seq, entry))
+        if len(run) >= RUN_SIZE:
+            runs.append(write_run(run, tmp_dir, sort_key))
+            run = []
+    if not runs:
+        run.sort(key=sort_key, reverse=True)
+        yield from (entry for _, _, entry in run)
+        return
+    if run:
+        runs.append(write_run(run, tmp_dir, sort_key))
+    for _, _, entry in heapq.merge(*(iter_run(p) for p in runs), key=sort_key, reverse=True):
+        yield entry
+
+
+def write_run(run, tmp_dir, sort_key):
+    run.sort(key=sort_key, reverse=True)
+    fd, path = tempfile.mkstemp(suffix=".jsonl", dir=tmp_dir)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        for item in run:
+            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+    return path
+
+
+def iter_run(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield tuple(json.loads(line))
+
+
+def compact_posts(log_file=LOG_FILE, json_file=None, js_file=None):
+    """ログから questions.json / questions.js のスナップショットを作り直す"""
+    # スナップショットはログと同じディレクトリに置く
+    data_dir = os.path.dirname(log_file) or "."
+    json_file = json_file or os.path.join(data_dir, os.path.basename(JSON_FILE))
+    js_file = js_file or os.path.join(data_dir, os.path.basename(JS_FILE))
+    ensure_log(log_file, json_file)
+    repair_tail(log_file)
+    offset = os.path.getsize(log_file)
+
+    count = 0
+    # 日付付きのURLはファイル名の日付でしか追記できない（PostLog.append）ので、重複は同じ日付の
+    # グループ内で隣り合う。既出のURLは今の日付のグループの分だけ覚えておけば足りる。
+    # 日付の無い旧URLはどの日付でも載りうるので全件覚えておく（旧記事の数で頭打ちになる）
+    group_date = None
+    seen = set()
+    undated = set()
+    json_tmp = json_file + ".tmp"
+    js_tmp = js_file + ".tmp"
+    with tempfile.TemporaryDirectory(dir=data_dir) as tmp_dir, \
+            open(json_tmp, "w", encoding="utf-8") as jf, open(js_tmp, "w", encoding="utf-8") as sf:
+        jf.write("[")
+        sf.write(JS_PREFIX + "[")
+        for entry in iter_sorted(log_file, tmp_dir):
+            # 同じURLが複数回追記されていたら最初に並んだもの（新しいもの）だけ残す
+            if url_date(entry["url"]) == entry["date"]:
+                if entry["date"] != group_date:
+                    group_date = entry["date"]
+                    seen.clear()
+                urls = seen
+            else:
+                urls = undated
+            if entry["url"] in urls:
+                continue
+            urls.add(entry["url"])
+            line = ("\n" if count == 0 else ",\n") + json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+            jf.write(line)
+            sf.write(line)
+            count += 1
+        jf.write("\n]\n")
+        sf.write("\n];\n")
+    fsync_replace(json_tmp, json_file)
+    fsync_replace(js_tmp, js_file)
+    write_state(offset, log_file)
+    print(f"コンパクション完了: {count}件 → {json_file}, {js_file}")
+    return count
+
+
+def compact_if_needed(threshold=COMPACT_THRESHOLD_BYTES, log_file=LOG_FILE):
+    """未反映の追記が閾値（バイト）以上あればコンパクションする"""
+    pending = pending_bytes(log_file)
+    if pending > 0 and pending >= threshold:
+        compact_posts(log_file)
+        return True
+    if pending > 0:
+        print(f"未反映の追記: {pending:,} bytes（{threshold:,} bytes でコンパクション）")
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="記事ログのコンパクション")
+    parser.add_argument("--if-pending", action="store_true",
+                        help="前回から追記があるときだけコンパクションする")
+    args = parser.parse_args()
+    if args.if_pending:
+        compact_if_needed(threshold=1)
+    else:
+        compact_posts()
+
+
+if __name__ == "__main__":
+    main()
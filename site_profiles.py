@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+サイトごとの設定（sites.json のプロファイル）と、サイト間で共有するコンパイル済みリソース。
+
+1つのプロファイルがドメイン・テンプレート・パーシャル・文章プール・スケジュール・
+アナリティクスIDを持つ。テンプレートと文章プール（分類ルールを含む）はファイル単位で
+1度だけ読み込んでキャッシュするので、同じ資源を使うサイトを何個生成しても読み込みは1回で済む。
+"""
+import datetime
+import json
+import os
+import re
+from functools import lru_cache
+
+SITES_FILE = "sites.json"
+PLACEHOLDER_RE = re.compile(r"\{\{([A-Z_]+)\}\}")
+# {{> header}} で partials/header.html を埋め込む
+PARTIAL_RE = re.compile(r"\{\{>\s*([\w-]+)\s*\}\}")
+# アナリティクスIDの無いサイトではテンプレートから取り除く Google tag のブロック
+ANALYTICS_BLOCK_RE = re.compile(
+    r"[ \t]*<!-- Google tag \(gtag\.js\) -->\n[ \t]*<script async [^>]*></script>\n[ \t]*<script>.*?</script>\n",
+    re.S)
+
+
+class SiteProfile:
+    """1サイト分の設定。パスは設定ファイルのディレクトリ（生成物はサイトのルート）基準で解決済み"""
+
+    def __init__(self, name, config, base_dir="."):
+        schedule = config.get("schedule", {})
+        self.name = name
+        self.root = os.path.normpath(os.path.join(base_dir, config.get("root", ".")))
+        self.domain = config["domain"].rstrip("/") + "/"
+        self.template = os.path.normpath(os.path.join(base_dir, config["template"]))
+        partials = config.get("partials")
+        self.partials = os.path.normpath(os.path.join(base_dir, partials)) if partials else None
+        self.pools = os.path.normpath(os.path.join(base_dir, config["pools"]))
+        # 空ならテンプレートの Google tag ごと出力しない
+        self.analytics_id = config.get("analytics_id", "")
+        self.start_date = datetime.date.fromisoformat(schedule["start_date"])
+        self.days = schedule["days"]
+        self.articles_per_day = schedule["articles_per_day"]
+        self.ideas_file = self.path(config.get("ideas", "ideas.txt"))
+        self.posts_dir = config.get("posts_dir", "posts")
+
+    def path(self, rel):
+        return os.path.join(self.root, rel)
+
+    def site_values(self):
+        # テンプレートの中でサイト単位で決まる値
+        return {"SITE_URL": self.domain, "ANALYTICS_ID": self.analytics_id}
+
+
+def load_profiles(path=SITES_FILE):
+    """{サイト名: SiteProfile}（sites.json に書かれた順）
+
+    サイトは並行して生成され、ジャーナル・記事ログ・記事はルートの下に置かれるので、
+    ルートかネタ帳を共有するプロファイルがあれば ValueError にする。
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(path))
+    profiles = {name: SiteProfile(name, site, base_dir) for name, site in config["sites"].items()}
+    for attr in ("root", "ideas_file"):
+        owners = {}
+        for site in profiles.values():
+            key = os.path.realpath(getattr(site, attr))
+            if key in owners:
+                raise ValueError(f"{path}: {owners[key]} と {site.name} が同じ {attr}（{key}）を使っています")
+            owners[key] = site.name
+    return profiles
+
+
+class CompiledTemplate:
+    """{{KEY}} の位置で分割しておき、1回の結合で全プレースホルダーを埋める"""
+
+    def __init__(self, text):
+        self.parts = PLACEHOLDER_RE.split(text)
+
+    def render(self, values):
+        out = []
+        for i, part in enumerate(self.parts):
+            if i % 2 == 0:
+                out.append(part)
+            else:
+                # 値の無いプレースホルダーはそのまま残す（validate_output.py が検出する）
+                out.append(values.get(part, "{{" + part + "}}"))
+        return "".join(out)
+
+
+@lru_cache(maxsize=None)
+def _compile_template(path, partials, analytics, mtime):
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    if not analytics:
+        text = ANALYTICS_BLOCK_RE.sub("", text)
+    if partials:
+        def include(match):
+            with open(os.path.join(partials, match.group(1) + ".html"), "r", encoding="utf-8") as pf:
+                return pf.read()
+        text = PARTIAL_RE.sub(include, text)
+    return CompiledTemplate(text)
+
+
+def compile_template(site):
+    return _compile_template(site.template, site.partials, bool(site.analytics_id), os.path.getmtime(site.template))
+
+
+class KeywordClassifier:
+    """[[キーワード, ...], ラベル] のルールを上から順に当て、最初に含まれたもののラベルを返す"""
+
+    def __init__(self, rules, default=None):
+        self.rules = [(tuple(keywords), label) for keywords, label in rules]
+        self.default = default
+
+    def classify(self, text):
+        for keywords, label in self.rules:
+            if any(k in text for k in keywords):
+                return label
+        return self.default
+
+
+class Pools:
+    """文章プールと、タイトル・テーマの分類器"""
+
+    def __init__(self, data):
+        self.data = data
+        self.titles = KeywordClassifier(data["title_rules"])
+        self.themes = KeywordClassifier(data["theme_rules"], "generic")
+
+
+@lru_cache(maxsize=None)
+def _load_pools(path, mtime):
+    with open(path, "r", encoding="utf-8") as f:
+        return Pools(json.load(f))
+
+
+def load_pools(site):
+    return _load_pools(site.pools, os.path.getmtime(site.pools))
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+サイト全体の出力をゴールデン（snapshot/golden.json）と内容ハッシュで比較するスナップショットテスト。
+
+一時ディレクトリに2種類の出力を作る。
+  generated/ … 固定のネタ帳（snapshot/ideas.txt）から sites.json の yui プロファイルで描画する記事
+  site/      … 現在のソースから build_dist.py と同じステージで作る公開用の出力（日付は固定）
+ファイルごとのsha256をゴールデンと突き合わせ、変わったファイルだけ差分を表示する。
+差分のゴールデン側は手元のコピー（.build/snapshot-golden）を使い、無いか古ければ
+golden.json を最後に書いたコミットを git worktree に展開して、そのコミットのコードで作り直す。
+リファクタリングで出力が1バイトでも変われば終了コード1で失敗する。
+"""
+import argparse
+import copy
+import difflib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import generate_batch
+from build_dist import file_digest, stage_site
+from build_index_island import JST
+from site_profiles import load_profiles
+
+SNAPSHOT_DIR = "snapshot"
+IDEAS_FILE = os.path.join(SNAPSHOT_DIR, "ideas.txt")
+SNAPSHOT_SITE = "yui"
+GOLDEN_FILE = os.path.join(SNAPSHOT_DIR, "golden.json")
+# 差分表示用にゴールデンの出力そのものを残しておく場所（チェックインしないキャッシュ）
+GOLDEN_COPY_DIR = ".build/snapshot-golden"
+# 日付に依存するステージ（build_dist.DATED_STAGES）はこの日時で描画する
+SNAPSHOT_NOW = datetime(2026, 6, 1, 12, 0, tzinfo=JST)
+
+MAX_DIFF_FILES = 20
+MAX_DIFF_LINES = 40
+
+
+def render_generated(out_root):
+    """固定のネタ帳で1バッチ分の記事を描画する（出力先以外は本番と同じプロファイルとワーカープール）"""
+    site = copy.copy(load_profiles()[SNAPSHOT_SITE])
+    site.root = str(out_root / "generated")
+    site.ideas_file = os.path.abspath(IDEAS_FILE)
+    os.makedirs(site.path(site.posts_dir))
+    tasks = ((slot, topic, current_date, used) for slot, (topic, current_date, used)
+             in enumerate(generate_batch.iter_articles(generate_batch.iter_ideas(site.ideas_file), site)))
+    with ProcessPoolExecutor() as pool:
+        entries = [entry for _, _, entry in generate_batch.iter_rendered(pool, site, tasks)]
+    with open(site.path("entries.json"), "w", encoding="utf-8") as f:
+        json.dump(entries, f, indent=2, ensure_ascii=False)
+
+
+def render_site(src_root, out_root):
+    """build_dist.py と同じステージング処理で公開用の出力を作る（日付だけ固定）"""
+    stage_site(src_root, out_root / "site", now=SNAPSHOT_NOW)
+
+
+def digest_tree(root):
+    return {path.relative_to(root).as_posix(): file_digest(path)
+            for path in sorted(root.rglob("*")) if path.is_file()}
+
+
+def load_golden(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["files"]
+
+
+def has_golden_copy(golden_dir, rel, digest):
+    path = golden_dir / rel
+    return path.is_file() and file_digest(path) == digest
+
+
+def render_golden(src_root, work_root):
+    """golden.json を最後に書いたコミットの出力を作り直し、その出力のディレクトリを返す"""
+    commit = subprocess.run(["git", "log", "-1", "--format=%H", "--", GOLDEN_FILE], cwd=src_root,
+                            capture_output=True, text=True).stdout.strip()
+    if not commit:
+        return None
+    tree = work_root / "worktree"
+    subprocess.run(["git", "worktree", "add", "--detach", str(tree), commit], cwd=src_root,
+                   check=True, capture_output=True)
+    try:
+        # そのコミットの snapshot_site.py --update がゴールデンの出力を GOLDEN_COPY_DIR に残す
+        subprocess.run([sys.executable, "snapshot_site.py", "--update"], cwd=tree, check=True, capture_output=True)
+        golden_dir = work_root / "golden"
+        shutil.copytree(tree / GOLDEN_COPY_DIR, golden_dir)
+        return golden_dir
+    except subprocess.CalledProcessError as e:
+        print(f"Warning: {commit[:10]} のゴールデンを作り直せませんでした: {e.stderr.decode(errors='replace')[-200:]}")
+        return None
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", str(tree)], cwd=src_root, capture_output=True)
+
+
+def show_diff(rel, golden_dir, golden_digest, current):
+    """ゴールデン側の内容があれば、変わった行だけを表示する"""
+    if golden_dir is None or not has_golden_copy(golden_dir, rel, golden_digest):
+        print("  （差分なし: ゴールデン側の内容を用意できませんでした）")
+        return
+    try:
+        old = (golden_dir / rel).read_text(encoding="utf-8").splitlines()
+        new = current.read_text(encoding="utf-8").splitlines()
+    except UnicodeDecodeError:
+        print("  （差分なし: テキストではありません）")
+        return
+    lines = list(difflib.unified_diff(old, new, f"golden/{rel}", f"current/{rel}", n=0, lineterm=""))
+    for line in lines[:MAX_DIFF_LINES]:
+        print("  " + line)
+    if len(lines) > MAX_DIFF_LINES:
+        print(f"  ...ほか{len(lines) - MAX_DIFF_LINES}行")
+
+
+def snapshot_site(src_root=".", update=False):
+    src_root = Path(src_root).resolve()
+    golden_copy = src_root / GOLDEN_COPY_DIR
+    with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as golden_tmp:
+        out_root = Path(tmp)
+        render_generated(out_root)
+        render_site(src_root, out_root)
+        current = digest_tree(out_root)
+
+        if update:
+            with open(src_root / GOLDEN_FILE, "w", encoding="utf-8") as f:
+                json.dump({"generated_at": datetime.now().isoformat(timespec="seconds"), "files": current},
+                          f, indent=1, ensure_ascii=False, sort_keys=True)
+                f.write("\n")
+            if golden_copy.exists():
+                shutil.rmtree(golden_copy)
+            shutil.copytree(out_root, golden_copy)
+            print(f"ゴールデンを更新しました: {GOLDEN_FILE}（{len(current)}ファイル）")
+            return 0
+
+        golden = load_golden(src_root / GOLDEN_FILE)
+        if golden is None:
+            print(f"Error: {GOLDEN_FILE} がありません（--update で作成できます）")
+            return 1
+        added = sorted(set(current) - set(golden))
+        removed = sorted(set(golden) - set(current))
+        changed = sorted(rel for rel in set(current) & set(golden) if current[rel] != golden[rel])
+
+        print(f"{len(current)}ファイルをゴールデンと比較しました")
+        if not (added or removed or changed):
+            print("出力はゴールデンと一致しています")
+            return 0
+        print(f"差分: 追加 {len(added)} / 変更 {len(changed)} / 削除 {len(removed)}")
+        for label, paths in (("+", added), ("-", removed)):
+            for rel in paths[:MAX_DIFF_FILES]:
+                print(f"{label} {rel}")
+            if len(paths) > MAX_DIFF_FILES:
+                print(f"{label} ...ほか{len(paths) - MAX_DIFF_FILES}件")
+        shown = changed[:MAX_DIFF_FILES]
+        golden_dir = golden_copy
+        if not all(has_golden_copy(golden_copy, rel, golden[rel]) for rel in shown):
+            print(f"{GOLDEN_COPY_DIR} が無いか古いため、{GOLDEN_FILE} のコミットからゴールデンを作り直します...")
+            golden_dir = render_golden(src_root, Path(golden_tmp))
+        for rel in shown:
+            print(f"~ {rel}")
+            show_diff(rel, golden_dir, golden[rel], out_root / rel)
+        if len(changed) > MAX_DIFF_FILES:
+            print(f"~ ...ほか{len(changed) - MAX_DIFF_FILES}件")
+        print("意図した変更であれば --update でゴールデンを更新してください")
+        return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="サイト出力のゴールデンスナップショット比較")
+    parser.add_argument("--update", action="store_true", help="現在の出力でゴールデンを書き直す")
+    args = parser.parse_args()
+    sys.exit(snapshot_site(".", args.update))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+ビルド済みの出力（dist/）のHTML/XMLを構造チェックするスクリプト。
+
+全ファイルをプロセスプールで寛容なトークナイザ（html.parser / iterparse）に流し、
+タグの対応・置換漏れの {{...}}・重複ID・JSON-LD の構文・サイトマップのスキーマを
+ファイルごとに検査する。1件でもエラーがあれば終了コード1で失敗する。
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+DIST_DIR = "dist"
+REPORT_FILE = ".build/validation.json"
+SITE_HOST = "yui-love.vercel.app"
+# 1ファイルあたりに記録するエラーの上限（壊れ方がひどいファイルでレポートが膨らまないように）
+MAX_ERRORS_PER_FILE = 20
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+             "param", "source", "track", "wbr"}
+# 終了タグを省略できる要素（閉じ忘れとして扱わない）
+OPTIONAL_END_TAGS = {"html", "head", "body", "p", "li", "dt", "dd", "option", "optgroup",
+                     "tr", "td", "th", "thead", "tbody", "tfoot", "colgroup", "rb", "rt", "rp"}
+JSON_SCRIPT_TYPES = {"application/ld+json", "application/json"}
+PLACEHOLDER_RE = re.compile(r"\{\{\s*[A-Za-z_][\w.]*\s*\}\}")
+
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+SITEMAP_MAX_URLS = 50000
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+CHANGEFREQ = {"always", "hourly", "daily", "weekly", "monthly", "yearly", "never"}
+# W3C Datetime（YYYY-MM-DD またはタイムゾーン付きの日時）
+LASTMOD_RE = re.compile(r"^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:\d{2}))?$")
+
+
+class StructureParser(HTMLParser):
+    """タグの対応・重複ID・JSONスクリプトの構文を検査する"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []
+        self.ids = {}
+        self.errors = []
+        self.json_script = None
+        self.json_data = []
+
+    def error(self, check, message):
+        line = self.getpos()[0]
+        self.errors.append({"check": check, "line": line, "message": message})
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        element_id = attrs.get("id")
+        if element_id is not None:
+            if element_id in self.ids:
+                self.error("duplicate-id", f'id="{element_id}" が重複しています（最初は{self.ids[element_id]}行目）')
+            else:
+                self.ids[element_id] = self.getpos()[0]
+        if tag == "script" and (attrs.get("type") or "").lower() in JSON_SCRIPT_TYPES:
+            self.json_script = (attrs["type"].lower(), self.getpos()[0])
+            self.json_data = []
+        if tag not in VOID_TAGS:
+            self.stack.append((tag, self.getpos()[0]))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and self.stack and self.stack[-1][0] == tag:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self.json_script:
+            self.check_json("".join(self.json_data))
+            self.json_script = None
+        if tag in VOID_TAGS:
+            return
+        if not any(open_tag == tag for open_tag, _ in self.stack):
+            if tag not in OPTIONAL_END_TAGS:
+                self.error("tag-balance", f"対応する開始タグのない </{tag}>")
+            return
+        # 開いている同名タグまで閉じる。途中で閉じられたものは閉じ忘れ
+        while self.stack:
+            open_tag, line = self.stack.pop()
+            if open_tag == tag:
+                break
+            if open_tag not in OPTIONAL_END_TAGS:
+                self.error("tag-balance", f"<{open_tag}>（{line}行目）が </{tag}> の前に閉じられていません")
+
+    def handle_data(self, data):
+        if self.json_script:
+            self.json_data.append(data)
+
+    def check_json(self, text):
+        script_type, line = self.json_script
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            self.errors.append({"check": "json", "line": line + e.lineno - 1,
+                                "message": f"{script_type} を解析できません: {e.msg}"})
+            return
+        if script_type == "application/ld+json":
+            items = data if isinstance(data, list) else [data]
+            if not all(isinstance(item, dict) and "@context" in item for item in items):
+                self.errors.append({"check": "json", "line": line, "message": "JSON-LD に @context がありません"})
+
+    def finish(self):
+        self.close()
+        for open_tag, line in self.stack:
+            if open_tag not in OPTIONAL_END_TAGS:
+                self.errors.append({"check": "tag-balance", "line": line,
+                                    "message": f"<{open_tag}> が閉じられていません"})
+        return self.errors
+
+
+def find_placeholders(text):
+    errors = []
+    for match in PLACEHOLDER_RE.finditer(text):
+        line = text.count("\n", 0, match.start()) + 1
+        errors.append({"check": "placeholder", "line": line, "message": f"置換されていない {match.group(0)}"})
+    return errors
+
+
+def target_exists(root, loc):
+    """サイトマップのURLに対応するファイルが出力にあるか（cleanUrls の拡張子なしURLも考慮）"""
+    path = unquote(urlparse(loc).path).lstrip("/")
+    candidates = [path, path + ".html", (path + "/index.html").lstrip("/")]
+    return any((root / c).is_file() for c in candidates if c)
+
+
+def validate_sitemap(root, rel):
+    errors = []
+
+    def error(message, line=None):
+        errors.append({"check": "sitemap", "line": line, "message": message})
+
+    path = root / rel
+    if path.stat().st_size > SITEMAP_MAX_BYTES:
+        error(f"ファイルサイズが上限（{SITEMAP_MAX_BYTES:,} bytes）を超えています")
+    count = 0
+    seen = set()
+    for _, elem in ET.iterparse(path, events=("end",)):
+        if elem.tag != SITEMAP_NS + "url":
+            continue
+        count += 1
+        children = {}
+        for child in elem:
+            if child.tag.startswith(SITEMAP_NS):
+                name = child.tag[len(SITEMAP_NS):]
+                if name not in ("loc", "lastmod", "changefreq", "priority"):
+                    error(f"<url> の{count}件目に未知の要素 <{name}>")
+                elif name in children:
+                    error(f"<url> の{count}件目で <{name}> が重複しています")
+                children[name] = (child.text or "").strip()
+        loc = children.get("loc")
+        if not loc:
+            error(f"<url> の{count}件目に <loc> がありません")
+        else:
+            parsed = urlparse(loc)
+            if parsed.scheme not in ("http", "https") or not parsed.netloc or len(loc) > 2048:
+                error(f"不正な <loc>: {loc}")
+            elif parsed.netloc == SITE_HOST and not target_exists(root, loc):
+                error(f"<loc> のページが出力にありません: {loc}")
+            if loc in seen:
+                error(f"<loc> が重複しています: {loc}")
+            seen.add(loc)
+        if "lastmod" in children and not LASTMOD_RE.match(children["lastmod"]):
+            error(f"不正な <lastmod>: {children['lastmod']}（{loc}）")
+        if "changefreq" in children and children["changefreq"] not in CHANGEFREQ:
+            error(f"不正な <changefreq>: {children['changefreq']}（{loc}）")
+        if "priority" in children:
+            try:
+                valid = 0.0 <= float(children["priority"]) <= 1.0
+            except ValueError:
+                valid = False
+            if not valid:
+                error(f"不正な <priority>: {children['priority']}（{loc}）")
+        elem.clear()
+    if count > SITEMAP_MAX_URLS:
+        error(f"URLが上限（{SITEMAP_MAX_URLS}件）を超えています: {count}件")
+    return errors
+
+
+def validate_file(args):
+    root, rel = args
+    root = Path(root)
+    if rel.endswith(".xml"):
+        try:
+            first = next(ET.iterparse(root / rel, events=("start",)))[1]
+            if first.tag == SITEMAP_NS + "urlset":
+                errors = validate_sitemap(root, rel)
+            else:
+                # サイトマップ以外のXMLは整形式かどうかだけ見る
+                for _ in ET.iterparse(root / rel):
+                    pass
+                errors = []
+        except ET.ParseError as e:
+            errors = [{"check": "xml", "line": e.position[0], "message": f"XMLを解析できません: {e}"}]
+        errors += find_placeholders((root / rel).read_text(encoding="utf-8", errors="replace"))
+        return rel, errors[:MAX_ERRORS_PER_FILE]
+
+    text = (root / rel).read_text(encoding="utf-8", errors="replace")
+    parser = StructureParser()
+    parser.feed(text)
+    errors = find_placeholders(text) + parser.finish()
+    errors.sort(key=lambda e: e["line"] or 0)
+    return rel, errors[:MAX_ERRORS_PER_FILE]
+
+
+def validate_output(root=DIST_DIR, workers=None):
+    root = Path(root).resolve()
+    if not root.exists():
+        print(f"Error: {root} が見つかりません。先に build_dist.py を実行してください。")
+        return 1
+
+    files = [(str(root), p.relative_to(root).as_posix())
+             for p in sorted(root.rglob("*")) if p.suffix in (".html", ".xml") and p.is_file()]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(validate_file, files, chunksize=max(1, len(files) // ((os.cpu_count() or 1) * 4))))
+
+    failed = {rel: errors for rel, errors in results if errors}
+    counts = {}
+    for errors in failed.values():
+        for e in errors:
+            counts[e["check"]] = counts.get(e["check"], 0) + 1
+
+    report_path = Path(REPORT_FILE)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump({"files": len(results), "errors": counts, "failed": failed}, f, indent=1, ensure_ascii=False)
+
+    print(f"{len(results)}ファイルを検査しました")
+    if not failed:
+        print("構造エラーはありません")
+        return 0
+    for rel, errors in list(failed.items())[:50]:
+        print(rel)
+        for e in errors:
+            line = f"{e['line']}行目: " if e["line"] else ""
+            print(f"  [{e['check']}] {line}{e['message']}")
+    if len(failed) > 50:
+        print(f"...ほか{len(failed) - 50}ファイル（詳細は {REPORT_FILE}）")
+    print("エラー: " + ", ".join(f"{check} {n}件" for check, n in sorted(counts.items())))
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ビルド済みHTML/XMLの構造チェック")
+    parser.add_argument("root", nargs="?", default=DIST_DIR, help="ビルド済みの出力ディレクトリ")
+    parser.add_argument("--workers", type=int, help="並列プロセス数")
+    args = parser.parse_args()
+    sys.exit(validate_output(args.root, args.workers))
+
+
+if __name__ == "__main__":
+    main()